@@ -0,0 +1,85 @@
+"""Add foreign key, soft-delete partial and listing indexes
+
+Revision ID: 3f6a9c2d1b7e
+Revises: 1191d0464e85
+Create Date: 2026-10-17 09:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a9c2d1b7e"
+down_revision: Union[str, None] = "1191d0464e85"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = "is_deleted = false"
+
+# (index name, table, columns, partial index predicate)
+INDEXES = [
+    ("ix_job_application_user_id", "job_application", ["user_id"], None),
+    (
+        "ix_job_application_user_id_created_at_id",
+        "job_application",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        NOT_DELETED,
+    ),
+    (
+        "ix_job_application_user_id_status_created_at",
+        "job_application",
+        ["user_id", "application_status", sa.text("created_at DESC")],
+        NOT_DELETED,
+    ),
+    ("ix_document_user_id", "document", ["user_id"], None),
+    (
+        "ix_document_user_id_created_at_id",
+        "document",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        NOT_DELETED,
+    ),
+    ("ix_document_user_id_type", "document", ["user_id", "type"], NOT_DELETED),
+    ("ix_assistant_step_job_application_id", "assistant_step", ["job_application_id"], None),
+    ("ix_assistant_step_previous_step_id", "assistant_step", ["previous_step_id"], None),
+    (
+        "ix_assistant_step_job_application_id_step_order",
+        "assistant_step",
+        ["job_application_id", "step_order"],
+        NOT_DELETED,
+    ),
+    ("ix_user_session_user_id", "user_session", ["user_id"], None),
+    ("ix_user_session_expires_at", "user_session", ["expires_at"], None),
+    (
+        "ix_document_job_application_job_application_id",
+        "document_job_application",
+        ["job_application_id"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the indexes concurrently so existing tables stay writable while they are created.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,33 @@
+"""Add content hash and file size columns to document table
+
+Revision ID: 5d0c8b3e6a41
+Revises: c2b7f4e9a013
+Create Date: 2026-10-17 11:31:07.642519
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d0c8b3e6a41"
+down_revision: Union[str, None] = "c2b7f4e9a013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("document", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("document", sa.Column("file_size", sa.BigInteger(), nullable=True))
+    op.create_index("ix_document_content_hash", "document", ["content_hash"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_document_content_hash", table_name="document")
+    op.drop_column("document", "file_size")
+    op.drop_column("document", "content_hash")
@@ -0,0 +1,44 @@
+"""Add document status index for the parsing worker queue
+
+Revision ID: 7b42d0e6c9f1
+Revises: e1f39a7b2c58
+Create Date: 2026-10-17 13:05:18.226904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b42d0e6c9f1"
+down_revision: Union[str, None] = "e1f39a7b2c58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_document_status_created_at",
+            "document",
+            ["status", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("is_deleted = false"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_document_status_created_at",
+            table_name="document",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,47 @@
+"""Add input fingerprint column to assistant_step table
+
+Revision ID: 9e5a1f3c7d24
+Revises: 7b42d0e6c9f1
+Create Date: 2026-10-17 15:12:44.381095
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e5a1f3c7d24"
+down_revision: Union[str, None] = "7b42d0e6c9f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("assistant_step", sa.Column("input_fingerprint", sa.String(length=64), nullable=True))
+    # Build the index concurrently so assistant_step stays writable while it is created.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assistant_step_input_fingerprint",
+            "assistant_step",
+            ["input_fingerprint"],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("is_deleted = false"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_assistant_step_input_fingerprint",
+            table_name="assistant_step",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("assistant_step", "input_fingerprint")
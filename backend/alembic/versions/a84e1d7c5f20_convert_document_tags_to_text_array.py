@@ -0,0 +1,60 @@
+"""Convert document tags to a text array with a GIN index
+
+Revision ID: a84e1d7c5f20
+Revises: 3f6a9c2d1b7e
+Create Date: 2026-10-17 10:02:15.884120
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a84e1d7c5f20"
+down_revision: Union[str, None] = "3f6a9c2d1b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values are either array literals ("{a,b}") or comma separated strings ("a, b").
+    op.alter_column(
+        "document",
+        "tags",
+        existing_type=sa.String(),
+        type_=postgresql.ARRAY(sa.Text()),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE "
+            "WHEN tags IS NULL OR btrim(tags) = '' THEN NULL "
+            "WHEN btrim(tags) LIKE '{%}' THEN btrim(tags)::text[] "
+            "ELSE array_remove(regexp_split_to_array(btrim(tags), '\\s*,\\s*'), '') "
+            "END"
+        ),
+    )
+    op.create_index(
+        "ix_document_tags",
+        "document",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_document_tags", table_name="document")
+    op.alter_column(
+        "document",
+        "tags",
+        existing_type=postgresql.ARRAY(sa.Text()),
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="array_to_string(tags, ',')",
+    )
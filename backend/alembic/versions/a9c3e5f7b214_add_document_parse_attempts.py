@@ -0,0 +1,32 @@
+"""Add parse attempts column to document table
+
+Revision ID: a9c3e5f7b214
+Revises: f4a7c1d9e362
+Create Date: 2026-10-17 19:05:37.902114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e5f7b214"
+down_revision: Union[str, None] = "f4a7c1d9e362"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "document",
+        sa.Column("parse_attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("document", "parse_attempts")
@@ -0,0 +1,33 @@
+"""Add document reads column to assistant_step table
+
+Revision ID: b3d8e2a6f105
+Revises: 9e5a1f3c7d24
+Create Date: 2026-10-17 16:02:31.907716
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d8e2a6f105"
+down_revision: Union[str, None] = "9e5a1f3c7d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "assistant_step",
+        sa.Column("document_reads", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("assistant_step", "document_reads")
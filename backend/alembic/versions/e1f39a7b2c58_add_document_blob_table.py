@@ -0,0 +1,51 @@
+"""Add document blob table for content-addressed file storage
+
+Revision ID: e1f39a7b2c58
+Revises: 5d0c8b3e6a41
+Create Date: 2026-10-17 12:20:44.108365
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.models.custom_types.path_type import PathType
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f39a7b2c58"
+down_revision: Union[str, None] = "5d0c8b3e6a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "document_blob",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("file_path", PathType(), nullable=False),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("content_hash"),
+    )
+    # Existing uploads keep their own files; their blob row simply counts every document sharing the hash.
+    op.execute(
+        """
+        INSERT INTO document_blob (id, content_hash, file_path, file_size, ref_count)
+        SELECT gen_random_uuid(), content_hash, min(file_path), coalesce(max(file_size), 0), count(*)
+        FROM document
+        WHERE content_hash IS NOT NULL AND file_path IS NOT NULL
+        GROUP BY content_hash
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("document_blob")
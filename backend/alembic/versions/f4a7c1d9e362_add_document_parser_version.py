@@ -0,0 +1,30 @@
+"""Add parser version column to document table
+
+Revision ID: f4a7c1d9e362
+Revises: b3d8e2a6f105
+Create Date: 2026-10-17 18:40:12.481230
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a7c1d9e362"
+down_revision: Union[str, None] = "b3d8e2a6f105"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing content has no recorded parser version, so it is parsed again rather than reused.
+    op.add_column("document", sa.Column("parser_version", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("document", "parser_version")
@@ -0,0 +1,49 @@
+from typing import Annotated
+
+from fastapi import Cookie, Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import false, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.exceptions.base import AuthenticationError
+from ..db import get_session
+from ..models import User, UserSession
+
+# Browsers can't set headers on EventSource requests, so the session token may also come as a cookie.
+SESSION_COOKIE = "session_token"
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_bearer)],
+    session_token: Annotated[str | None, Cookie(alias=SESSION_COOKIE)] = None,
+) -> User:
+    """
+    FastAPI dependency returning the user behind the request's session token.
+
+    The token is read from an `Authorization: Bearer` header, falling back to the session cookie.
+    It must belong to an active, unexpired session of an active user; anything else is a 401.
+    """
+    token = credentials.credentials if credentials is not None else session_token
+    if not token:
+        raise AuthenticationError("Not authenticated.")
+    user = await session.scalar(
+        select(User)
+        .join(UserSession, UserSession.user_id == User.id)
+        .where(
+            UserSession.session_token == token,
+            UserSession.is_active == true(),
+            UserSession.is_deleted == false(),
+            UserSession.expires_at > func.now(),
+            User.is_active == true(),
+            User.is_deleted == false(),
+        )
+    )
+    if user is None:
+        raise AuthenticationError("Invalid or expired session.")
+    return user
+
+
+CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from .assistant import router as assistant_router
+from .documents import router as documents_router
+
+api_router = APIRouter(prefix="/api/v1")
+api_router.include_router(documents_router)
+api_router.include_router(assistant_router)
+
+__all__ = ["api_router"]
@@ -0,0 +1,47 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.exceptions.base import NotFoundError
+from ...db import get_redis, get_session, get_session_factory
+from ...models import JobApplication
+from ...services.assistant_events import load_snapshot_events, relay_events
+from ..deps import CurrentUser
+
+router = APIRouter(prefix="/job-applications", tags=["assistant"])
+
+
+@router.get("/{job_application_id}/assistant/events", response_class=StreamingResponse)
+async def stream_assistant_events(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    job_application_id: uuid.UUID,
+    user: CurrentUser,
+):
+    """
+    Stream assistant step status changes and partial step output as server-sent events.
+
+    The stream opens with the current state of every step, so clients never need to poll.
+    """
+    owner = await session.scalar(
+        select(JobApplication.user_id).where(
+            JobApplication.id == job_application_id, JobApplication.is_deleted == false()
+        )
+    )
+    if owner is None or owner != user.id:
+        raise NotFoundError("Job application")
+    # The stream can stay open for a long time; don't keep a pooled connection checked out for it.
+    await session.close()
+
+    async def snapshot():
+        async with get_session_factory()() as snapshot_session:
+            return await load_snapshot_events(snapshot_session, job_application_id)
+
+    return StreamingResponse(
+        relay_events(get_redis(), job_application_id, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
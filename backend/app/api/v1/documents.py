@@ -0,0 +1,37 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Form, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core.enums import DocumentType
+from ...core.responses import model_response
+from ...db import get_session, query_budget
+from ...schemas.document_envelope import DocumentIdResponse, DocumentRequest
+from ...schemas.document_search import DocumentSearchResponse
+from ...services.document_search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, search_documents
+from ...services.document_upload import create_documents_from_uploads
+from ..deps import CurrentUser
+
+router = APIRouter(prefix="/documents", tags=["documents"])
+
+
+@router.post("", response_model=DocumentIdResponse, status_code=status.HTTP_201_CREATED)
+async def upload_documents(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    request: Annotated[DocumentRequest, Form()],
+    user: CurrentUser,
+):
+    ids = await create_documents_from_uploads(session, user, request)
+    return model_response(DocumentIdResponse(ids=ids), status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/search", response_model=DocumentSearchResponse, dependencies=[query_budget(2)])
+async def search_user_documents(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    user: CurrentUser,
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    document_type: Annotated[DocumentType | None, Query(alias="type")] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = DEFAULT_SEARCH_LIMIT,
+):
+    results = await search_documents(session, user.id, q, document_type=document_type, limit=limit)
+    return model_response(DocumentSearchResponse(query=q, results=results))
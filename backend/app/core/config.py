@@ -1,4 +1,6 @@
 import json
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List
 
 from pydantic import EmailStr
@@ -23,6 +25,67 @@ class Settings(BaseSettings):
     debug: bool = True
     secret_key: str = "your_secret_key"
 
+    # Database connection pool settings
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800  # seconds
+    db_statement_cache_size: int = 100
+    db_echo: bool = False
+    db_query_budget_enforced: bool = False  # raise instead of logging when a budget is exceeded (tests)
+
+    # File storage settings
+    storage_root: Path = Path("storage")
+    upload_chunk_size: int = 1024 * 1024  # 1 MiB
+    upload_max_file_size: int = 25 * 1024 * 1024  # 25 MiB
+
+    # Document parsing worker settings
+    document_parser_enabled: bool = False
+    document_parser_concurrency: int | None = None  # defaults to one document per extraction process
+    document_parser_poll_interval: float = 2.0  # seconds
+    document_parser_max_attempts: int = 3
+    document_parser_stale_after: int = 600  # seconds
+    document_parser_max_claims: int = 3  # claims before a document stuck in processing is marked ERROR
+    document_parser_processes: int | None = None  # defaults to the number of CPUs
+    document_parser_max_tasks_per_child: int = 50
+    document_parser_timeout: float = 120.0  # seconds per file
+
+    # Parse result cache settings
+    parse_cache_max_entries: int = 1024  # in-process LRU tier
+    parse_cache_redis_enabled: bool = True
+    parse_cache_ttl: int = 7 * 24 * 3600  # seconds, Redis tier
+
+    # LLM gateway settings (any OpenAI-compatible completions API)
+    llm_base_url: str = "https://api.openai.com/v1"
+    llm_api_key: str = ""
+    llm_model: str = "gpt-3.5-turbo-instruct"
+    llm_timeout: float = 60.0  # seconds
+    llm_max_retries: int = 3
+    llm_max_concurrency: int = 8  # provider calls in flight per process
+    llm_user_concurrency: int = 2  # requests in flight per user
+    llm_user_rate_limit: int = 30  # requests per minute per user
+    llm_user_burst: int = 10
+    llm_global_rate_limit: int = 600  # requests per minute per process
+    llm_global_burst: int = 50
+    llm_batch_size: int = 8
+    llm_batch_window: float = 0.05  # seconds
+
+    # Embedding settings
+    embedding_enabled: bool = False  # loads the model at startup
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"  # or "hashing"
+    embedding_dimension: int = 384  # hashing model only
+    embedding_chunk_max_tokens: int = 256
+    embedding_chunk_min_tokens: int = 32
+    embedding_max_batch_tokens: int = 8192  # padded tokens per model batch
+    embedding_max_batch_size: int = 64
+    embedding_batch_window: float = 0.02  # seconds
+    embedding_cache_max_entries: int = 16384  # in-process LRU tier
+    embedding_cache_redis_enabled: bool = True
+    embedding_cache_ttl: int = 30 * 24 * 3600  # seconds, Redis tier
+    embedding_index_half_precision: bool = True
+    embedding_index_probes: int = 8  # IVF lists searched in approximate mode
+
     # Logging settings
     log_level: str = "INFO"
     log_format: str = (
@@ -70,3 +133,11 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the cached application settings instance.
+    """
+    return Settings()
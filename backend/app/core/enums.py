@@ -57,6 +57,16 @@ class AssistantStepType(str, enum.Enum):
     FINAL_CHECKLIST = "final_checklist"
 
 
+class AssistantEventType(str, enum.Enum):
+    """
+    Enum representing the kinds of assistant progress events pushed to clients.
+    """
+
+    STEP_STATUS = "step_status"
+    STEP_OUTPUT = "step_output"
+    APPLICATION_STATUS = "application_status"
+
+
 class DocumentType(str, enum.Enum):
     """
     Enum representing different types of documents.
@@ -224,3 +234,24 @@ class SSOProvider(str, enum.Enum):
     DISCORD = "discord"
     APPLE = "apple"
     CUSTOM = "custom"
+
+
+class PassageKind(str, enum.Enum):
+    """Enum representing the part of a document an embedded passage was taken from."""
+
+    SUMMARY = "summary"
+    SKILL = "skill"
+    EXPERIENCE_BULLET = "experience_bullet"
+    EDUCATION = "education"
+    CERTIFICATION = "certification"
+    RESPONSIBILITY = "responsibility"
+    REQUIRED_QUALIFICATION = "required_qualification"
+    PREFERRED_QUALIFICATION = "preferred_qualification"
+    TEXT = "text"
+
+
+class VectorSearchMode(str, enum.Enum):
+    """Enum representing how a vector index is searched."""
+
+    EXACT = "exact"
+    APPROXIMATE = "approximate"
@@ -52,6 +52,13 @@ class DatabaseError(AppBaseException):
         super().__init__(message)
 
 
+class QueryBudgetExceededError(DatabaseError):
+    """Raised when a unit of work runs more database queries than its budget allows."""
+
+    def __init__(self, label: str = "Operation", count: int = 0, budget: int = 0):
+        super().__init__(f"{label} ran {count} queries, over its budget of {budget}.")
+
+
 class DuplicateResourceError(AppBaseException):
     """Raised when attempting to create a resource that already exists."""
 
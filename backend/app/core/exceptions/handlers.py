@@ -0,0 +1,49 @@
+"""
+HTTP exception handlers for the application's custom exceptions.
+
+Map each custom exception type to the HTTP status code returned to API clients.
+"""
+
+from fastapi import FastAPI, Request, status
+
+from ..responses import ORJSONResponse
+from .base import (
+    AppBaseException,
+    AuthenticationError,
+    BusinessRuleViolationError,
+    DuplicateResourceError,
+    ExternalServiceError,
+    NotFoundError,
+    PermissionDeniedError,
+    RateLimitExceededError,
+    ValidationError,
+)
+
+STATUS_CODES: dict[type[AppBaseException], int] = {
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    PermissionDeniedError: status.HTTP_403_FORBIDDEN,
+    AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+    DuplicateResourceError: status.HTTP_409_CONFLICT,
+    BusinessRuleViolationError: status.HTTP_409_CONFLICT,
+    RateLimitExceededError: status.HTTP_429_TOO_MANY_REQUESTS,
+    ExternalServiceError: status.HTTP_502_BAD_GATEWAY,
+}
+
+
+async def app_exception_handler(request: Request, exc: AppBaseException) -> ORJSONResponse:
+    """
+    Convert a custom exception into a JSON error response.
+    """
+    status_code = next(
+        (code for exc_type, code in STATUS_CODES.items() if isinstance(exc, exc_type)),
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+    return ORJSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the custom exception handlers on the FastAPI application.
+    """
+    app.add_exception_handler(AppBaseException, app_exception_handler)
@@ -0,0 +1,94 @@
+"""
+JSON response classes and the serializers behind them.
+
+`ORJSONResponse` is the application's default response class and renders plain payloads,
+such as error details, with orjson. Endpoints that return response schemas should wrap them
+with `model_response` or `list_response`. The schema is then written to JSON bytes by
+pydantic-core in one step, skipping FastAPI's re-validation of the returned model against
+the route's `response_model` and the intermediate dict. Keep `response_model` on the route so
+the OpenAPI schema still describes the response.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Sequence
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson; pydantic models are rendered by pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return dump_model(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class PydanticResponse(Response):
+    """
+    JSON response holding bytes that were already serialized from a schema.
+    """
+
+    media_type = "application/json"
+
+
+def dump_model(model: BaseModel, *, exclude_none: bool = False) -> bytes:
+    """
+    Serialize a schema to JSON bytes using its field aliases.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=True, exclude_none=exclude_none)
+
+
+@lru_cache(maxsize=128)
+def _list_adapter(model_type: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_type])
+
+
+def dump_models(
+    models: Sequence[BaseModel], model_type: type[BaseModel], *, exclude_none: bool = False
+) -> bytes:
+    """
+    Serialize a list of schemas of one type to a JSON array in a single pydantic-core call.
+    """
+    return _list_adapter(model_type).dump_json(list(models), by_alias=True, exclude_none=exclude_none)
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    exclude_none: bool = False,
+    headers: dict[str, str] | None = None,
+    background: BackgroundTask | None = None,
+) -> PydanticResponse:
+    """
+    Return a response rendering a schema straight to JSON.
+    """
+    return PydanticResponse(
+        dump_model(model, exclude_none=exclude_none),
+        status_code=status_code,
+        headers=headers,
+        background=background,
+    )
+
+
+def list_response(
+    models: Sequence[BaseModel],
+    model_type: type[BaseModel],
+    *,
+    status_code: int = 200,
+    exclude_none: bool = False,
+    headers: dict[str, str] | None = None,
+) -> PydanticResponse:
+    """
+    Return a response rendering a list of schemas straight to a JSON array.
+    """
+    return PydanticResponse(
+        dump_models(models, model_type, exclude_none=exclude_none), status_code=status_code, headers=headers
+    )
@@ -0,0 +1,47 @@
+from .assistant_step import list_assistant_step_infos, list_assistant_steps
+from .document import filter_by_tags, list_document_infos, list_documents
+from .job_application import (
+    JOB_APPLICATIONS,
+    import_job_applications,
+    list_job_application_dashboard,
+    list_job_application_infos,
+    list_job_applications,
+)
+from .loading import (
+    ASSISTANT_STEP_WITH_JOB_APPLICATION,
+    DOCUMENT_WITH_JOB_APPLICATIONS,
+    JOB_APPLICATION_DASHBOARD,
+    USER_WITH_JOB_APPLICATIONS,
+    LoaderOptions,
+)
+from .pagination import Page, apply_keyset, clamp_page_size, paginate, paginate_projection
+from .projection import ASSISTANT_STEP_INFO, DOCUMENT_INFO, JOB_APPLICATION_INFO, Projection
+from .repository import Repository
+
+__all__ = [
+    "Page",
+    "apply_keyset",
+    "clamp_page_size",
+    "paginate",
+    "paginate_projection",
+    "Projection",
+    "Repository",
+    "JOB_APPLICATIONS",
+    "LoaderOptions",
+    "ASSISTANT_STEP_WITH_JOB_APPLICATION",
+    "DOCUMENT_WITH_JOB_APPLICATIONS",
+    "JOB_APPLICATION_DASHBOARD",
+    "USER_WITH_JOB_APPLICATIONS",
+    "ASSISTANT_STEP_INFO",
+    "DOCUMENT_INFO",
+    "JOB_APPLICATION_INFO",
+    "filter_by_tags",
+    "import_job_applications",
+    "list_assistant_step_infos",
+    "list_assistant_steps",
+    "list_document_infos",
+    "list_documents",
+    "list_job_application_dashboard",
+    "list_job_application_infos",
+    "list_job_applications",
+]
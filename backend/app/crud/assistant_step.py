@@ -0,0 +1,53 @@
+import uuid
+
+from sqlalchemy import Select, false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import AssistantStep, JobApplication
+from ..schemas.assistant_step import AssistantStepInfo
+from .pagination import Page, paginate, paginate_projection
+from .projection import ASSISTANT_STEP_INFO
+
+
+def _filter_assistant_steps(
+    stmt: Select, user_id: uuid.UUID, job_application_id: uuid.UUID | None = None
+) -> Select:
+    stmt = stmt.join(JobApplication, AssistantStep.job_application_id == JobApplication.id).where(
+        JobApplication.user_id == user_id,
+        AssistantStep.is_deleted == false(),
+    )
+    if job_application_id is not None:
+        stmt = stmt.where(AssistantStep.job_application_id == job_application_id)
+    return stmt
+
+
+async def list_assistant_steps(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    job_application_id: uuid.UUID | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[AssistantStep]:
+    """
+    List a user's assistant steps newest first, optionally for a single job application.
+    """
+    stmt = _filter_assistant_steps(select(AssistantStep), user_id, job_application_id)
+    return await paginate(session, stmt, AssistantStep, cursor=cursor, limit=limit)
+
+
+async def list_assistant_step_infos(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    job_application_id: uuid.UUID | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[AssistantStepInfo]:
+    """
+    Like `list_assistant_steps`, but selects only the response columns and returns schemas.
+    """
+    stmt = _filter_assistant_steps(ASSISTANT_STEP_INFO.select(), user_id, job_application_id)
+    return await paginate_projection(
+        session, stmt, AssistantStep, ASSISTANT_STEP_INFO, cursor=cursor, limit=limit
+    )
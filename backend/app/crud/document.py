@@ -0,0 +1,81 @@
+import uuid
+from typing import Iterable
+
+from sqlalchemy import Select, false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import DocumentType
+from ..models import Document
+from ..schemas.document_envelope import DocumentInfo
+from ..utils.string_formatters import normalize_tags
+from .pagination import Page, paginate, paginate_projection
+from .projection import DOCUMENT_INFO
+
+
+def filter_by_tags(
+    stmt: Select,
+    tags_any: Iterable[str] | None = None,
+    tags_all: Iterable[str] | None = None,
+) -> Select:
+    """
+    Restrict a document select to rows carrying any and/or all of the given tags.
+
+    Both filters compile to array operators (`&&` and `@>`) served by the GIN index on `tags`.
+    """
+    tags_any = normalize_tags(tags_any)
+    tags_all = normalize_tags(tags_all)
+    if tags_any:
+        stmt = stmt.where(Document.tags.overlap(tags_any))
+    if tags_all:
+        stmt = stmt.where(Document.tags.contains(tags_all))
+    return stmt
+
+
+def _filter_documents(
+    stmt: Select,
+    user_id: uuid.UUID,
+    document_type: DocumentType | None = None,
+    tags_any: Iterable[str] | None = None,
+    tags_all: Iterable[str] | None = None,
+) -> Select:
+    stmt = stmt.where(
+        Document.user_id == user_id,
+        Document.is_deleted == false(),
+    )
+    if document_type is not None:
+        stmt = stmt.where(Document.type == document_type)
+    return filter_by_tags(stmt, tags_any=tags_any, tags_all=tags_all)
+
+
+async def list_documents(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    document_type: DocumentType | None = None,
+    tags_any: Iterable[str] | None = None,
+    tags_all: Iterable[str] | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[Document]:
+    """
+    List a user's documents newest first, one keyset page at a time.
+    """
+    stmt = _filter_documents(select(Document), user_id, document_type, tags_any, tags_all)
+    return await paginate(session, stmt, Document, cursor=cursor, limit=limit)
+
+
+async def list_document_infos(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    document_type: DocumentType | None = None,
+    tags_any: Iterable[str] | None = None,
+    tags_all: Iterable[str] | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[DocumentInfo]:
+    """
+    Like `list_documents`, but selects only the response columns and returns schemas.
+    """
+    stmt = _filter_documents(DOCUMENT_INFO.select(), user_id, document_type, tags_any, tags_all)
+    return await paginate_projection(session, stmt, Document, DOCUMENT_INFO, cursor=cursor, limit=limit)
@@ -0,0 +1,93 @@
+import uuid
+from typing import Any, List, Mapping, Sequence
+
+from sqlalchemy import Select, false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import JobApplicationStatus
+from ..models import JobApplication
+from ..schemas.job_application import JobApplicationInfo
+from .loading import JOB_APPLICATION_DASHBOARD
+from .pagination import Page, paginate, paginate_projection
+from .projection import JOB_APPLICATION_INFO
+from .repository import Repository
+
+JOB_APPLICATIONS = Repository(JobApplication)
+
+
+def _filter_job_applications(
+    stmt: Select, user_id: uuid.UUID, status: JobApplicationStatus | None = None
+) -> Select:
+    stmt = stmt.where(
+        JobApplication.user_id == user_id,
+        JobApplication.is_deleted == false(),
+    )
+    if status is not None:
+        stmt = stmt.where(JobApplication.application_status == status)
+    return stmt
+
+
+async def list_job_applications(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    status: JobApplicationStatus | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[JobApplication]:
+    """
+    List a user's job applications newest first, one keyset page at a time.
+    """
+    stmt = _filter_job_applications(select(JobApplication), user_id, status)
+    return await paginate(session, stmt, JobApplication, cursor=cursor, limit=limit)
+
+
+async def list_job_application_infos(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    status: JobApplicationStatus | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[JobApplicationInfo]:
+    """
+    Like `list_job_applications`, but selects only the response columns and returns schemas.
+    """
+    stmt = _filter_job_applications(JOB_APPLICATION_INFO.select(), user_id, status)
+    return await paginate_projection(
+        session, stmt, JobApplication, JOB_APPLICATION_INFO, cursor=cursor, limit=limit
+    )
+
+
+async def list_job_application_dashboard(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    status: JobApplicationStatus | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[JobApplication]:
+    """
+    List a user's job applications with their assistant steps and documents loaded.
+
+    Takes three queries whatever the page size; see `JOB_APPLICATION_DASHBOARD`.
+    """
+    stmt = _filter_job_applications(
+        select(JobApplication).options(*JOB_APPLICATION_DASHBOARD), user_id, status
+    )
+    return await paginate(session, stmt, JobApplication, cursor=cursor, limit=limit)
+
+
+async def import_job_applications(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    applications: Sequence[Mapping[str, Any]],
+) -> List[JobApplication]:
+    """
+    Create job applications for a user from rows of column values, e.g. a spreadsheet import.
+
+    Rows are inserted in bulk, a thousand per statement, rather than one round trip each.
+    """
+    return await JOB_APPLICATIONS.bulk_insert(
+        session, [{**application, "user_id": user_id} for application in applications]
+    )
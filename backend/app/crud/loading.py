@@ -0,0 +1,41 @@
+from typing import Tuple
+
+from sqlalchemy import false
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+from ..models import AssistantStep, Document, JobApplication, User
+
+# Loader option sets, one per use case. Every set ends in `raiseload("*")`: a relationship the
+# use case didn't declare raises on access instead of quietly issuing one query per row, which
+# under asyncio would fail with MissingGreenlet anyway. Collections use `selectinload`, one
+# extra `IN` query per collection however many parents the page holds; many-to-one references
+# use `joinedload`, which adds no queries at all. Soft-deleted children are filtered in SQL.
+LoaderOptions = Tuple[ExecutableOption, ...]
+
+# Job applications with their steps and linked documents: three queries for any page size.
+JOB_APPLICATION_DASHBOARD: LoaderOptions = (
+    selectinload(JobApplication.assistant_steps.and_(AssistantStep.is_deleted == false())).raiseload("*"),
+    selectinload(JobApplication.documents.and_(Document.is_deleted == false())).raiseload("*"),
+    raiseload("*"),
+)
+
+# Assistant steps with the job application they belong to, in the same query.
+ASSISTANT_STEP_WITH_JOB_APPLICATION: LoaderOptions = (
+    joinedload(AssistantStep.job_application, innerjoin=True).raiseload("*"),
+    raiseload("*"),
+)
+
+# Documents with the job applications they are linked to.
+DOCUMENT_WITH_JOB_APPLICATIONS: LoaderOptions = (
+    selectinload(Document.job_applications.and_(JobApplication.is_deleted == false())).raiseload("*"),
+    raiseload("*"),
+)
+
+# A user with their job applications, each with its steps and documents.
+USER_WITH_JOB_APPLICATIONS: LoaderOptions = (
+    selectinload(User.job_applications.and_(JobApplication.is_deleted == false())).options(
+        *JOB_APPLICATION_DASHBOARD
+    ),
+    raiseload("*"),
+)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, List, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageInfo
+from ..utils.cursor import decode_cursor, encode_cursor
+
+if TYPE_CHECKING:
+    from .projection import Projection
+
+T = TypeVar("T")
+
+# Labels of the keyset columns appended to projected selects.
+CURSOR_CREATED_AT = "_cursor_created_at"
+CURSOR_ID = "_cursor_id"
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    A single page of keyset-paginated results.
+    """
+
+    items: List[T]
+    next_cursor: str | None
+    has_more: bool
+    limit: int
+
+    @property
+    def page_info(self) -> PageInfo:
+        """
+        Pagination metadata for the response schema.
+        """
+        return PageInfo(next_cursor=self.next_cursor, has_more=self.has_more, limit=self.limit)
+
+
+def clamp_page_size(limit: int | None) -> int:
+    """
+    Clamp a requested page size to the allowed range.
+    """
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def apply_keyset(stmt: Select, model: Any, cursor: str | None, limit: int) -> Select:
+    """
+    Order a statement newest first on (created_at, id) and seek past the given cursor.
+
+    One extra row is fetched so the caller can tell whether another page exists without a COUNT.
+    """
+    if cursor is not None:
+        created_at, id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(created_at, id))
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    model: Any,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page:
+    """
+    Execute a keyset-paginated select of `model` rows and return a single page.
+    """
+    limit = clamp_page_size(limit)
+    result = await session.scalars(apply_keyset(stmt, model, cursor, limit))
+    items = list(result.all())
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if has_more else None
+    return Page(items=items, next_cursor=next_cursor, has_more=has_more, limit=limit)
+
+
+async def paginate_projection(
+    session: AsyncSession,
+    stmt: Select,
+    model: Any,
+    projection: "Projection[T]",
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[T]:
+    """
+    Execute a keyset-paginated projected select and return a page of schemas.
+
+    `stmt` selects the projection's columns; the keyset columns of `model` are added to it so the
+    next cursor can be built from plain row values, without loading ORM instances.
+    """
+    limit = clamp_page_size(limit)
+    stmt = stmt.add_columns(model.created_at.label(CURSOR_CREATED_AT), model.id.label(CURSOR_ID))
+    result = await session.execute(apply_keyset(stmt, model, cursor, limit))
+    rows = list(result.all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(last[CURSOR_CREATED_AT], last[CURSOR_ID])
+    return Page(items=projection.build_all(rows), next_cursor=next_cursor, has_more=has_more, limit=limit)
@@ -0,0 +1,117 @@
+from typing import Any, Callable, Generic, Iterable, List, Mapping, TypeVar
+
+from pydantic import BaseModel, HttpUrl
+from sqlalchemy import ColumnElement, Row, Select, String, select, type_coerce
+
+from ..models import AssistantStep, Document, JobApplication
+from ..schemas.assistant_step import AssistantStepInfo
+from ..schemas.document_envelope import DocumentInfo
+from ..schemas.job_application import JobApplicationInfo
+
+S = TypeVar("S", bound=BaseModel)
+
+
+class Projection(Generic[S]):
+    """
+    Maps selected columns straight onto a schema, without loading ORM instances.
+
+    `columns` maps each schema field to the SQL expression selected for it. Rows are turned
+    into schemas with `model_construct`, which skips validation: the values come from typed
+    columns already, so only fields whose Python type differs from the column's need an entry
+    in `converters`. No identity map, relationship loading or attribute instrumentation is
+    involved, which makes projections the cheap path for read-only listings.
+    """
+
+    def __init__(
+        self,
+        schema: type[S],
+        columns: Mapping[str, ColumnElement],
+        converters: Mapping[str, Callable[[Any], Any]] | None = None,
+    ):
+        unknown = set(columns) - set(schema.model_fields)
+        if unknown:
+            raise ValueError(f"{schema.__name__} has no fields {sorted(unknown)}.")
+        self.schema = schema
+        self.columns = dict(columns)
+        self.converters = dict(converters or {})
+
+    def select(self) -> Select:
+        """
+        Return a select of the projected columns, labelled with the schema's field names.
+        """
+        return select(*(expression.label(name) for name, expression in self.columns.items()))
+
+    def build(self, row: Row) -> S:
+        """
+        Build a schema from a row of the projected select.
+        """
+        values = row._mapping
+        fields = {name: values[name] for name in self.columns}
+        for name, convert in self.converters.items():
+            if fields[name] is not None:
+                fields[name] = convert(fields[name])
+        return self.schema.model_construct(**fields)
+
+    def build_all(self, rows: Iterable[Row]) -> List[S]:
+        """
+        Build a schema from every row.
+        """
+        return [self.build(row) for row in rows]
+
+
+JOB_APPLICATION_INFO = Projection(
+    JobApplicationInfo,
+    {
+        "id": JobApplication.id,
+        "user_id": JobApplication.user_id,
+        "job_title": JobApplication.title,
+        "company_name": JobApplication.company_name,
+        "job_location": JobApplication.location,
+        "job_posting_url": JobApplication.posting_url,
+        "notes": JobApplication.notes,
+        "job_application_status": JobApplication.application_status,
+        "job_type": JobApplication.type,
+    },
+    converters={"job_posting_url": HttpUrl},
+)
+
+DOCUMENT_INFO = Projection(
+    DocumentInfo,
+    {
+        "id": Document.id,
+        "user_id": Document.user_id,
+        "title": Document.title,
+        "description": Document.description,
+        "raw_content": Document.content,
+        # Read as the stored string: serializing it needs no Path object in between.
+        "file_path": type_coerce(Document.file_path, String),
+        "content_hash": Document.content_hash,
+        "file_size": Document.file_size,
+        "type": Document.type,
+        "mime_type": Document.mime_type,
+        "file_type": Document.file_type,
+        "status": Document.status,
+        "visibility": Document.visibility,
+        "source": Document.source,
+        "version": Document.version,
+        "tags": Document.tags,
+        "created_at": Document.created_at,
+        "updated_at": Document.updated_at,
+    },
+)
+
+ASSISTANT_STEP_INFO = Projection(
+    AssistantStepInfo,
+    {
+        "id": AssistantStep.id,
+        "job_application_id": AssistantStep.job_application_id,
+        "step_name": AssistantStep.step_name,
+        "step_status": AssistantStep.step_status,
+        "step_order": AssistantStep.step_order,
+        "previous_step_id": AssistantStep.previous_step_id,
+        "input_context": AssistantStep.input_context,
+        "result": AssistantStep.result,
+        "created_at": AssistantStep.created_at,
+        "updated_at": AssistantStep.updated_at,
+    },
+)
@@ -0,0 +1,176 @@
+import uuid
+from typing import Any, AsyncIterator, Generic, Iterable, List, Mapping, Sequence, TypeVar
+
+from sqlalchemy import Select, false, func, insert, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.exceptions.base import ConfigurationError, ValidationError
+from ..models.base_model import BaseModel
+from ..models.mixins import SoftDeleteMixin, TimestampMixin
+
+M = TypeVar("M", bound=BaseModel)
+
+# PostgreSQL's wire protocol caps a statement at 32767 bind parameters.
+MAX_BIND_PARAMETERS = 32767
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _batches(rows: Sequence[Mapping[str, Any]], max_rows: int) -> Iterable[List[Mapping[str, Any]]]:
+    # Consecutive rows with the same keys, at most `max_rows` at a time and never more bind
+    # parameters than PostgreSQL accepts: a multi-row VALUES clause needs uniform rows.
+    batch: List[Mapping[str, Any]] = []
+    keys: frozenset[str] | None = None
+    for row in rows:
+        row_keys = frozenset(row)
+        limit = max(1, min(max_rows, MAX_BIND_PARAMETERS // max(1, len(row_keys))))
+        if batch and (row_keys != keys or len(batch) >= limit):
+            yield batch
+            batch = []
+        batch.append(row)
+        keys = row_keys
+    if batch:
+        yield batch
+
+
+class Repository(Generic[M]):
+    """
+    Set-based async CRUD for a model.
+
+    Writes go out as one statement per batch of rows rather than one per object: inserts and
+    upserts are multi-row `INSERT ... VALUES` statements with `RETURNING`, and soft deletes and
+    restores are single `UPDATE`s. None of the methods flush or commit; callers own the
+    transaction as usual.
+    """
+
+    def __init__(self, model: type[M]):
+        self.model = model
+
+    @property
+    def soft_deletes(self) -> bool:
+        return issubclass(self.model, SoftDeleteMixin)
+
+    def _require_soft_delete(self) -> None:
+        if not self.soft_deletes:
+            raise ConfigurationError(f"{self.model.__name__} does not support soft deletion.")
+
+    def _columns(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        columns = set(self.model.__table__.columns.keys())
+        unknown = {key for row in rows for key in row} - columns
+        if unknown:
+            raise ValidationError(f"{self.model.__name__} has no columns {sorted(unknown)}.")
+
+    async def get_many(self, session: AsyncSession, ids: Iterable[uuid.UUID]) -> List[M]:
+        """
+        Return the rows with the given ids, in no particular order.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        return list((await session.scalars(select(self.model).where(self.model.id.in_(ids)))).all())
+
+    async def bulk_insert(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[M]:
+        """
+        Insert rows of column values and return the inserted models.
+
+        Column defaults such as generated ids apply to every row. Rows are sent
+        `chunk_size` at a time, so 500 rows take one round trip rather than 500.
+        """
+        self._columns(rows)
+        inserted: List[M] = []
+        for batch in _batches(rows, chunk_size):
+            stmt = insert(self.model).values(batch).returning(self.model)
+            inserted.extend((await session.scalars(stmt)).all())
+        return inserted
+
+    async def upsert(
+        self,
+        session: AsyncSession,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[M]:
+        """
+        Insert rows, updating the existing row instead wherever one conflicts.
+
+        `conflict_columns` must match a unique index. On conflict, `update_columns` (by default
+        every column given except the conflict columns) take the incoming values and
+        `updated_at` is bumped; with no columns to update, conflicting rows are left alone and
+        are not returned.
+        """
+        self._columns(rows)
+        upserted: List[M] = []
+        for batch in _batches(rows, chunk_size):
+            stmt = pg_insert(self.model).values(batch)
+            columns = update_columns
+            if columns is None:
+                columns = [key for key in batch[0] if key not in conflict_columns]
+            if columns:
+                values = {column: stmt.excluded[column] for column in columns}
+                if issubclass(self.model, TimestampMixin):
+                    values.setdefault("updated_at", func.now())
+                stmt = stmt.on_conflict_do_update(index_elements=list(conflict_columns), set_=values)
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+            # Refresh models already in the identity map with the values just written.
+            stmt = stmt.returning(self.model).execution_options(populate_existing=True)
+            upserted.extend((await session.scalars(stmt)).all())
+        return upserted
+
+    async def soft_delete(self, session: AsyncSession, ids: Iterable[uuid.UUID]) -> int:
+        """
+        Mark the rows with the given ids as deleted in one UPDATE and return how many changed.
+        """
+        self._require_soft_delete()
+        return await self._set_deleted(session, ids, deleted=True)
+
+    async def restore(self, session: AsyncSession, ids: Iterable[uuid.UUID]) -> int:
+        """
+        Restore soft-deleted rows with the given ids in one UPDATE and return how many changed.
+        """
+        self._require_soft_delete()
+        return await self._set_deleted(session, ids, deleted=False)
+
+    async def _set_deleted(self, session: AsyncSession, ids: Iterable[uuid.UUID], deleted: bool) -> int:
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+        model: Any = self.model
+        stmt = (
+            update(model)
+            .where(model.id.in_(ids), model.is_deleted == (false() if deleted else true()))
+            .values(is_deleted=deleted, deleted_at=func.now() if deleted else None)
+            # Models already loaded in the session get the new values without a SELECT.
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await session.execute(stmt)
+        return result.rowcount
+
+    async def iter_chunks(
+        self,
+        session: AsyncSession,
+        stmt: Select | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[List[M]]:
+        """
+        Stream the models a select returns, `chunk_size` at a time, over a server-side cursor.
+
+        Memory stays bounded by one chunk however large the scan, as long as the caller lets go of
+        earlier chunks: the session only holds loaded models weakly.
+        """
+        stmt = select(self.model) if stmt is None else stmt
+        result = await session.stream_scalars(stmt.execution_options(yield_per=chunk_size))
+        try:
+            async for chunk in result.partitions():
+                yield list(chunk)
+        finally:
+            await result.close()
@@ -0,0 +1,38 @@
+from .pool import InstrumentedAsyncQueuePool, PoolMetrics, pool_metrics
+from .query_counter import QueryCounter, count_queries, install_query_counter, query_budget
+from .redis import close_redis, create_redis, get_redis, init_redis
+from .session import (
+    build_database_url,
+    create_engine,
+    dispose_engine,
+    get_engine,
+    get_pool_status,
+    get_session,
+    get_session_factory,
+    init_engine,
+)
+from .soft_delete import INCLUDE_DELETED, SoftDeleteSession
+
+__all__ = [
+    "InstrumentedAsyncQueuePool",
+    "PoolMetrics",
+    "pool_metrics",
+    "QueryCounter",
+    "count_queries",
+    "install_query_counter",
+    "query_budget",
+    "close_redis",
+    "create_redis",
+    "get_redis",
+    "init_redis",
+    "INCLUDE_DELETED",
+    "SoftDeleteSession",
+    "build_database_url",
+    "create_engine",
+    "dispose_engine",
+    "get_engine",
+    "get_pool_status",
+    "get_session",
+    "get_session_factory",
+    "init_engine",
+]
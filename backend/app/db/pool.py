@@ -0,0 +1,76 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Accumulated connection pool checkout statistics.
+    """
+
+    checkouts: int = 0
+    failures: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, wait_seconds: float, failed: bool = False) -> None:
+        """
+        Record a single checkout attempt and how long it waited for a connection.
+        """
+        with self._lock:
+            if failed:
+                self.failures += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+        with self._lock:
+            self.checkouts = 0
+            self.failures = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        """
+        Return a point-in-time copy of the metrics suitable for JSON output.
+        """
+        with self._lock:
+            attempts = self.checkouts + self.failures
+            return {
+                "checkouts": self.checkouts,
+                "failures": self.failures,
+                "total_wait_seconds": round(self.total_wait_seconds, 6),
+                "avg_wait_seconds": round(self.total_wait_seconds / attempts, 6) if attempts else 0.0,
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that measures how long each checkout waits for a connection.
+
+    The wait covers both queue contention and opening new overflow connections, which is
+    exactly the latency a request pays before it can run its first statement.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except Exception:
+            pool_metrics.record(time.perf_counter() - start, failed=True)
+            raise
+        pool_metrics.record(time.perf_counter() - start)
+        return entry
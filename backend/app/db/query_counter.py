@@ -0,0 +1,95 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List
+
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..core.config import get_settings
+from ..core.exceptions.base import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryCounter:
+    """
+    Statements executed inside a `count_queries` block.
+    """
+
+    label: str = "Operation"
+    budget: int | None = None
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def exceeded(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+
+_current_counter: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+def _record_statement(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.statements.append(statement)
+
+
+def install_query_counter(engine: AsyncEngine | Engine) -> None:
+    """
+    Count the statements an engine executes towards the active `count_queries` block, if any.
+
+    The listener costs one context variable lookup per statement when no block is active.
+    Statements run through SQLAlchemy's greenlet bridge still see the caller's context.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _record_statement):
+        event.listen(sync_engine, "before_cursor_execute", _record_statement)
+
+
+@contextmanager
+def count_queries(
+    budget: int | None = None, *, label: str = "Operation", enforce: bool = True
+) -> Iterator[QueryCounter]:
+    """
+    Count the queries run in the current context and check them against a budget.
+
+    Going over the budget raises `QueryBudgetExceededError` when `enforce` is set and logs a
+    warning otherwise. Blocks may nest; statements count towards the innermost block only.
+    """
+    counter = QueryCounter(label=label, budget=budget)
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+    if counter.exceeded:
+        if enforce:
+            raise QueryBudgetExceededError(label, counter.count, budget)
+        logger.warning("%s ran %d queries, over its budget of %d", label, counter.count, budget)
+
+
+def query_budget(budget: int) -> Any:
+    """
+    Route dependency limiting the number of queries an endpoint may run.
+
+    Use as `dependencies=[query_budget(3)]`. With `db_query_budget_enforced` set, as in tests,
+    an endpoint going over its budget fails with `QueryBudgetExceededError`; otherwise the
+    overrun is logged, so N+1 regressions show up without breaking production requests.
+    """
+
+    async def dependency(request: Request):
+        label = f"{request.method} {request.url.path}"
+        with count_queries(budget, label=label, enforce=get_settings().db_query_budget_enforced):
+            yield
+
+    # Function scope closes the block when the endpoint returns, before the response is sent.
+    return Depends(dependency, scope="function")
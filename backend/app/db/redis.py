@@ -0,0 +1,49 @@
+from redis.asyncio import Redis
+
+from ..core.config import Settings, get_settings
+from ..core.exceptions.base import ConfigurationError
+
+_redis: Redis | None = None
+
+
+def create_redis(settings: Settings | None = None) -> Redis:
+    """
+    Create a Redis client configured from the application settings.
+
+    Connections are opened lazily from the client's pool, so creating it never blocks.
+    """
+    settings = settings or get_settings()
+    return Redis.from_url(
+        settings.redis_url,
+        password=settings.redis_password or None,
+        db=settings.redis_db,
+    )
+
+
+def init_redis(settings: Settings | None = None) -> Redis:
+    """
+    Create the shared Redis client if it does not exist yet.
+    """
+    global _redis
+    if _redis is None:
+        _redis = create_redis(settings)
+    return _redis
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client and its connection pool.
+    """
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+    _redis = None
+
+
+def get_redis() -> Redis:
+    """
+    Return the shared Redis client, raising if the application has not initialized it.
+    """
+    if _redis is None:
+        raise ConfigurationError("Redis client is not initialized.")
+    return _redis
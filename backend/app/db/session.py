@@ -0,0 +1,113 @@
+from typing import AsyncIterator
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from ..core.config import Settings, get_settings
+from ..core.exceptions.base import ConfigurationError
+from .pool import InstrumentedAsyncQueuePool, pool_metrics
+from .query_counter import install_query_counter
+from .soft_delete import SoftDeleteSession
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def build_database_url(settings: Settings) -> URL:
+    """
+    Build the asyncpg database URL from the application settings.
+    """
+    return URL.create(
+        drivername="postgresql+asyncpg",
+        username=settings.postgres_user,
+        password=settings.postgres_password,
+        host=settings.postgres_host,
+        port=settings.postgres_port,
+        database=settings.postgres_db,
+    )
+
+
+def create_engine(settings: Settings | None = None) -> AsyncEngine:
+    """
+    Create a pooled async engine configured from the application settings.
+    """
+    settings = settings or get_settings()
+    engine = create_async_engine(
+        build_database_url(settings),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+        echo=settings.db_echo,
+        connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+    )
+    install_query_counter(engine)
+    return engine
+
+
+def init_engine(settings: Settings | None = None) -> AsyncEngine:
+    """
+    Create the shared engine and session factory if they do not exist yet.
+    """
+    global _engine, _session_factory
+    if _engine is None:
+        _engine = create_engine(settings)
+        _session_factory = async_sessionmaker(
+            _engine, expire_on_commit=False, autoflush=False, sync_session_class=SoftDeleteSession
+        )
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """
+    Close all pooled connections and drop the shared engine.
+    """
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+def get_engine() -> AsyncEngine:
+    """
+    Return the shared engine, raising if the application has not initialized it.
+    """
+    if _engine is None:
+        raise ConfigurationError("Database engine is not initialized.")
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the shared session factory, raising if the application has not initialized it.
+    """
+    if _session_factory is None:
+        raise ConfigurationError("Database engine is not initialized.")
+    return _session_factory
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency yielding a session bound to the shared connection pool.
+    """
+    async with get_session_factory()() as session:
+        yield session
+
+
+def get_pool_status() -> dict:
+    """
+    Return the current pool occupancy together with the accumulated checkout wait metrics.
+    """
+    status: dict = {"checkout_wait": pool_metrics.snapshot()}
+    if _engine is not None:
+        pool = _engine.pool
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
@@ -0,0 +1,37 @@
+from sqlalchemy import event, false
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from ..models.mixins import SoftDeleteMixin
+
+# Execution option, or session `info` key, that turns the soft-delete filter off.
+INCLUDE_DELETED = "include_deleted"
+
+
+class SoftDeleteSession(Session):
+    """
+    Session that leaves soft-deleted rows out of every ORM select.
+
+    Each select gets `is_deleted = false` for every `SoftDeleteMixin` model it touches,
+    including joined tables, eager loads and lazy loads, which also lets the planner use the
+    partial `WHERE is_deleted = false` indexes. UPDATE and DELETE statements are not filtered.
+
+    Admin and purge paths opt out per statement with `.execution_options(include_deleted=True)`,
+    or for a whole session with `session.info["include_deleted"] = True`.
+    """
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+        or execute_state.session.info.get(INCLUDE_DELETED, False)
+    ):
+        # Relationship and column loads inherit the criteria of the statement that loaded
+        # their parent, so an opted-out select stays opted out for its lazy loads too.
+        return
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(SoftDeleteMixin, lambda cls: cls.is_deleted == false(), include_aliases=True)
+    )
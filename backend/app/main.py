@@ -1,14 +1,44 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from .api.v1 import api_router
+from .core.config import get_settings
+from .core.exceptions.handlers import register_exception_handlers
+from .core.responses import ORJSONResponse
+from .db import close_redis, dispose_engine, get_pool_status, get_session_factory, init_engine, init_redis
+from .services.embedding_runner import close_embedding_runner, init_embedding_runner
+from .services.extraction_pool import ExtractionPool
+from .services.llm_gateway import close_llm_gateway, init_llm_gateway
+from .tasks import DocumentParserWorker
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize resources here if needed
+    settings = get_settings()
+    init_engine(settings)
+    init_redis(settings)
+    init_llm_gateway(settings)
+    if settings.embedding_enabled:
+        init_embedding_runner(settings)
+    parser_worker = parser_task = extraction_pool = None
+    if settings.document_parser_enabled:
+        extraction_pool = ExtractionPool.from_settings(settings)
+        parser_worker = DocumentParserWorker.from_settings(get_session_factory(), settings, extraction_pool)
+        parser_task = asyncio.create_task(parser_worker.run())
     yield
     # Cleanup resources here if needed
     print("Shutting down the application...")
+    if parser_worker is not None:
+        parser_worker.stop()
+        await parser_task
+        extraction_pool.shutdown()
+    await close_embedding_runner()
+    await close_llm_gateway()
+    await close_redis()
+    await dispose_engine()
 
 
 app = FastAPI(
@@ -16,7 +46,10 @@ app = FastAPI(
     description="An API to assist with job applications, including resume parsing and job matching.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
+app.include_router(api_router)
+register_exception_handlers(app)
 
 
 @app.get("/")
@@ -29,6 +62,11 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db")
+def database_health_check():
+    return {"status": "healthy", "pool": get_pool_status()}
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,5 +1,6 @@
 from .assistant_step import AssistantStep
 from .document import Document
+from .document_blob import DocumentBlob
 from .document_job_application import DocumentJobApplication
 from .job_application import JobApplication
 from .user import User
@@ -9,6 +10,7 @@ __all__ = [
     "AssistantStep",
     "JobApplication",
     "Document",
+    "DocumentBlob",
     "DocumentJobApplication",
     "UserSession",
     "User",
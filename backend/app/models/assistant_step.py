@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey, Integer
+from sqlalchemy import UUID, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -19,6 +19,22 @@ class AssistantStep(BaseModel, TimestampMixin, SoftDeleteMixin):
     Inherits from BaseModel, TimestampMixin, and SoftDeleteMixin.
     """
 
+    __table_args__ = (
+        Index("ix_assistant_step_job_application_id", "job_application_id"),
+        Index("ix_assistant_step_previous_step_id", "previous_step_id"),
+        Index(
+            "ix_assistant_step_job_application_id_step_order",
+            "job_application_id",
+            "step_order",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_assistant_step_input_fingerprint",
+            "input_fingerprint",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     job_application_id: Mapped[UUID] = mapped_column(ForeignKey("job_application.id"), nullable=False)
     job_application: Mapped["JobApplication"] = relationship(
         "JobApplication", back_populates="assistant_steps"
@@ -38,6 +54,10 @@ class AssistantStep(BaseModel, TimestampMixin, SoftDeleteMixin):
     previous_step_id: Mapped[UUID | None] = mapped_column(ForeignKey("assistant_step.id"), nullable=True)
     input_context: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # SHA-256 over everything the result was computed from; equal fingerprints can share a result.
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True, default=None)
+    # Hashes of the document fields the step read, keyed by document id, for incremental re-runs.
+    document_reads: Mapped[dict | None] = mapped_column(JSONB, nullable=True, default=None)
 
     def __repr__(self) -> str:
         return (
@@ -1,7 +1,8 @@
 import uuid
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import BigInteger, Computed, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +23,13 @@ if TYPE_CHECKING:
     from .job_application import JobApplication
     from .user import User
 
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')"
+)
+
 
 class Document(BaseModel, TimestampMixin, SoftDeleteMixin):
     """
@@ -29,15 +37,57 @@ class Document(BaseModel, TimestampMixin, SoftDeleteMixin):
     Inherits from BaseModel, TimestampMixin, and SoftDeleteMixin.
     """
 
+    __table_args__ = (
+        Index("ix_document_user_id", "user_id"),
+        Index("ix_document_content_hash", "content_hash"),
+        Index(
+            "ix_document_status_created_at",
+            "status",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_document_user_id_created_at_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_document_user_id_type",
+            "user_id",
+            "type",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_document_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_document_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
     user: Mapped["User"] = relationship("User", back_populates="documents")
     file_path: Mapped[PathType | None] = mapped_column(PathType, nullable=True, default=None)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, default=None)
+    file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True, default=None)
     job_applications: Mapped[List["JobApplication"]] = relationship(
         "JobApplication", secondary="document_job_application", back_populates="documents"
     )
 
     title: Mapped[String] = mapped_column(String, nullable=False)
     content: Mapped[Text | None] = mapped_column(Text, nullable=True)
+    # Version of the parser that produced `content`; content of other versions is never reused.
+    parser_version: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
+    # Times a parser worker has claimed the document, so one that keeps crashing workers is given up on.
+    parse_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
 
     type: Mapped[DocumentType] = mapped_column(
         PG_ENUM(DocumentType, name="document_type", create_type=True),
@@ -70,8 +120,12 @@ class Document(BaseModel, TimestampMixin, SoftDeleteMixin):
     version: Mapped[DocumentVersion | None] = mapped_column(
         PG_ENUM(DocumentVersion, name="document_version", create_type=True), default=None, nullable=True
     )
-    tags: Mapped[List[str] | None] = mapped_column(String, nullable=True, default=None)
+    tags: Mapped[List[str] | None] = mapped_column(ARRAY(Text), nullable=True, default=None)
     description: Mapped[Text | None] = mapped_column(Text, nullable=True, default=None)
+    # Maintained by PostgreSQL from title, description and content; deferred so listings never load it.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True, deferred=True
+    )
 
     def __repr__(self) -> str:
         return f"<Document(title={self.title}, user_id={self.user_id}, status={self.status})>"
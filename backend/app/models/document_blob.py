@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base_model import BaseModel
+from .custom_types.path_type import PathType
+from .mixins import TimestampMixin
+
+
+class DocumentBlob(BaseModel, TimestampMixin):
+    """
+    DocumentBlob model representing a stored file shared by every document with the same content.
+    Inherits from BaseModel and TimestampMixin.
+    """
+
+    content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    file_path: Mapped[Path] = mapped_column(PathType, nullable=False)
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Number of document rows, soft-deleted ones included, that point at this blob.
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<DocumentBlob(content_hash={self.content_hash}, ref_count={self.ref_count})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from .base_model import BaseModel
@@ -8,4 +8,6 @@ DocumentJobApplication = Table(
     BaseModel.metadata,
     Column("document_id", PG_UUID(as_uuid=True), ForeignKey("document.id"), primary_key=True),
     Column("job_application_id", PG_UUID(as_uuid=True), ForeignKey("job_application.id"), primary_key=True),
+    # The composite primary key covers lookups by document_id; this covers the reverse side.
+    Index("ix_document_job_application_job_application_id", "job_application_id"),
 )
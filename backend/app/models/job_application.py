@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import TIMESTAMP, UUID, ForeignKey, String, func
+from sqlalchemy import TIMESTAMP, UUID, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +21,24 @@ class JobApplication(BaseModel, TimestampMixin, SoftDeleteMixin):
     Inherits from BaseModel, TimestampMixin, and SoftDeleteMixin.
     """
 
+    __table_args__ = (
+        Index("ix_job_application_user_id", "user_id"),
+        Index(
+            "ix_job_application_user_id_created_at_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_job_application_user_id_status_created_at",
+            "user_id",
+            "application_status",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
     user: Mapped["User"] = relationship("User", back_populates="job_applications")
 
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import TIMESTAMP, ForeignKey, String
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base_model import BaseModel
@@ -18,6 +18,11 @@ class UserSession(BaseModel, TimestampMixin, SoftDeleteMixin):
     Inherits from BaseModel, TimestampMixin, and SoftDeleteMixin.
     """
 
+    __table_args__ = (
+        Index("ix_user_session_user_id", "user_id"),
+        Index("ix_user_session_expires_at", "expires_at"),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user.id"), nullable=False)
     user: Mapped["User"] = relationship("User", back_populates="sessions")
 
@@ -0,0 +1,76 @@
+from typing import Annotated
+
+from pydantic import UUID4, Field
+
+from ..core.enums import AssistantEventType, AssistantStepStatus, AssistantStepType
+from .base_schema import ResponseBase
+
+
+class AssistantEvent(ResponseBase):
+    """
+    Response schema for a single assistant progress event.
+    This schema defines the payload pushed to clients following a job application's assistant run.
+    """
+
+    event: Annotated[
+        AssistantEventType,
+        Field(
+            description="Kind of event",
+            examples=[AssistantEventType.STEP_STATUS, AssistantEventType.STEP_OUTPUT],
+        ),
+    ]
+    job_application_id: Annotated[
+        UUID4,
+        Field(
+            description="Unique identifier of the job application the event belongs to",
+            examples=["123e4567-e89b-12d3-a456-426614174000"],
+        ),
+    ]
+    step_id: Annotated[
+        UUID4 | None,
+        Field(
+            description="Unique identifier of the assistant step, for step events",
+            default=None,
+            examples=["123e4567-e89b-12d3-a456-426614174000"],
+        ),
+    ]
+    step_name: Annotated[
+        AssistantStepType | None,
+        Field(
+            description="Name of the assistant step, for step events",
+            default=None,
+            examples=[AssistantStepType.TAILORED_RESUME],
+        ),
+    ]
+    step_status: Annotated[
+        AssistantStepStatus | None,
+        Field(
+            description="New status of the assistant step, for step status events",
+            default=None,
+            examples=[AssistantStepStatus.IN_PROGRESS, AssistantStepStatus.COMPLETED],
+        ),
+    ]
+    delta: Annotated[
+        str | None,
+        Field(
+            description="Next chunk of the running step's output, for step output events",
+            default=None,
+            examples=["Led the migration of "],
+        ),
+    ]
+    assistant_status: Annotated[
+        AssistantStepStatus | None,
+        Field(
+            description="Overall assistant status of the job application, for application events",
+            default=None,
+            examples=[AssistantStepStatus.IN_PROGRESS],
+        ),
+    ]
+    current_step: Annotated[
+        AssistantStepType | None,
+        Field(
+            description="Earliest unfinished assistant step, for application events",
+            default=None,
+            examples=[AssistantStepType.TAILORED_COVER_LETTER],
+        ),
+    ]
@@ -1,13 +1,14 @@
-from typing import Annotated
+from typing import Annotated, List
 
 from pydantic import UUID4, Field
 
 from ..core.enums import AssistantStepStatus, AssistantStepType
-from .base_schema import InternalBase, MutableInternalBase, RequestBase
+from .base_schema import MutableInternalBase, RequestBase, ResponseBase
 from .mixins.timestamp_mixin import TimestampMixin
+from .pagination import PageInfo
 
 
-class AssistantStepInfo(InternalBase, TimestampMixin):
+class AssistantStepInfo(ResponseBase, TimestampMixin):
     """
     Response schema for assistant step information.
     This schema defines the fields returned in the response for assistant step retrieval.
@@ -277,3 +278,26 @@ class AssistantStepRequest(RequestBase):
             examples=[{"key": "value"}, {"another_key": "another_value"}],
         ),
     ]
+
+
+class AssistantStepListResponse(ResponseBase):
+    """
+    Response schema for a list of assistant steps.
+    This schema defines the fields returned in the response for retrieving a page of assistant steps.
+    """
+
+    assistant_steps: Annotated[
+        List[AssistantStepInfo],
+        Field(
+            description="List of assistant step information for the current page",
+            examples=[[{"id": "123e4567-e89b-12d3-a456-426614174000", "stepName": "initial_synthesis"}]],
+        ),
+    ]
+    page_info: Annotated[
+        PageInfo,
+        Field(
+            description="Cursor pagination metadata for the listing",
+            default_factory=PageInfo,
+            examples=[{"nextCursor": None, "hasMore": False, "limit": 25}],
+        ),
+    ]
@@ -13,11 +13,12 @@ from ..core.enums import (
     FileType,
     MimeType,
 )
-from .base_schema import InternalBase, RequestBase
+from .base_schema import RequestBase, ResponseBase
 from .mixins.timestamp_mixin import TimestampMixin
+from .pagination import PageInfo
 
 
-class DocumentInfo(InternalBase, TimestampMixin):
+class DocumentInfo(ResponseBase, TimestampMixin):
     """
     Response schema for document information.
     This schema defines the fields returned in the response for document retrieval.
@@ -79,6 +80,22 @@ class DocumentInfo(InternalBase, TimestampMixin):
             ],
         ),
     ]
+    content_hash: Annotated[
+        str | None,
+        Field(
+            description="SHA-256 hex digest of the uploaded file",
+            default=None,
+            examples=["9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"],
+        ),
+    ]
+    file_size: Annotated[
+        int | None,
+        Field(
+            description="Size of the uploaded file in bytes",
+            default=None,
+            examples=[48213, 1048576],
+        ),
+    ]
     type: Annotated[
         DocumentType,
         Field(
@@ -336,3 +353,41 @@ class DocumentUpdateRequest(RequestBase):
             ],
         ),
     ]
+
+
+class DocumentIdResponse(ResponseBase):
+    """
+    Response schema for document IDs.
+    This schema defines the fields returned in the response after documents are created.
+    """
+
+    ids: Annotated[
+        List[UUID4],
+        Field(
+            description="List or single document IDs",
+            examples=[["123e4567-e89b-12d3-a456-426614174000"]],
+        ),
+    ]
+
+
+class DocumentListResponse(ResponseBase):
+    """
+    Response schema for a list of documents.
+    This schema defines the fields returned in the response for retrieving a page of a user's documents.
+    """
+
+    documents: Annotated[
+        List[DocumentInfo],
+        Field(
+            description="List of document information for the current page",
+            examples=[[{"id": "123e4567-e89b-12d3-a456-426614174000", "title": "Project Proposal"}]],
+        ),
+    ]
+    page_info: Annotated[
+        PageInfo,
+        Field(
+            description="Cursor pagination metadata for the listing",
+            default_factory=PageInfo,
+            examples=[{"nextCursor": None, "hasMore": False, "limit": 25}],
+        ),
+    ]
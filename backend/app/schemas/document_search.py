@@ -0,0 +1,84 @@
+from typing import Annotated, List
+
+from pydantic import UUID4, Field
+
+from ..core.enums import DocumentType
+from .base_schema import ResponseBase
+
+
+class DocumentSearchResult(ResponseBase):
+    """
+    Response schema for a single full-text search hit.
+    This schema defines the fields returned for each document matching a search query.
+    """
+
+    id: Annotated[
+        UUID4,
+        Field(
+            description="Unique identifier for the document",
+            examples=["123e4567-e89b-12d3-a456-426614174000"],
+        ),
+    ]
+    title: Annotated[
+        str,
+        Field(
+            description="Title of the document",
+            examples=["Senior Backend Engineer Resume", "Platform Engineer - Job Description"],
+        ),
+    ]
+    type: Annotated[
+        DocumentType,
+        Field(
+            description="Type of the document",
+            examples=[DocumentType.RESUME, DocumentType.JOB_DESCRIPTION],
+        ),
+    ]
+    rank: Annotated[
+        float,
+        Field(
+            description="Relevance score of the document for the query, higher is better",
+            examples=[0.607927, 0.0759909],
+        ),
+    ]
+    snippet: Annotated[
+        str | None,
+        Field(
+            description=(
+                "HTML excerpt of the document: the document text is escaped and the <mark> tags "
+                "around matching terms are the only markup, so it is safe to render as HTML"
+            ),
+            default=None,
+            examples=["Built <mark>Kubernetes</mark> deployment pipelines for 40 services"],
+        ),
+    ]
+
+
+class DocumentSearchResponse(ResponseBase):
+    """
+    Response schema for a document full-text search.
+    This schema defines the fields returned in the response for a document search query.
+    """
+
+    query: Annotated[
+        str,
+        Field(
+            description="Search query as submitted",
+            examples=["kubernetes terraform", '"platform engineer" -manager'],
+        ),
+    ]
+    results: Annotated[
+        List[DocumentSearchResult],
+        Field(
+            description="Matching documents ordered by relevance",
+            examples=[
+                [
+                    {
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "title": "Senior Backend Engineer Resume",
+                        "type": DocumentType.RESUME,
+                        "rank": 0.607927,
+                    }
+                ]
+            ],
+        ),
+    ]
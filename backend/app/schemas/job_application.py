@@ -4,6 +4,7 @@ from pydantic import UUID4, Field, HttpUrl
 
 from ..core.enums import JobApplicationStatus, JobType
 from .base_schema import InternalBase, RequestBase, ResponseBase
+from .pagination import PageInfo
 
 
 class JobApplicationInfo(ResponseBase):
@@ -12,6 +13,13 @@ class JobApplicationInfo(ResponseBase):
     This schema defines the fields returned in the response for job application retrieval.
     """
 
+    id: Annotated[
+        UUID4,
+        Field(
+            description="Unique identifier for the job application",
+            examples=["123e4567-e89b-12d3-a456-426614174000"],
+        ),
+    ]
     user_id: Annotated[
         UUID4,
         Field(
@@ -271,7 +279,21 @@ class JobApplicationListResponse(ResponseBase):
         Field(
             description="List or single job application information",
             examples=[
-                [{"user_id": "b3c1e2d4-5678-1234-9abc-1234567890ab", "job_title": "Software Engineer"}]
+                [
+                    {
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "userId": "b3c1e2d4-5678-1234-9abc-1234567890ab",
+                        "jobTitle": "Software Engineer",
+                    }
+                ]
             ],
         ),
     ]
+    page_info: Annotated[
+        PageInfo,
+        Field(
+            description="Cursor pagination metadata for the listing",
+            default_factory=PageInfo,
+            examples=[{"nextCursor": None, "hasMore": False, "limit": 25}],
+        ),
+    ]
@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from pydantic import Field
+
+from .base_schema import ResponseBase
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+class PageInfo(ResponseBase):
+    """
+    Response schema for keyset pagination metadata.
+    This schema defines the cursor a client sends back to fetch the next page of a listing.
+    """
+
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Opaque cursor for the next page, or null when this is the last page",
+            default=None,
+            examples=["WyIyMDI1LTA2LTEzVDE4OjMzOjMzKzAwOjAwIiwiMTIzZTQ1NjctZTg5Yi0xMmQzIl0"],
+        ),
+    ]
+    has_more: Annotated[
+        bool,
+        Field(
+            description="Whether more items exist after this page",
+            default=False,
+            examples=[True, False],
+        ),
+    ]
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of items returned in this page",
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            default=DEFAULT_PAGE_SIZE,
+            examples=[DEFAULT_PAGE_SIZE],
+        ),
+    ]
@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from pydantic import Field
+
+from .base_schema import InternalBase
+from .document_content import AllDocumentContent
+
+
+class ParseResult(InternalBase):
+    """
+    Internal schema for the outcome of parsing a stored file.
+    This schema defines what the parse cache keeps for a file's content hash.
+    """
+
+    parser_version: Annotated[
+        int,
+        Field(
+            description="Version of the parser that produced this result",
+            examples=[1],
+        ),
+    ]
+    text: Annotated[
+        str,
+        Field(
+            description="Plain text extracted from the file",
+            examples=["Jane Doe\nSenior Backend Engineer\n..."],
+        ),
+    ]
+    content: Annotated[
+        AllDocumentContent | None,
+        Field(
+            description="Structured content of the document, if it has been structured",
+            discriminator="document_type",
+        ),
+    ] = None
@@ -0,0 +1,126 @@
+import json
+import logging
+import uuid
+from typing import AsyncIterator, Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import AssistantEventType
+from ..models import AssistantStep, JobApplication
+from ..schemas.assistant_event import AssistantEvent
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 15.0  # seconds
+
+
+def channel_for(job_application_id: uuid.UUID) -> str:
+    """
+    Return the Redis pub/sub channel carrying a job application's assistant events.
+    """
+    return f"assistant:{job_application_id}"
+
+
+class AssistantEventPublisher:
+    """
+    Publishes assistant progress events to Redis, where every API process can pick them up.
+
+    Events are best effort: a Redis outage is logged and never fails the assistant run.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def publish(self, event: AssistantEvent) -> None:
+        """
+        Publish an event on its job application's channel.
+        """
+        try:
+            await self.redis.publish(
+                channel_for(event.job_application_id), event.model_dump_json(by_alias=True, exclude_none=True)
+            )
+        except RedisError:
+            logger.warning(
+                "Failed to publish assistant event for %s", event.job_application_id, exc_info=True
+            )
+
+
+async def load_snapshot_events(session: AsyncSession, job_application_id: uuid.UUID) -> list[AssistantEvent]:
+    """
+    Return events describing the current assistant state, sent before any live events.
+    """
+    application = (
+        await session.execute(
+            select(JobApplication.assistant_status, JobApplication.assistant_current_step).where(
+                JobApplication.id == job_application_id
+            )
+        )
+    ).one()
+    steps = await session.execute(
+        select(AssistantStep.id, AssistantStep.step_name, AssistantStep.step_status)
+        .where(AssistantStep.job_application_id == job_application_id, AssistantStep.is_deleted == false())
+        .order_by(AssistantStep.step_order)
+    )
+    events = [
+        AssistantEvent(
+            event=AssistantEventType.STEP_STATUS,
+            job_application_id=job_application_id,
+            step_id=step.id,
+            step_name=step.step_name,
+            step_status=step.step_status,
+        )
+        for step in steps
+    ]
+    events.append(
+        AssistantEvent(
+            event=AssistantEventType.APPLICATION_STATUS,
+            job_application_id=job_application_id,
+            assistant_status=application.assistant_status,
+            current_step=application.assistant_current_step,
+        )
+    )
+    return events
+
+
+def format_sse(payload: str, event: str | None = None) -> str:
+    """
+    Format a payload as a server-sent event.
+    """
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+async def relay_events(
+    redis: Redis,
+    job_application_id: uuid.UUID,
+    snapshot: Callable[[], Awaitable[list[AssistantEvent]]],
+) -> AsyncIterator[str]:
+    """
+    Yield a job application's assistant events as server-sent events.
+
+    The channel is subscribed before `snapshot` runs, so no change between the two is lost.
+    A comment line is sent when the channel has been quiet for `HEARTBEAT_INTERVAL` seconds,
+    which keeps proxies from closing the connection.
+    """
+    async with redis.pubsub() as pubsub:
+        await pubsub.subscribe(channel_for(job_application_id))
+        for event in await snapshot():
+            yield format_sse(event.model_dump_json(by_alias=True, exclude_none=True), event.event)
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=HEARTBEAT_INTERVAL)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            payload = message["data"]
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8")
+            try:
+                event = json.loads(payload).get("event")
+            except (ValueError, AttributeError):
+                logger.warning("Dropping malformed assistant event on %s", message["channel"])
+                continue
+            yield format_sse(payload, event)
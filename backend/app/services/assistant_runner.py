@@ -0,0 +1,444 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, List, Mapping
+
+from sqlalchemy import false, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.enums import AssistantEventType, AssistantStepStatus, AssistantStepType
+from ..core.exceptions.base import NotFoundError, ValidationError
+from ..models import AssistantStep, JobApplication
+from ..schemas.assistant_event import AssistantEvent
+from .assistant_events import AssistantEventPublisher
+from .step_cache import (
+    ApplicationInputs,
+    find_cached_result,
+    load_application_inputs,
+    load_document_hashes,
+    remap_document_reads,
+    step_fingerprint,
+)
+from .step_dependencies import DocumentReader, find_stale_steps
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StepNode:
+    """
+    Snapshot of an assistant step as seen by the runner.
+    """
+
+    id: uuid.UUID
+    job_application_id: uuid.UUID
+    step_name: AssistantStepType
+    step_order: int | None
+    previous_step_id: uuid.UUID | None
+    input_context: dict | None
+    step_status: AssistantStepStatus
+    result: dict | None
+    document_reads: dict | None = None
+
+
+@dataclass(frozen=True)
+class StepContext:
+    """
+    Everything a step handler gets to work with.
+
+    `upstream_results` holds the results of every step this one transitively depends on,
+    keyed by step type. `application` holds the job application's fingerprinted fields and
+    `document_hashes` the content hashes of the documents attached to it. Handlers should read
+    documents through `documents`, which records the fields they depend on, and report output
+    as it is generated through `emit_output`.
+    """
+
+    job_application_id: uuid.UUID
+    step: StepNode
+    user_id: uuid.UUID | None = None
+    application: Mapping[str, Any] = field(default_factory=dict)
+    upstream_results: Mapping[AssistantStepType, dict] = field(default_factory=dict)
+    document_hashes: tuple[str, ...] = ()
+    documents: DocumentReader | None = None
+    publisher: AssistantEventPublisher | None = None
+
+    async def emit_output(self, delta: str) -> None:
+        """
+        Push the next chunk of this step's output, such as streamed LLM tokens, to listening clients.
+        """
+        if self.publisher is not None and delta:
+            await self.publisher.publish(
+                AssistantEvent(
+                    event=AssistantEventType.STEP_OUTPUT,
+                    job_application_id=self.job_application_id,
+                    step_id=self.step.id,
+                    step_name=self.step.step_name,
+                    delta=delta,
+                )
+            )
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Canonical hash of this step's inputs, used to reuse results of identical runs.
+        """
+        return step_fingerprint(
+            self.step.step_name,
+            self.step.input_context,
+            self.document_hashes,
+            self.upstream_results,
+            self.application,
+        )
+
+
+StepHandler = Callable[[StepContext], Awaitable[dict]]
+
+
+@dataclass(frozen=True)
+class StepGraph:
+    """
+    Dependencies between the steps of one job application, with a topological order.
+    """
+
+    dependencies: dict[uuid.UUID, frozenset[uuid.UUID]]
+    order: List[uuid.UUID]
+
+    def ancestors(self, step_id: uuid.UUID) -> set[uuid.UUID]:
+        """
+        Return every step the given step transitively depends on.
+        """
+        seen: set[uuid.UUID] = set()
+        stack = list(self.dependencies[step_id])
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(self.dependencies[current])
+        return seen
+
+    def descendants(self, step_id: uuid.UUID) -> set[uuid.UUID]:
+        """
+        Return every step that transitively depends on the given step.
+        """
+        found = {step_id}
+        for current in self.order[self.order.index(step_id) + 1 :]:
+            if self.dependencies[current] & found:
+                found.add(current)
+        found.discard(step_id)
+        return found
+
+
+def _order_key(step: StepNode) -> tuple[bool, int]:
+    return step.step_order is None, step.step_order or 0
+
+
+def build_step_graph(steps: Iterable[StepNode]) -> StepGraph:
+    """
+    Build the dependency graph of a job application's steps.
+
+    A step with `previous_step_id` depends on that step only, so siblings sharing a parent can
+    run side by side. A step without one depends on every step at the closest lower `step_order`,
+    and steps sharing an order are independent. Raises ValidationError for dangling references
+    or cycles.
+    """
+    steps = sorted(steps, key=_order_key)
+    by_id = {step.id: step for step in steps}
+    dependencies: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+    for step in steps:
+        if step.previous_step_id is not None:
+            if step.previous_step_id not in by_id:
+                raise ValidationError(f"Assistant step {step.id} depends on a step that does not exist.")
+            dependencies[step.id] = frozenset({step.previous_step_id})
+        elif step.step_order is None:
+            dependencies[step.id] = frozenset()
+        else:
+            closest = max(
+                (
+                    other.step_order
+                    for other in steps
+                    if other.step_order is not None and other.step_order < step.step_order
+                ),
+                default=None,
+            )
+            dependencies[step.id] = frozenset(
+                other.id for other in steps if closest is not None and other.step_order == closest
+            )
+
+    # Kahn's algorithm, preferring lower step_order so the order is stable.
+    remaining = {step_id: set(deps) for step_id, deps in dependencies.items()}
+    order: List[uuid.UUID] = []
+    while remaining:
+        ready = [step.id for step in steps if step.id in remaining and not remaining[step.id]]
+        if not ready:
+            raise ValidationError("Assistant steps contain a dependency cycle.")
+        for step_id in ready:
+            del remaining[step_id]
+            order.append(step_id)
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return StepGraph(dependencies=dependencies, order=order)
+
+
+class AssistantStepRunner:
+    """
+    Executes a job application's assistant steps in dependency order.
+
+    Steps whose dependencies are complete run concurrently, up to `concurrency` at a time.
+    Every status change is committed as it happens, and `JobApplication.assistant_current_step`
+    tracks the earliest step that is not finished yet. Steps that are already COMPLETED keep
+    their result, so a failed run can simply be started again. Steps downstream of a failure
+    are CANCELLED.
+
+    A step whose input fingerprint matches an earlier completed step of the same user copies that
+    step's result and recorded document reads instead of calling its handler.
+
+    Runs are incremental: a completed step is only recomputed when a document field it read has
+    changed since, and its dependents are only recomputed when that produces a different result.
+
+    With a `publisher`, every change is also pushed to clients as an assistant event.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        handlers: Mapping[AssistantStepType, StepHandler],
+        *,
+        concurrency: int = 4,
+        publisher: AssistantEventPublisher | None = None,
+    ):
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.publisher = publisher
+
+    async def run(self, job_application_id: uuid.UUID) -> dict[uuid.UUID, AssistantStepStatus]:
+        """
+        Run every unfinished step of a job application and return the final status of each step.
+        """
+        steps = {step.id: step for step in await self.load_steps(job_application_id)}
+        if not steps:
+            return {}
+        graph = build_step_graph(steps.values())
+        async with self.session_factory() as session:
+            application = await load_application_inputs(session, job_application_id)
+            document_hashes = tuple(await load_document_hashes(session, job_application_id))
+            stale = await find_stale_steps(
+                session,
+                job_application_id,
+                {step.id: step.document_reads for step in steps.values() if self._is_done(step)},
+            )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = [
+            step_id for step_id in graph.order if not self._is_done(steps[step_id]) or step_id in stale
+        ]
+        running: dict[asyncio.Task, uuid.UUID] = {}
+
+        # Failures from an earlier run must not cancel their dependents before being retried.
+        await self._reset(steps[step_id] for step_id in pending)
+        await self._sync_application(job_application_id, steps, graph, finished=False)
+        while pending or running:
+            for step_id in list(pending):
+                dependency_statuses = {steps[dep].step_status for dep in graph.dependencies[step_id]}
+                if dependency_statuses & {AssistantStepStatus.FAILED, AssistantStepStatus.CANCELLED}:
+                    pending.remove(step_id)
+                    await self._set_status(steps[step_id], AssistantStepStatus.CANCELLED)
+                elif dependency_statuses <= {AssistantStepStatus.COMPLETED}:
+                    pending.remove(step_id)
+                    context = self._context(
+                        job_application_id, steps, graph, step_id, application, document_hashes
+                    )
+                    running[asyncio.create_task(self._run_step(context, semaphore))] = step_id
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step_id = running.pop(task)
+                if task.exception() is not None:
+                    logger.error("Assistant step %s could not be run", step_id, exc_info=task.exception())
+                elif task.result():
+                    # The result changed, so completed dependents are working from outdated input.
+                    outdated = [
+                        dependent
+                        for dependent in graph.descendants(step_id)
+                        if self._is_done(steps[dependent])
+                    ]
+                    await self._reset(steps[dependent] for dependent in outdated)
+                    pending = [other for other in graph.order if other in {*pending, *outdated}]
+            await self._sync_application(job_application_id, steps, graph, finished=False)
+        await self._sync_application(job_application_id, steps, graph, finished=True)
+        return {step_id: step.step_status for step_id, step in steps.items()}
+
+    async def load_steps(self, job_application_id: uuid.UUID) -> List[StepNode]:
+        """
+        Load the live steps of a job application.
+        """
+        async with self.session_factory() as session:
+            exists = await session.scalar(
+                select(JobApplication.id).where(
+                    JobApplication.id == job_application_id, JobApplication.is_deleted == false()
+                )
+            )
+            if exists is None:
+                raise NotFoundError("Job application")
+            rows = await session.scalars(
+                select(AssistantStep).where(
+                    AssistantStep.job_application_id == job_application_id,
+                    AssistantStep.is_deleted == false(),
+                )
+            )
+            return [
+                StepNode(
+                    id=row.id,
+                    job_application_id=row.job_application_id,
+                    step_name=row.step_name,
+                    step_order=row.step_order,
+                    previous_step_id=row.previous_step_id,
+                    input_context=row.input_context,
+                    step_status=row.step_status,
+                    result=row.result,
+                    document_reads=row.document_reads,
+                )
+                for row in rows
+            ]
+
+    @staticmethod
+    def _is_done(step: StepNode) -> bool:
+        return step.step_status == AssistantStepStatus.COMPLETED
+
+    def _context(
+        self,
+        job_application_id: uuid.UUID,
+        steps: Mapping[uuid.UUID, StepNode],
+        graph: StepGraph,
+        step_id: uuid.UUID,
+        application: ApplicationInputs,
+        document_hashes: tuple[str, ...],
+    ) -> StepContext:
+        upstream = {
+            steps[ancestor].step_name: steps[ancestor].result or {} for ancestor in graph.ancestors(step_id)
+        }
+        return StepContext(
+            job_application_id=job_application_id,
+            step=steps[step_id],
+            user_id=application.user_id,
+            application=application.fields,
+            upstream_results=upstream,
+            document_hashes=document_hashes,
+            documents=DocumentReader(self.session_factory, job_application_id),
+            publisher=self.publisher,
+        )
+
+    async def _run_step(self, context: StepContext, semaphore: asyncio.Semaphore) -> bool:
+        # Returns whether the step ended up with a different result than it had before.
+        step = context.step
+        previous_result = step.result
+        fingerprint = context.fingerprint
+        async with semaphore:
+            async with self.session_factory() as session:
+                cached = await find_cached_result(session, context.user_id, fingerprint)
+                if cached is not None:
+                    # Carry over what the source step read, so later runs can tell if it went stale.
+                    reads = await remap_document_reads(
+                        session, step.job_application_id, cached.document_reads
+                    )
+            if cached is not None:
+                logger.info("Reusing cached result for assistant step %s (%s)", step.id, step.step_name.value)
+                await self._set_status(step, AssistantStepStatus.COMPLETED, cached.result, fingerprint, reads)
+                return cached.result != previous_result
+            handler = self.handlers.get(step.step_name)
+            if handler is None:
+                logger.error("No handler registered for assistant step %s", step.step_name.value)
+                await self._set_status(step, AssistantStepStatus.FAILED)
+                return False
+            await self._set_status(step, AssistantStepStatus.IN_PROGRESS)
+            try:
+                result = await handler(context)
+            except Exception:
+                logger.exception("Assistant step %s (%s) failed", step.id, step.step_name.value)
+                await self._set_status(step, AssistantStepStatus.FAILED)
+                return False
+            await self._set_status(
+                step, AssistantStepStatus.COMPLETED, result, fingerprint, context.documents.reads
+            )
+            return result != previous_result
+
+    async def _set_status(
+        self,
+        step: StepNode,
+        status: AssistantStepStatus,
+        result: dict | None = None,
+        fingerprint: str | None = None,
+        document_reads: dict | None = None,
+    ) -> None:
+        values: dict = {"step_status": status}
+        if result is not None:
+            values.update(result=result, input_fingerprint=fingerprint, document_reads=document_reads)
+        async with self.session_factory() as session:
+            await session.execute(update(AssistantStep).where(AssistantStep.id == step.id).values(**values))
+            await session.commit()
+        step.step_status = status
+        if result is not None:
+            step.result = result
+            step.document_reads = document_reads
+        await self._publish_status(step)
+
+    async def _publish_status(self, step: StepNode) -> None:
+        if self.publisher is not None:
+            await self.publisher.publish(
+                AssistantEvent(
+                    event=AssistantEventType.STEP_STATUS,
+                    job_application_id=step.job_application_id,
+                    step_id=step.id,
+                    step_name=step.step_name,
+                    step_status=step.step_status,
+                )
+            )
+
+    async def _reset(self, steps: Iterable[StepNode]) -> None:
+        steps = list(steps)
+        if not steps:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                update(AssistantStep)
+                .where(AssistantStep.id.in_([step.id for step in steps]))
+                .values(step_status=AssistantStepStatus.NOT_STARTED)
+            )
+            await session.commit()
+        for step in steps:
+            step.step_status = AssistantStepStatus.NOT_STARTED
+            await self._publish_status(step)
+
+    async def _sync_application(
+        self,
+        job_application_id: uuid.UUID,
+        steps: Mapping[uuid.UUID, StepNode],
+        graph: StepGraph,
+        *,
+        finished: bool,
+    ) -> None:
+        unfinished = [steps[step_id] for step_id in graph.order if not self._is_done(steps[step_id])]
+        current = unfinished[0] if unfinished else steps[graph.order[-1]]
+        if not finished:
+            assistant_status = AssistantStepStatus.IN_PROGRESS
+        elif unfinished:
+            assistant_status = AssistantStepStatus.FAILED
+        else:
+            assistant_status = AssistantStepStatus.COMPLETED
+        async with self.session_factory() as session:
+            await session.execute(
+                update(JobApplication)
+                .where(JobApplication.id == job_application_id)
+                .values(assistant_current_step=current.step_name, assistant_status=assistant_status)
+            )
+            await session.commit()
+        if self.publisher is not None:
+            await self.publisher.publish(
+                AssistantEvent(
+                    event=AssistantEventType.APPLICATION_STATUS,
+                    job_application_id=job_application_id,
+                    assistant_status=assistant_status,
+                    current_step=current.step_name,
+                )
+            )
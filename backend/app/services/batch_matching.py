@@ -0,0 +1,167 @@
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+import numpy as np
+import pydantic
+from scipy import sparse
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import DocumentType
+from ..models import Document, DocumentJobApplication, JobApplication
+from ..schemas.document_content import JobDescription
+from ..utils.terms import Tokenizer, tokenize
+from .match_scoring import ResumeProfile
+
+
+@dataclass(frozen=True)
+class RankedMatch:
+    """
+    A job application's similarity to a resume, between 0 and 1.
+    """
+
+    job_application_id: uuid.UUID
+    score: float
+
+
+def job_description_terms(job: JobDescription, tokenizer: Tokenizer = tokenize) -> List[str]:
+    """
+    Return the terms of a job description's title, responsibilities and qualifications.
+    """
+    texts = [job.job_title, *(job.responsibilities or [])]
+    if job.qualifications is not None:
+        texts.extend(job.qualifications.required)
+        texts.extend(job.qualifications.preferred)
+    return [term for text in texts for term in tokenizer(text)]
+
+
+def document_terms(content: str | None, tokenizer: Tokenizer = tokenize) -> List[str]:
+    """
+    Return the terms of a job description document's content.
+
+    Content holding a structured job description contributes only the fields that describe the
+    role; any other content is treated as plain text.
+    """
+    if not content:
+        return []
+    try:
+        return job_description_terms(JobDescription.model_validate_json(content), tokenizer)
+    except pydantic.ValidationError:
+        return tokenizer(content)
+
+
+class JobMatrix:
+    """
+    TF-IDF matrix over a set of job descriptions, one row per job application.
+
+    Rows are L2-normalized, so multiplying the matrix by a normalized resume vector yields the
+    cosine similarity of the resume to every job description in a single sparse product.
+    """
+
+    def __init__(
+        self,
+        job_application_ids: Sequence[uuid.UUID],
+        matrix: sparse.csr_matrix,
+        vocabulary: dict[str, int],
+        idf: np.ndarray,
+    ):
+        self.job_application_ids = list(job_application_ids)
+        self.matrix = matrix
+        self.vocabulary = vocabulary
+        self.idf = idf
+
+    @classmethod
+    def build(cls, documents: Iterable[tuple[uuid.UUID, Iterable[str]]]) -> "JobMatrix":
+        """
+        Build the matrix from each job application's job description terms.
+        """
+        job_application_ids: List[uuid.UUID] = []
+        vocabulary: dict[str, int] = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        counts: List[int] = []
+        for row, (job_application_id, terms) in enumerate(documents):
+            job_application_ids.append(job_application_id)
+            for term, count in Counter(terms).items():
+                rows.append(row)
+                columns.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+
+        shape = (len(job_application_ids), len(vocabulary))
+        columns_array = np.asarray(columns, dtype=np.int32)
+        # Smoothed IDF, as if one extra document contained every term, so no weight is ever zero.
+        document_frequency = np.bincount(columns_array, minlength=shape[1])
+        idf = (np.log((1 + shape[0]) / (1 + document_frequency)) + 1).astype(np.float32)
+        # Sublinear term frequency keeps a term repeated in every bullet from dominating a row.
+        weights = (1 + np.log(np.asarray(counts, dtype=np.float32))) * idf[columns_array]
+        matrix = sparse.csr_matrix(
+            (weights, (np.asarray(rows, dtype=np.int32), columns_array)), shape=shape, dtype=np.float32
+        )
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        matrix = sparse.diags(1 / norms).dot(matrix).tocsr()
+        return cls(job_application_ids, matrix, vocabulary, idf)
+
+    def __len__(self) -> int:
+        return len(self.job_application_ids)
+
+    def vectorize(self, resume: ResumeProfile) -> np.ndarray:
+        """
+        Return the normalized TF-IDF vector of a resume over the matrix's vocabulary.
+
+        Each term is weighted by the evidence the resume gives for it, so a listed skill with
+        years of experience counts for more than a passing mention.
+        """
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term in resume.terms:
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = resume.term_weight(term)
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def rank(self, resume: ResumeProfile, limit: int | None = None) -> List[RankedMatch]:
+        """
+        Return the job applications ordered by similarity to a resume, best first.
+        """
+        if not self.job_application_ids:
+            return []
+        scores = self.matrix.dot(self.vectorize(resume))
+        if limit is not None and limit < len(scores):
+            top = np.argpartition(-scores, limit)[:limit]
+            order = top[np.argsort(-scores[top], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        return [RankedMatch(self.job_application_ids[index], float(scores[index])) for index in order]
+
+
+async def load_job_matrix(
+    session: AsyncSession, user_id: uuid.UUID, tokenizer: Tokenizer = tokenize
+) -> JobMatrix:
+    """
+    Build the matrix over the job descriptions attached to a user's job applications.
+
+    Job applications without a parsed job description are left out; when several job
+    descriptions are attached to one application, their terms are combined. Resumes ranked
+    against the matrix must be profiled with the same `tokenizer`.
+    """
+    rows = await session.execute(
+        select(DocumentJobApplication.c.job_application_id, Document.content)
+        .join(Document, Document.id == DocumentJobApplication.c.document_id)
+        .join(JobApplication, JobApplication.id == DocumentJobApplication.c.job_application_id)
+        .where(
+            JobApplication.user_id == user_id,
+            JobApplication.is_deleted == false(),
+            Document.type == DocumentType.JOB_DESCRIPTION,
+            Document.content.is_not(None),
+            Document.is_deleted == false(),
+        )
+        .order_by(DocumentJobApplication.c.job_application_id)
+    )
+    terms: dict[uuid.UUID, List[str]] = {}
+    for row in rows:
+        terms.setdefault(row.job_application_id, []).extend(document_terms(row.content, tokenizer))
+    return JobMatrix.build(terms.items())
@@ -0,0 +1,204 @@
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Mapping
+
+import anyio
+from sqlalchemy import column as sql_column
+from sqlalchemy import delete, event, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.types import Integer, String
+
+from ..core.config import Settings, get_settings
+from ..core.enums import DocumentStatus
+from ..models import Document, DocumentBlob
+from .text_extraction import PARSER_VERSION
+
+PARSED_STATUSES = (DocumentStatus.PARSED, DocumentStatus.VALIDATED)
+
+# Session info key holding the blob files to unlink once the transaction commits or rolls back.
+PENDING_UNLINKS = "blob_store.pending_unlinks"
+
+
+def _pending_unlinks(session: AsyncSession) -> dict[str, List[Path]]:
+    sync_session = session.sync_session
+    pending = sync_session.info.get(PENDING_UNLINKS)
+    if pending is None:
+        pending = sync_session.info[PENDING_UNLINKS] = {"commit": [], "rollback": []}
+        event.listen(sync_session, "after_commit", _unlink_after_commit)
+        event.listen(sync_session, "after_transaction_end", _unlink_after_rollback)
+    return pending
+
+
+def _unlink_after_commit(sync_session: Session) -> None:
+    pending = sync_session.info[PENDING_UNLINKS]
+    _unlink(pending["commit"])
+    pending["rollback"].clear()
+
+
+def _unlink_after_rollback(sync_session: Session, transaction: SessionTransaction) -> None:
+    # Runs after commits too, but by then the commit hook has emptied both lists. Closing a
+    # session ends its transaction without a rollback event, so this hook catches that as well.
+    if transaction.parent is None:
+        pending = sync_session.info[PENDING_UNLINKS]
+        _unlink(pending["rollback"])
+        pending["commit"].clear()
+
+
+def _unlink(paths: List[Path]) -> None:
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
+    paths.clear()
+
+
+class BlobStore:
+    """
+    Content-addressed file store shared by all documents.
+
+    Each distinct file is kept once under its SHA-256 and reference counted in `document_blob`.
+    Soft-deleted documents keep their reference, so a blob is only removed once every document
+    pointing at it has been purged.
+
+    File changes follow the transaction that made them: a file moved in for a new blob is removed
+    again if the transaction rolls back, and a released blob's file is only deleted once the
+    transaction commits. Every blob row gets a file path of its own, so cleaning up after one
+    transaction can never remove a file that a row from another transaction points to.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    @property
+    def staging_dir(self) -> Path:
+        """
+        Directory uploads are streamed into before they are moved into the store.
+
+        It lives under the store root so moving a staged file in is an atomic rename.
+        """
+        return self.root / "tmp"
+
+    def path_for(self, content_hash: str) -> Path:
+        """
+        Return a new, unused path for storing a blob with the given hash.
+        """
+        return self.root / content_hash[:2] / content_hash[2:4] / f"{content_hash}.{uuid.uuid4().hex}"
+
+    async def acquire(
+        self,
+        session: AsyncSession,
+        staged_files: Mapping[Path, tuple[str, int]],
+    ) -> dict[str, Path]:
+        """
+        Take a reference on the blob of every staged file and move new content into the store.
+
+        `staged_files` maps each staged path to its (content hash, size). Staged copies of content
+        that is already stored are discarded. Returns the blob path for each content hash.
+
+        The reference rows are locked until the caller commits, so a concurrent purge of the same
+        hash cannot delete the blob file out from under this upload. Files moved in for new blobs
+        are removed again if the caller rolls back.
+        """
+        if not staged_files:
+            return {}
+        counts = Counter(content_hash for content_hash, _ in staged_files.values())
+        sizes = {content_hash: size for content_hash, size in staged_files.values()}
+        new_paths = {content_hash: self.path_for(content_hash) for content_hash in counts}
+        stmt = pg_insert(DocumentBlob).values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "content_hash": content_hash,
+                    "file_path": new_paths[content_hash],
+                    "file_size": sizes[content_hash],
+                    "ref_count": count,
+                }
+                for content_hash, count in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DocumentBlob.content_hash],
+            set_={
+                "ref_count": DocumentBlob.ref_count + stmt.excluded.ref_count,
+                "updated_at": func.now(),
+            },
+        ).returning(DocumentBlob.content_hash, DocumentBlob.file_path)
+        blob_paths = {row.content_hash: row.file_path for row in await session.execute(stmt)}
+
+        # A blob row that kept the proposed path was inserted by this call and still needs its file.
+        pending = _pending_unlinks(session)
+        for staged_path, (content_hash, _) in staged_files.items():
+            blob_path = blob_paths[content_hash]
+            if blob_path == new_paths.pop(content_hash, None):
+                await anyio.Path(blob_path).parent.mkdir(parents=True, exist_ok=True)
+                await anyio.Path(staged_path).replace(blob_path)
+                pending["rollback"].append(blob_path)
+            else:
+                await anyio.Path(staged_path).unlink(missing_ok=True)
+        return blob_paths
+
+    async def release(self, session: AsyncSession, content_hashes: Iterable[str]) -> List[Path]:
+        """
+        Drop one reference per given hash and delete blobs that are no longer referenced.
+
+        Returns the files of the deleted blobs. They are unlinked once the caller commits, so a
+        rollback leaves both the rows and their files in place.
+        """
+        counts = Counter(content_hashes)
+        if not counts:
+            return []
+        released = values(
+            sql_column("content_hash", String),
+            sql_column("count", Integer),
+            name="released",
+        ).data(list(counts.items()))
+        await session.execute(
+            update(DocumentBlob)
+            .where(DocumentBlob.content_hash == released.c.content_hash)
+            .values(ref_count=DocumentBlob.ref_count - released.c.count, updated_at=func.now())
+        )
+        removed = await session.scalars(
+            delete(DocumentBlob)
+            .where(DocumentBlob.content_hash.in_(counts), DocumentBlob.ref_count <= 0)
+            .returning(DocumentBlob.file_path)
+        )
+        paths = list(removed)
+        _pending_unlinks(session)["commit"].extend(paths)
+        return paths
+
+
+def get_blob_store(settings: Settings | None = None) -> BlobStore:
+    """
+    Return the blob store rooted in the configured storage directory.
+    """
+    settings = settings or get_settings()
+    return BlobStore(settings.storage_root / "blobs")
+
+
+async def find_parsed_content(
+    session: AsyncSession, content_hashes: Iterable[str], parser_version: int = PARSER_VERSION
+) -> dict[str, str]:
+    """
+    Return already extracted text for any of the given hashes, keyed by content hash.
+
+    Identical files produce identical text, so a re-upload can reuse an earlier parse. Only text
+    extracted by `parser_version` is returned, so bumping `PARSER_VERSION` re-parses everything.
+    """
+    content_hashes = set(content_hashes)
+    if not content_hashes:
+        return {}
+    rows = await session.execute(
+        select(Document.content_hash, Document.content)
+        .where(
+            Document.content_hash.in_(content_hashes),
+            Document.status.in_(PARSED_STATUSES),
+            Document.parser_version == parser_version,
+            Document.content.is_not(None),
+        )
+        .distinct(Document.content_hash)
+        .order_by(Document.content_hash, Document.updated_at.desc())
+        # Deleted documents awaiting purge still hold their parsed text.
+        .execution_options(include_deleted=True)
+    )
+    return {row.content_hash: row.content for row in rows}
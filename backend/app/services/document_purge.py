@@ -0,0 +1,61 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import anyio
+from sqlalchemy import delete, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Document, DocumentBlob, DocumentJobApplication
+from .blob_store import BlobStore, get_blob_store
+
+DEFAULT_PURGE_BATCH_SIZE = 500
+
+
+async def purge_deleted_documents(
+    session: AsyncSession,
+    *,
+    older_than: timedelta = timedelta(0),
+    user_id: uuid.UUID | None = None,
+    batch_size: int = DEFAULT_PURGE_BATCH_SIZE,
+    blob_store: BlobStore | None = None,
+) -> int:
+    """
+    Permanently delete one batch of soft-deleted documents and release their blobs.
+
+    Returns the number of documents purged; call repeatedly until it returns 0 to drain a backlog.
+    """
+    blob_store = blob_store or get_blob_store()
+    cutoff = datetime.now(timezone.utc) - older_than
+    candidates = (
+        select(Document.id)
+        .where(Document.is_deleted == true(), Document.deleted_at <= cutoff)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .execution_options(include_deleted=True)
+    )
+    if user_id is not None:
+        candidates = candidates.where(Document.user_id == user_id)
+    ids = list(await session.scalars(candidates))
+    if not ids:
+        return 0
+
+    await session.execute(delete(DocumentJobApplication).where(DocumentJobApplication.c.document_id.in_(ids)))
+    purged = (
+        await session.execute(
+            delete(Document).where(Document.id.in_(ids)).returning(Document.content_hash, Document.file_path)
+        )
+    ).all()
+    content_hashes = [row.content_hash for row in purged if row.content_hash]
+    await blob_store.release(session, content_hashes)
+    live_blob_paths = set(
+        await session.scalars(
+            select(DocumentBlob.file_path).where(DocumentBlob.content_hash.in_(content_hashes))
+        )
+    )
+    await session.commit()
+
+    # Files uploaded before the blob store existed are private copies, unless a blob still uses them.
+    for row in purged:
+        if row.file_path and row.file_path not in live_blob_paths:
+            await anyio.Path(row.file_path).unlink(missing_ok=True)
+    return len(purged)
@@ -0,0 +1,74 @@
+import uuid
+from typing import List
+
+from sqlalchemy import ColumnElement, false, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import DocumentType
+from ..models import Document
+from ..models.document import SEARCH_CONFIG
+from ..schemas.document_search import DocumentSearchResult
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+
+def escape_html(text: ColumnElement) -> ColumnElement:
+    """
+    Escape `&`, `<` and `>` in a text expression, so it can be embedded in HTML as text.
+    """
+    for character, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        text = func.replace(text, character, entity)
+    return text
+
+
+async def search_documents(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    query: str,
+    *,
+    document_type: DocumentType | None = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+) -> List[DocumentSearchResult]:
+    """
+    Rank a user's live documents against a web-style search query and highlight the matches.
+
+    Matching and ranking run entirely off the GIN-indexed `search_vector`; snippets are only
+    generated for the top `limit` hits because `ts_headline` has to re-parse the raw text.
+    Snippets are built from HTML-escaped text, so the `<mark>` tags are their only markup.
+    """
+    query = query.strip()
+    if not query:
+        return []
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+    rank = func.ts_rank(Document.search_vector, ts_query).label("rank")
+    ranked_stmt = select(Document.id, rank).where(
+        Document.user_id == user_id,
+        Document.is_deleted == false(),
+        Document.search_vector.bool_op("@@")(ts_query),
+    )
+    if document_type is not None:
+        ranked_stmt = ranked_stmt.where(Document.type == document_type)
+    ranked = ranked_stmt.order_by(rank.desc()).limit(limit).subquery()
+
+    snippet = func.ts_headline(
+        SEARCH_CONFIG,
+        escape_html(func.coalesce(Document.content, Document.description, "")),
+        ts_query,
+        HEADLINE_OPTIONS,
+    ).label("snippet")
+    stmt = (
+        select(Document.id, Document.title, Document.type, ranked.c.rank, snippet)
+        .join(ranked, ranked.c.id == Document.id)
+        .order_by(ranked.c.rank.desc(), Document.id)
+    )
+    rows = (await session.execute(stmt)).all()
+    return [
+        DocumentSearchResult(
+            id=row.id, title=row.title, type=row.type, rank=row.rank, snippet=row.snippet or None
+        )
+        for row in rows
+    ]
@@ -0,0 +1,164 @@
+import hashlib
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import anyio
+from fastapi import UploadFile
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import Settings, get_settings
+from ..core.enums import DocumentSource, DocumentStatus, FileType, MimeType
+from ..core.exceptions.base import ValidationError
+from ..models import Document, User
+from ..schemas.document_envelope import DocumentRequest
+from ..utils.file_types import SNIFF_LENGTH, mime_type_for, sniff_file_type
+from ..utils.string_formatters import normalize_tags
+from .blob_store import find_parsed_content, get_blob_store
+from .text_extraction import PARSER_VERSION
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    """
+    An uploaded file that has been streamed to disk.
+    """
+
+    path: Path
+    filename: str
+    size: int
+    sha256: str
+    file_type: FileType
+    mime_type: MimeType
+
+
+async def stream_upload(
+    upload: UploadFile,
+    destination_dir: Path,
+    *,
+    chunk_size: int,
+    max_size: int,
+) -> StoredUpload:
+    """
+    Stream an upload to disk in fixed-size chunks, hashing and sniffing it on the way.
+
+    The file type is detected from the first bytes, so unsupported files and files over
+    `max_size` are rejected before the rest of the body is read.
+    """
+    filename = upload.filename or "upload"
+    if upload.size is not None and upload.size > max_size:
+        raise ValidationError(f"File '{filename}' exceeds the maximum size of {max_size} bytes.")
+
+    await anyio.Path(destination_dir).mkdir(parents=True, exist_ok=True)
+    partial_path = destination_dir / f"{uuid.uuid4()}.part"
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    file_type: FileType | None = None
+
+    try:
+        async with await anyio.open_file(partial_path, "wb") as out:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise ValidationError(f"File '{filename}' exceeds the maximum size of {max_size} bytes.")
+                if file_type is None:
+                    head += chunk[: SNIFF_LENGTH - len(head)]
+                    if len(head) >= SNIFF_LENGTH:
+                        file_type = _checked_file_type(head, filename)
+                digest.update(chunk)
+                await out.write(chunk)
+        if size == 0:
+            raise ValidationError(f"File '{filename}' is empty.")
+        if file_type is None:
+            file_type = _checked_file_type(head, filename)
+        final_path = partial_path.with_suffix(f".{file_type.value}")
+        await anyio.Path(partial_path).rename(final_path)
+    except BaseException:
+        await anyio.Path(partial_path).unlink(missing_ok=True)
+        raise
+
+    return StoredUpload(
+        path=final_path,
+        filename=filename,
+        size=size,
+        sha256=digest.hexdigest(),
+        file_type=file_type,
+        mime_type=mime_type_for(file_type),
+    )
+
+
+def _checked_file_type(head: bytes, filename: str) -> FileType:
+    file_type = sniff_file_type(head, filename)
+    if file_type is FileType.UNKNOWN:
+        raise ValidationError(f"File '{filename}' is not a supported document type.")
+    return file_type
+
+
+async def create_documents_from_uploads(
+    session: AsyncSession,
+    user: User,
+    request: DocumentRequest,
+    settings: Settings | None = None,
+) -> List[uuid.UUID]:
+    """
+    Store every uploaded file and create their `Document` rows with a single bulk insert.
+
+    Files are deduplicated through the blob store, and content that the current parser already
+    extracted from an identical file is copied over so the new document skips parsing entirely.
+    Staged files are removed again if a later file is rejected or the insert fails.
+    """
+    settings = settings or get_settings()
+    blob_store = get_blob_store(settings)
+    stored: List[StoredUpload] = []
+    try:
+        for upload in request.files:
+            stored.append(
+                await stream_upload(
+                    upload,
+                    blob_store.staging_dir,
+                    chunk_size=settings.upload_chunk_size,
+                    max_size=settings.upload_max_file_size,
+                )
+            )
+        blob_paths = await blob_store.acquire(
+            session, {item.path: (item.sha256, item.size) for item in stored}
+        )
+        parsed_content = await find_parsed_content(session, blob_paths)
+
+        tags = normalize_tags(request.tags) or None
+        reused = parsed_content.keys()
+        rows = [
+            {
+                "user_id": user.id,
+                "title": _document_title(request, item),
+                "description": request.description,
+                "tags": tags,
+                "file_path": blob_paths[item.sha256],
+                "content_hash": item.sha256,
+                "file_size": item.size,
+                "file_type": item.file_type,
+                "mime_type": item.mime_type,
+                "content": parsed_content.get(item.sha256),
+                "parser_version": PARSER_VERSION if item.sha256 in reused else None,
+                "status": DocumentStatus.PARSED if item.sha256 in reused else DocumentStatus.UPLOADED,
+                "source": DocumentSource.USER_UPLOAD,
+            }
+            for item in stored
+        ]
+        ids = list(await session.scalars(insert(Document).returning(Document.id), rows))
+        await session.commit()
+    except BaseException:
+        for item in stored:
+            await anyio.Path(item.path).unlink(missing_ok=True)
+        raise
+    return ids
+
+
+def _document_title(request: DocumentRequest, item: StoredUpload) -> str:
+    # A single title only makes sense for a single file; batches fall back to the file names.
+    if request.title and len(request.files) == 1:
+        return request.title
+    return Path(item.filename).stem or item.filename
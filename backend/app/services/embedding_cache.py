@@ -0,0 +1,87 @@
+from typing import Iterable, Mapping
+
+import numpy as np
+from redis.asyncio import Redis
+
+from ..core.config import Settings, get_settings
+from ..db.redis import init_redis
+from .tiered_cache import TieredCache
+
+STORED_DTYPE = np.float16
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of chunk embeddings keyed by chunk hash and embedding model.
+
+    A `TieredCache` like the parse cache, with vectors stored in Redis as raw float16 bytes.
+    Keys include the model name and dimension, so switching models never returns vectors from
+    another embedding space.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        model_name: str,
+        dimension: int,
+        max_entries: int = 16384,
+        ttl: int | None = 30 * 24 * 3600,
+    ):
+        self.model_name = model_name
+        self.dimension = dimension
+        self._cache: TieredCache[np.ndarray] = TieredCache(
+            "Embedding",
+            redis,
+            encode=lambda vector: np.asarray(vector, dtype=STORED_DTYPE).tobytes(),
+            decode=self._decode,
+            max_entries=max_entries,
+            ttl=ttl,
+        )
+
+    @classmethod
+    def from_settings(
+        cls, model_name: str, dimension: int, settings: Settings | None = None
+    ) -> "EmbeddingCache":
+        """
+        Build a cache for a model, configured from the application settings.
+        """
+        settings = settings or get_settings()
+        return cls(
+            init_redis(settings) if settings.embedding_cache_redis_enabled else None,
+            model_name=model_name,
+            dimension=dimension,
+            max_entries=settings.embedding_cache_max_entries,
+            ttl=settings.embedding_cache_ttl,
+        )
+
+    def key(self, chunk_hash: str) -> str:
+        """
+        Return the cache key for a chunk hash under the current model.
+        """
+        return f"embedding:{self.model_name}:{self.dimension}:{chunk_hash}"
+
+    async def get_many(self, chunk_hashes: Iterable[str]) -> dict[str, np.ndarray]:
+        """
+        Return the cached vectors for whichever of the chunk hashes are cached.
+        """
+        keys = {self.key(chunk_hash): chunk_hash for chunk_hash in chunk_hashes}
+        found = await self._cache.get_many(keys)
+        return {keys[key]: vector for key, vector in found.items()}
+
+    async def set_many(self, vectors: Mapping[str, np.ndarray]) -> None:
+        """
+        Store vectors by chunk hash in both tiers.
+        """
+        await self._cache.set_many(
+            {
+                self.key(chunk_hash): np.asarray(vector, dtype=np.float32)
+                for chunk_hash, vector in vectors.items()
+            }
+        )
+
+    def _decode(self, payload: bytes) -> np.ndarray | None:
+        # A payload of the wrong size was written for another dimension or is corrupt.
+        if len(payload) != self.dimension * np.dtype(STORED_DTYPE).itemsize:
+            return None
+        return np.frombuffer(payload, dtype=STORED_DTYPE).astype(np.float32)
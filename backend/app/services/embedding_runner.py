@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config import Settings, get_settings
+from ..core.exceptions.base import ConfigurationError
+from ..models import Document
+from ..utils.chunking import chunk_hash, chunk_text, estimate_tokens
+from .embedding_cache import EmbeddingCache
+from .embeddings import EmbeddingModel, load_embedding_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingChunk:
+    chunk_hash: str
+    text: str
+    tokens: int
+    future: asyncio.Future
+
+
+def plan_batches(lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Group texts into model batches by estimated token length.
+
+    Texts are sorted by length so each batch holds texts of similar size, and a batch grows
+    while its padded size (texts times the longest text) stays within `max_batch_tokens`.
+    Short texts therefore go in large batches and long ones in small batches.
+    """
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        padded = (len(batch) + 1) * max(lengths[index], 1)
+        if batch and (padded > max_batch_tokens or len(batch) >= max_batch_size):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class EmbeddingRunner:
+    """
+    Embeds text chunks for every caller in the process through shared, length-sorted batches.
+
+    - Vectors are looked up by chunk hash first, so unchanged chunks are never embedded twice.
+    - Chunks requested while the same chunk is being embedded share the result.
+    - Misses from all callers, across documents and users, are collected for up to
+      `batch_window` seconds, or while the model is busy, and planned into batches with
+      `plan_batches`.
+    - A single worker runs the model in a thread, one batch at a time, since a CPU model
+      already uses every core for one batch.
+    """
+
+    def __init__(
+        self,
+        model: EmbeddingModel,
+        cache: EmbeddingCache | None = None,
+        *,
+        max_batch_tokens: int = 8192,
+        max_batch_size: int = 64,
+        batch_window: float = 0.02,
+        chunk_max_tokens: int = 256,
+        chunk_min_tokens: int = 32,
+    ):
+        self.model = model
+        self.cache = cache
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.chunk_max_tokens = chunk_max_tokens
+        self.chunk_min_tokens = chunk_min_tokens
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._pending: List[_PendingChunk] = []
+        self._pending_tokens = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._worker: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings | None = None, model: EmbeddingModel | None = None
+    ) -> "EmbeddingRunner":
+        """
+        Build a runner configured from the application settings.
+        """
+        settings = settings or get_settings()
+        model = model or load_embedding_model(settings)
+        return cls(
+            model,
+            EmbeddingCache.from_settings(model.name, model.dimension, settings),
+            max_batch_tokens=settings.embedding_max_batch_tokens,
+            max_batch_size=settings.embedding_max_batch_size,
+            batch_window=settings.embedding_batch_window,
+            chunk_max_tokens=settings.embedding_chunk_max_tokens,
+            chunk_min_tokens=settings.embedding_chunk_min_tokens,
+        )
+
+    def chunk(self, text: str) -> List[str]:
+        """
+        Split text into the chunks this runner embeds.
+        """
+        return chunk_text(text, max_tokens=self.chunk_max_tokens, min_tokens=self.chunk_min_tokens)
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Return one normalized float32 vector per text.
+        """
+        hashes = [chunk_hash(text) for text in texts]
+        vectors = await self.cache.get_many(hashes) if self.cache is not None else {}
+        futures: dict[str, asyncio.Future] = {}
+        for digest, text in zip(hashes, texts):
+            if digest in vectors or digest in futures:
+                continue
+            future = self._inflight.get(digest)
+            futures[digest] = future if future is not None else self._enqueue(digest, text)
+        if futures:
+            results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+            vectors.update(zip(futures, results))
+        if not hashes:
+            return np.empty((0, self.model.dimension), dtype=np.float32)
+        return np.stack([vectors[digest] for digest in hashes])
+
+    async def embed_document(self, content: str) -> tuple[List[str], np.ndarray]:
+        """
+        Chunk a document's content and return the chunks with their vectors.
+        """
+        chunks = self.chunk(content)
+        return chunks, await self.embed(chunks)
+
+    async def aclose(self) -> None:
+        """
+        Embed the chunks still waiting and wait for the worker to finish.
+        """
+        self._start()
+        if self._worker is not None:
+            await asyncio.gather(self._worker, return_exceptions=True)
+
+    def _enqueue(self, digest: str, text: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[digest] = future
+        future.add_done_callback(lambda done: self._forget(digest, done))
+        tokens = estimate_tokens(text)
+        self._pending.append(_PendingChunk(digest, text, tokens, future))
+        self._pending_tokens += tokens
+        if self._worker is not None:
+            return future  # The running worker picks it up next.
+        if self._pending_tokens >= self.max_batch_tokens:
+            self._start()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_window, self._start)
+        return future
+
+    def _forget(self, digest: str, future: asyncio.Future) -> None:
+        if self._inflight.get(digest) is future:
+            del self._inflight[digest]
+        if not future.cancelled():
+            future.exception()  # Mark as retrieved when every waiter has gone away.
+
+    def _start(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._worker is None and self._pending:
+            self._worker = asyncio.create_task(self._work())
+
+    async def _work(self) -> None:
+        try:
+            while self._pending:
+                pending, self._pending, self._pending_tokens = self._pending, [], 0
+                for batch in plan_batches(
+                    [chunk.tokens for chunk in pending], self.max_batch_tokens, self.max_batch_size
+                ):
+                    await self._run_batch([pending[index] for index in batch])
+        finally:
+            self._worker = None
+            if self._pending:
+                self._start()
+
+    async def _run_batch(self, batch: List[_PendingChunk]) -> None:
+        try:
+            vectors = await asyncio.to_thread(self.model.embed, [chunk.text for chunk in batch])
+        except Exception as e:
+            logger.exception("Embedding a batch of %d chunks failed", len(batch))
+            for chunk in batch:
+                if not chunk.future.done():
+                    chunk.future.set_exception(e)
+            return
+        for chunk, vector in zip(batch, vectors):
+            if not chunk.future.done():
+                chunk.future.set_result(vector)
+        if self.cache is not None:
+            await self.cache.set_many({chunk.chunk_hash: vector for chunk, vector in zip(batch, vectors)})
+
+
+async def backfill_embeddings(
+    session_factory: async_sessionmaker[AsyncSession],
+    runner: EmbeddingRunner,
+    *,
+    user_id: uuid.UUID | None = None,
+    page_size: int = 200,
+) -> int:
+    """
+    Embed the chunks of every parsed document, optionally for a single user, into the cache.
+
+    Each page of documents is embedded concurrently, so chunks from many documents share
+    batches. Returns the number of chunks processed, cached ones included.
+    """
+    processed = 0
+    after: uuid.UUID | None = None
+    while True:
+        query = select(Document.id, Document.content).where(
+            Document.content.is_not(None), Document.is_deleted == false()
+        )
+        if user_id is not None:
+            query = query.where(Document.user_id == user_id)
+        if after is not None:
+            query = query.where(Document.id > after)
+        async with session_factory() as session:
+            rows = (await session.execute(query.order_by(Document.id).limit(page_size))).all()
+        if not rows:
+            return processed
+        results = await asyncio.gather(*(runner.embed_document(row.content) for row in rows))
+        processed += sum(len(chunks) for chunks, _ in results)
+        after = rows[-1].id
+
+
+_runner: EmbeddingRunner | None = None
+
+
+def init_embedding_runner(settings: Settings | None = None) -> EmbeddingRunner:
+    """
+    Create the shared runner if it does not exist yet, loading the embedding model.
+    """
+    global _runner
+    if _runner is None:
+        _runner = EmbeddingRunner.from_settings(settings)
+    return _runner
+
+
+async def close_embedding_runner() -> None:
+    """
+    Drain the shared runner.
+    """
+    global _runner
+    if _runner is not None:
+        await _runner.aclose()
+    _runner = None
+
+
+def get_embedding_runner() -> EmbeddingRunner:
+    """
+    Return the shared runner, raising if the application has not initialized it.
+    """
+    if _runner is None:
+        raise ConfigurationError("Embedding runner is not initialized.")
+    return _runner
@@ -0,0 +1,110 @@
+import hashlib
+from functools import lru_cache
+from typing import Protocol, Sequence
+
+import numpy as np
+
+from ..core.config import Settings
+from ..core.exceptions.base import ConfigurationError
+from ..utils.terms import tokenize
+
+HASHING_MODEL = "hashing"
+
+
+class EmbeddingModel(Protocol):
+    """
+    A local text embedding model.
+
+    `embed` returns one L2-normalized float32 row per text and is CPU-bound, so async callers
+    run it in a worker thread.
+    """
+
+    name: str
+    dimension: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    Scale each row to unit length, leaving all-zero rows as they are.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+@lru_cache(maxsize=65536)
+def _feature(feature: str, dimension: int) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dimension, 1.0 if digest >> 63 else -1.0
+
+
+class HashingEmbeddingModel:
+    """
+    Dependency-free embedding model that hashes terms and their character trigrams.
+
+    Trigrams make spelling variants such as "postgres" and "postgresql" land close together,
+    but the model has no notion of meaning: synonyms such as "k8s" and "kubernetes" need a
+    learned model. It is meant for development and as a fallback.
+    """
+
+    def __init__(self, dimension: int = 384):
+        self.name = HASHING_MODEL
+        self.dimension = dimension
+
+    def _features(self, text: str) -> list[str]:
+        features = []
+        for term in tokenize(text):
+            features.append(term)
+            padded = f"<{term}>"
+            features.extend(f"#{padded[i : i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                column, sign = _feature(feature, self.dimension)
+                vectors[row, column] += sign
+        return normalize_rows(vectors)
+
+
+class SentenceTransformerModel:
+    """
+    Embedding model backed by a sentence-transformers checkpoint, run on the CPU.
+
+    Requires the optional `embeddings` dependencies. Each call to `embed` is encoded as one
+    batch; the embedding runner decides how texts are batched.
+    """
+
+    def __init__(self, name: str, *, device: str = "cpu"):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
+            raise ConfigurationError(
+                f"Embedding model '{name}' requires the sentence-transformers package; install the "
+                f"'embeddings' extra or set embedding_model to '{HASHING_MODEL}'."
+            ) from exc
+        self.name = name
+        self._model = SentenceTransformer(name, device=device)
+        self.dimension = self._model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = self._model.encode(
+            list(texts),
+            batch_size=max(1, len(texts)),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dimension)
+
+
+def load_embedding_model(settings: Settings) -> EmbeddingModel:
+    """
+    Create the embedding model named in the settings.
+    """
+    if settings.embedding_model == HASHING_MODEL:
+        return HashingEmbeddingModel(settings.embedding_dimension)
+    return SentenceTransformerModel(settings.embedding_model)
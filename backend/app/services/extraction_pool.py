@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.queues import SimpleQueue
+from pathlib import Path
+
+from ..core.config import Settings, get_settings
+from ..core.enums import FileType
+from .text_extraction import extract_text
+
+logger = logging.getLogger(__name__)
+
+
+def _report_pid(pids: SimpleQueue) -> None:
+    # Pool process initializer: tells the parent which processes to kill if an extraction hangs.
+    pids.put(os.getpid())
+
+
+def _extract_file(path: str, file_type: str) -> str:
+    # Runs in a pool process; only the path and file type cross the process boundary.
+    return extract_text(path, file_type)
+
+
+class ExtractionPool:
+    """
+    Process pool for CPU-bound text extraction.
+
+    Each process parses one file at a time, so extraction scales across cores instead of
+    contending for the GIL. Processes are recycled after about `max_tasks_per_child` files each
+    to contain leaks in the parsing libraries, and a file that runs past `timeout` seconds has
+    its pool torn down and replaced, since a hung process cannot be interrupted any other way.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_tasks_per_child: int | None = 50,
+        timeout: float | None = 120.0,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.timeout = timeout
+        self._recycle_after = self.max_workers * max_tasks_per_child if max_tasks_per_child else None
+        self._executor: ProcessPoolExecutor | None = None
+        # PIDs reported by each live executor's processes as they start.
+        self._worker_pids: dict[ProcessPoolExecutor, SimpleQueue] = {}
+        self._submitted = 0
+        self._closed = False
+        # Jobs wait here rather than in the executor queue, so the timeout only covers parsing.
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> "ExtractionPool":
+        """
+        Build a pool configured from the application settings.
+        """
+        settings = settings or get_settings()
+        return cls(
+            max_workers=settings.document_parser_processes,
+            max_tasks_per_child=settings.document_parser_max_tasks_per_child,
+            timeout=settings.document_parser_timeout,
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._closed:
+            raise RuntimeError("Extraction pool has been shut down.")
+        if self._executor is not None and self._recycle_after and self._submitted >= self._recycle_after:
+            # Retire the whole pool generation: running jobs finish, new ones go to fresh processes.
+            # ProcessPoolExecutor's own max_tasks_per_child can deadlock on Python 3.11.
+            self._executor.shutdown(wait=False)
+            self._worker_pids.pop(self._executor, None)
+            self._executor = None
+        if self._executor is None:
+            # Spawned processes do not inherit the event loop or open database connections.
+            context = multiprocessing.get_context("spawn")
+            pids = context.SimpleQueue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=context,
+                initializer=_report_pid,
+                initargs=(pids,),
+            )
+            self._worker_pids[self._executor] = pids
+            self._submitted = 0
+        self._submitted += 1
+        return self._executor
+
+    async def extract(self, path: Path, file_type: FileType) -> str:
+        """
+        Extract a file's text in a pool process.
+
+        Raises TimeoutError if the file takes longer than the configured timeout. Jobs that were
+        running in the same pool when it is replaced fail with BrokenProcessPool and can be retried.
+        """
+        async with self._slots:
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(executor, _extract_file, str(path), FileType(file_type).value)
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Extracting %s timed out after %ss, restarting extraction pool", path, self.timeout
+                )
+                self._discard(executor)
+                raise TimeoutError(f"Extracting '{path}' timed out after {self.timeout} seconds.") from None
+            except BrokenProcessPool:
+                self._discard(executor)
+                raise
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        # Several jobs can fail on the same broken pool; only the first one replaces it.
+        if self._executor is executor:
+            self._executor = None
+        self._terminate(executor)
+
+    def shutdown(self) -> None:
+        """
+        Stop all pool processes, abandoning any extraction still running.
+        """
+        self._closed = True
+        if self._executor is not None:
+            self._terminate(self._executor)
+            self._executor = None
+
+    def _terminate(self, executor: ProcessPoolExecutor) -> None:
+        # ProcessPoolExecutor.shutdown() waits for running jobs, which never finish when one is hung.
+        pids = self._worker_pids.pop(executor, None)
+        while pids is not None and not pids.empty():
+            try:
+                os.kill(pids.get(), signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
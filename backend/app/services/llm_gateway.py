@@ -0,0 +1,441 @@
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import AsyncIterator, Hashable, List
+
+import httpx
+
+from ..core.config import Settings, get_settings
+from ..core.exceptions.base import ConfigurationError, ExternalServiceError, RateLimitExceededError
+
+logger = logging.getLogger(__name__)
+
+PROVIDER = "LLM provider"
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 20.0  # seconds
+
+
+class _Abandoned(Exception):
+    """
+    Set on a shared completion whose caller went away before it was sent, so a waiter takes over.
+    """
+
+
+@dataclass(frozen=True)
+class CompletionRequest:
+    """
+    A single prompt to complete. Equal requests are coalesced while one is in flight.
+    """
+
+    prompt: str
+    max_tokens: int = 1024
+    temperature: float = 0.0
+
+    @property
+    def batch_key(self) -> tuple[int, float]:
+        # Only prompts sharing their sampling parameters can go out in the same provider call.
+        return self.max_tokens, self.temperature
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to `capacity` tokens and refilling at `rate` tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take `tokens` from the bucket if that many are available.
+        """
+        self._refill()
+        if self.tokens < tokens:
+            return False
+        self.tokens -= tokens
+        return True
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """
+        Put back tokens taken for a request that was not sent after all.
+        """
+        self.tokens = min(self.capacity, self.tokens + tokens)
+
+
+class LLMGateway:
+    """
+    Single entry point for LLM completions.
+
+    - Identical requests already in flight share one provider call.
+    - Requests with the same sampling parameters are collected for up to `batch_window` seconds
+      and sent together, up to `batch_size` prompts per call.
+    - Each user may have `user_concurrency` requests outstanding, and at most `max_concurrency`
+      provider calls run at once.
+    - Token buckets per user and for the whole process reject bursts with RateLimitExceededError
+      before they reach the provider.
+    - Transient provider failures are retried with exponential backoff; a request that still
+      fails raises ExternalServiceError.
+
+    The provider is any OpenAI-compatible `/completions` endpoint, so a local stub server can
+    stand in for it by pointing `base_url` (or an injected `httpx.AsyncClient`) at it. Limits
+    are enforced per process.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        model: str,
+        max_retries: int = 3,
+        max_concurrency: int = 8,
+        user_concurrency: int = 2,
+        user_rate: float = 1.0,
+        user_burst: int = 10,
+        global_rate: float = 10.0,
+        global_burst: int = 50,
+        batch_size: int = 8,
+        batch_window: float = 0.05,
+    ):
+        self.client = client
+        self.model = model
+        self.max_retries = max_retries
+        self.user_concurrency = user_concurrency
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._global_semaphore = asyncio.Semaphore(max_concurrency)
+        self._global_bucket = TokenBucket(global_rate, global_burst)
+        self._user_buckets: dict[Hashable, TokenBucket] = {}
+        self._user_semaphores: weakref.WeakValueDictionary[Hashable, asyncio.Semaphore] = (
+            weakref.WeakValueDictionary()
+        )
+        self._inflight: dict[CompletionRequest, asyncio.Future] = {}
+        self._batches: dict[tuple[int, float], List[tuple[CompletionRequest, asyncio.Future]]] = {}
+        self._batch_timers: dict[tuple[int, float], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings | None = None, client: httpx.AsyncClient | None = None
+    ) -> "LLMGateway":
+        """
+        Build a gateway configured from the application settings.
+        """
+        settings = settings or get_settings()
+        if client is None:
+            headers = {"Authorization": f"Bearer {settings.llm_api_key}"} if settings.llm_api_key else {}
+            client = httpx.AsyncClient(
+                base_url=settings.llm_base_url, headers=headers, timeout=settings.llm_timeout
+            )
+        return cls(
+            client,
+            model=settings.llm_model,
+            max_retries=settings.llm_max_retries,
+            max_concurrency=settings.llm_max_concurrency,
+            user_concurrency=settings.llm_user_concurrency,
+            user_rate=settings.llm_user_rate_limit / 60,
+            user_burst=settings.llm_user_burst,
+            global_rate=settings.llm_global_rate_limit / 60,
+            global_burst=settings.llm_global_burst,
+            batch_size=settings.llm_batch_size,
+            batch_window=settings.llm_batch_window,
+        )
+
+    async def complete(self, request: CompletionRequest, *, user_id: uuid.UUID | None = None) -> str:
+        """
+        Return the completion for a prompt.
+
+        Raises RateLimitExceededError when the user or the process is over its rate limit and
+        ExternalServiceError when the provider keeps failing.
+        """
+        while True:
+            shared = self._inflight.get(request)
+            if shared is None:
+                return await self._complete(request, user_id)
+            try:
+                return await asyncio.shield(shared)
+            except _Abandoned:
+                # Whoever started the call was cancelled before sending it; the first waiter to
+                # get here sends it instead and the others coalesce onto that call.
+                continue
+
+    async def _complete(self, request: CompletionRequest, user_id: uuid.UUID | None) -> str:
+        self._charge(user_id)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request] = future
+        future.add_done_callback(lambda done: self._forget(request, done))
+        enqueued = False
+        try:
+            async with self._user_semaphore(user_id) if user_id is not None else contextlib.nullcontext():
+                self._enqueue(request, future)
+                enqueued = True
+                return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # A request that never made it into a batch would leave coalesced waiters hanging.
+            if not enqueued:
+                self._refund(user_id)
+                future.set_exception(_Abandoned())
+            raise
+
+    async def stream(
+        self, request: CompletionRequest, *, user_id: uuid.UUID | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield a completion as the provider generates it.
+
+        Streamed requests are neither batched nor coalesced, but count against the same rate
+        limits and concurrency caps. Failures are retried only until the first chunk arrives.
+        """
+        self._charge(user_id)
+        user_semaphore = self._user_semaphore(user_id) if user_id is not None else contextlib.nullcontext()
+        async with user_semaphore, self._global_semaphore:
+            payload = {
+                "model": self.model,
+                "prompt": request.prompt,
+                "max_tokens": request.max_tokens,
+                "temperature": request.temperature,
+                "stream": True,
+            }
+            attempts = self.max_retries + 1
+            for attempt in range(1, attempts + 1):
+                started = False
+                retry_after = None
+                try:
+                    async with self.client.stream("POST", "/completions", json=payload) as response:
+                        if response.status_code in RETRYABLE_STATUS_CODES:
+                            error = f"status {response.status_code}"
+                            retry_after = _retry_after(response)
+                        elif response.is_error:
+                            raise ExternalServiceError(
+                                PROVIDER, f"request failed with status {response.status_code}."
+                            )
+                        else:
+                            async for delta in _stream_deltas(response):
+                                started = True
+                                yield delta
+                            return
+                except httpx.HTTPError as e:
+                    if started:
+                        raise ExternalServiceError(PROVIDER, "stream was interrupted.") from e
+                    error = f"{type(e).__name__}: {e}"
+                if attempt == attempts:
+                    break
+                delay = self._retry_delay(attempt, retry_after)
+                logger.warning(
+                    "LLM stream failed (%s, attempt %d/%d), retrying in %.1fs",
+                    error,
+                    attempt,
+                    attempts,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            raise ExternalServiceError(PROVIDER, f"request failed after {attempts} attempts ({error}).")
+
+    async def aclose(self) -> None:
+        """
+        Send out pending batches, wait for calls in flight and close the HTTP client.
+        """
+        for key in list(self._batches):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.aclose()
+
+    def _charge(self, user_id: Hashable | None) -> None:
+        bucket = self._user_bucket(user_id) if user_id is not None else None
+        if bucket is not None and not bucket.try_acquire():
+            raise RateLimitExceededError("Too many assistant requests, please slow down.")
+        if not self._global_bucket.try_acquire():
+            if bucket is not None:
+                bucket.refund()
+            raise RateLimitExceededError("The assistant is busy, please try again shortly.")
+
+    def _refund(self, user_id: Hashable | None) -> None:
+        # Gives back the tokens `_charge` took for a request that was never sent.
+        if user_id is not None:
+            self._user_bucket(user_id).refund()
+        self._global_bucket.refund()
+
+    def _user_bucket(self, user_id: Hashable) -> TokenBucket:
+        bucket = self._user_buckets.get(user_id)
+        if bucket is None:
+            if len(self._user_buckets) >= 10_000:
+                # A full bucket holds no state worth keeping.
+                self._user_buckets = {key: b for key, b in self._user_buckets.items() if not b.is_full}
+            bucket = self._user_buckets[user_id] = TokenBucket(self.user_rate, self.user_burst)
+        return bucket
+
+    def _user_semaphore(self, user_id: Hashable) -> asyncio.Semaphore:
+        semaphore = self._user_semaphores.get(user_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.user_concurrency)
+            self._user_semaphores[user_id] = semaphore
+        return semaphore
+
+    def _forget(self, request: CompletionRequest, future: asyncio.Future) -> None:
+        if self._inflight.get(request) is future:
+            del self._inflight[request]
+        if not future.cancelled():
+            future.exception()  # Mark as retrieved when every waiter has gone away.
+
+    def _enqueue(self, request: CompletionRequest, future: asyncio.Future) -> None:
+        key = request.batch_key
+        batch = self._batches.setdefault(key, [])
+        batch.append((request, future))
+        if len(batch) >= self.batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._batch_timers[key] = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush, key
+            )
+
+    def _flush(self, key: tuple[int, float]) -> None:
+        timer = self._batch_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = [(request, future) for request, future in self._batches.pop(key, []) if not future.done()]
+        if batch:
+            task = asyncio.create_task(self._send_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: List[tuple[CompletionRequest, asyncio.Future]]) -> None:
+        max_tokens, temperature = batch[0][0].batch_key
+        try:
+            async with self._global_semaphore:
+                texts = await self._post_with_retries(
+                    [request.prompt for request, _ in batch], max_tokens, temperature
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), text in zip(batch, texts):
+            if not future.done():
+                future.set_result(text)
+
+    async def _post_with_retries(self, prompts: List[str], max_tokens: int, temperature: float) -> List[str]:
+        payload = {
+            "model": self.model,
+            "prompt": prompts,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        attempts = self.max_retries + 1
+        for attempt in range(1, attempts + 1):
+            retry_after = None
+            try:
+                response = await self.client.post("/completions", json=payload)
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    if response.is_error:
+                        raise ExternalServiceError(
+                            PROVIDER, f"request failed with status {response.status_code}."
+                        )
+                    return self._parse_completions(response, len(prompts))
+                error = f"status {response.status_code}"
+                retry_after = _retry_after(response)
+            if attempt == attempts:
+                break
+            delay = self._retry_delay(attempt, retry_after)
+            logger.warning(
+                "LLM request failed (%s, attempt %d/%d), retrying in %.1fs", error, attempt, attempts, delay
+            )
+            await asyncio.sleep(delay)
+        raise ExternalServiceError(PROVIDER, f"request failed after {attempts} attempts ({error}).")
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: float | None) -> float:
+        if retry_after is not None:
+            return retry_after
+        return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _parse_completions(response: httpx.Response, expected: int) -> List[str]:
+        try:
+            choices = sorted(response.json()["choices"], key=lambda choice: choice["index"])
+            texts = [choice["text"] for choice in choices]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ExternalServiceError(PROVIDER, "returned a malformed response.") from e
+        if len(texts) != expected:
+            raise ExternalServiceError(PROVIDER, f"returned {len(texts)} completions for {expected} prompts.")
+        return texts
+
+
+async def _stream_deltas(response: httpx.Response) -> AsyncIterator[str]:
+    # Server-sent events as sent by OpenAI-compatible APIs: `data: {...}` lines ending with `data: [DONE]`.
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:") :].strip()
+        if data == "[DONE]":
+            return
+        try:
+            delta = json.loads(data)["choices"][0]["text"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise ExternalServiceError(PROVIDER, "returned a malformed stream.") from e
+        if delta:
+            yield delta
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return min(RETRY_MAX_DELAY, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+_gateway: LLMGateway | None = None
+
+
+def init_llm_gateway(settings: Settings | None = None) -> LLMGateway:
+    """
+    Create the shared gateway if it does not exist yet.
+    """
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway.from_settings(settings)
+    return _gateway
+
+
+async def close_llm_gateway() -> None:
+    """
+    Drain and close the shared gateway.
+    """
+    global _gateway
+    if _gateway is not None:
+        await _gateway.aclose()
+    _gateway = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    Return the shared gateway, raising if the application has not initialized it.
+    """
+    if _gateway is None:
+        raise ConfigurationError("LLM gateway is not initialized.")
+    return _gateway
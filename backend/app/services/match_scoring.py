@@ -0,0 +1,249 @@
+import re
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from ..core.enums import SkillProficiency
+from ..schemas.document_content import JobDescription
+from ..schemas.document_content.profile import ProfessionalProfileStructure, Skill
+from ..utils.terms import Tokenizer, term_set, tokenize
+
+PROFICIENCY_WEIGHTS: dict[SkillProficiency, float] = {
+    SkillProficiency.EXPERIENCED: 1.0,
+    SkillProficiency.PROFICIENT: 0.85,
+    SkillProficiency.FAMILIAR_WITH: 0.55,
+}
+# Weight of a term that only shows up in experience bullets, summaries or certifications.
+MENTION_WEIGHT = 0.6
+REQUIRED_WEIGHT = 0.75
+PREFERRED_WEIGHT = 0.25
+# A requirement counts as met once this share of its weighted terms is covered.
+MET_THRESHOLD = 0.6
+
+YEARS_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+
+
+def years_factor(years: int | None) -> float:
+    """
+    Scale a skill's weight by experience: from 0.5 with no experience up to 1.0 at five years.
+    """
+    if years is None:
+        return 0.8
+    return min(1.0, 0.5 + years / 10)
+
+
+def skill_weight(skill: Skill) -> float:
+    """
+    Return how strongly a skill counts as evidence, between 0 and 1.
+    """
+    return PROFICIENCY_WEIGHTS.get(skill.proficiency, MENTION_WEIGHT) * years_factor(
+        skill.years_of_experience
+    )
+
+
+@dataclass(frozen=True)
+class ResumeProfile:
+    """
+    Normalized, precomputed view of a resume used for scoring.
+
+    `skill_weights` maps each term of a listed skill to the strongest evidence for it, and
+    `skill_years` to the most years of experience claimed for it. `terms` holds every term
+    mentioned anywhere in the resume.
+    """
+
+    skill_weights: dict[str, float]
+    skill_years: dict[str, int]
+    terms: frozenset[str]
+
+    def term_weight(self, term: str) -> float:
+        # Listing a skill never counts for less than merely mentioning it.
+        mentioned = MENTION_WEIGHT if term in self.terms else 0.0
+        return max(self.skill_weights.get(term, 0.0), mentioned)
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """
+    A single job qualification with its normalized terms.
+    """
+
+    text: str
+    required: bool
+    terms: frozenset[str]
+    years: int | None
+
+
+@dataclass(frozen=True)
+class JobProfile:
+    """
+    Normalized, precomputed view of a job description's qualifications used for scoring.
+    """
+
+    requirements: tuple[Requirement, ...]
+
+    @property
+    def required(self) -> tuple[Requirement, ...]:
+        return tuple(requirement for requirement in self.requirements if requirement.required)
+
+    @property
+    def preferred(self) -> tuple[Requirement, ...]:
+        return tuple(requirement for requirement in self.requirements if not requirement.required)
+
+
+@dataclass(frozen=True)
+class RequirementMatch:
+    """
+    How well a resume covers one requirement.
+    """
+
+    requirement: Requirement
+    score: float
+    matched_terms: frozenset[str]
+    missing_terms: frozenset[str]
+
+    @property
+    def met(self) -> bool:
+        return self.score >= MET_THRESHOLD
+
+
+@dataclass(frozen=True)
+class MatchScore:
+    """
+    Result of scoring a resume against a job description.
+
+    `score` and both coverages range from 0 to 1; `gaps` lists the requirements that are not
+    met, most important first.
+    """
+
+    score: float
+    required_coverage: float
+    preferred_coverage: float
+    matches: tuple[RequirementMatch, ...]
+    gaps: tuple[RequirementMatch, ...]
+
+
+def build_resume_profile(
+    profile: ProfessionalProfileStructure, tokenizer: Tokenizer = tokenize
+) -> ResumeProfile:
+    """
+    Precompute the term sets and skill weights of a resume or master list.
+
+    Pass the skill taxonomy's `terms` as `tokenizer` to match skills by canonical id, so that
+    e.g. "JS" on the resume covers "JavaScript" in the job description.
+    """
+    skill_weights: dict[str, float] = {}
+    skill_years: dict[str, int] = {}
+    for section in profile.skills:
+        for skill in section.skills:
+            weight = skill_weight(skill)
+            for term in tokenizer(skill.name):
+                skill_weights[term] = max(weight, skill_weights.get(term, 0.0))
+                if skill.years_of_experience is not None:
+                    skill_years[term] = max(skill.years_of_experience, skill_years.get(term, 0))
+
+    texts: List[str | None] = [profile.summary]
+    texts.extend(skill.name for section in profile.skills for skill in section.skills)
+    texts.extend(skill.context for section in profile.skills for skill in section.skills)
+    texts.extend(
+        certification.name for section in profile.certifications for certification in section.certifications
+    )
+    for section in profile.experience:
+        for experience in section.experiences:
+            texts.append(experience.job_title)
+            texts.extend(experience.bullet_points)
+    for section in profile.education:
+        for education in section.education:
+            texts.extend([education.degree, education.field_of_study])
+            texts.extend(education.bullet_points)
+    return ResumeProfile(
+        skill_weights=skill_weights, skill_years=skill_years, terms=term_set(texts, tokenizer)
+    )
+
+
+def _requirement(text: str, required: bool, tokenizer: Tokenizer) -> Requirement:
+    years = YEARS_PATTERN.search(text)
+    return Requirement(
+        text=text,
+        required=required,
+        terms=frozenset(tokenizer(text)),
+        years=int(years.group(1)) if years else None,
+    )
+
+
+def build_job_profile(job: JobDescription, tokenizer: Tokenizer = tokenize) -> JobProfile:
+    """
+    Precompute the normalized requirements of a job description.
+
+    Requirements without any meaningful term are dropped, since nothing could ever match them.
+    Use the same `tokenizer` as for the resumes it is scored against.
+    """
+    qualifications = job.qualifications
+    if qualifications is None:
+        return JobProfile(requirements=())
+    requirements = [_requirement(text, True, tokenizer) for text in qualifications.required]
+    requirements.extend(_requirement(text, False, tokenizer) for text in qualifications.preferred)
+    return JobProfile(requirements=tuple(requirement for requirement in requirements if requirement.terms))
+
+
+def match_requirement(resume: ResumeProfile, requirement: Requirement) -> RequirementMatch:
+    """
+    Score how well a resume covers a single requirement.
+    """
+    matched = requirement.terms & resume.terms
+    score = sum(resume.term_weight(term) for term in matched) / len(requirement.terms)
+    if requirement.years and matched:
+        claimed = max((resume.skill_years.get(term, 0) for term in matched), default=0)
+        if claimed:
+            score *= min(1.0, claimed / requirement.years)
+    return RequirementMatch(
+        requirement=requirement,
+        score=score,
+        matched_terms=matched,
+        missing_terms=requirement.terms - matched,
+    )
+
+
+def _coverage(matches: Sequence[RequirementMatch]) -> float | None:
+    if not matches:
+        return None
+    return sum(match.score for match in matches) / len(matches)
+
+
+def score_match(resume: ResumeProfile, job: JobProfile) -> MatchScore:
+    """
+    Score a resume against a job description.
+
+    The overall score blends required and preferred coverage; when a job lists only one kind,
+    that kind carries the whole score. A job without requirements has nothing left uncovered,
+    so it scores 1 like both of its coverages.
+    """
+    matches = tuple(match_requirement(resume, requirement) for requirement in job.requirements)
+    required_coverage = _coverage([match for match in matches if match.requirement.required])
+    preferred_coverage = _coverage([match for match in matches if not match.requirement.required])
+    if required_coverage is None and preferred_coverage is None:
+        score = 1.0
+    elif preferred_coverage is None:
+        score = required_coverage
+    elif required_coverage is None:
+        score = preferred_coverage
+    else:
+        score = REQUIRED_WEIGHT * required_coverage + PREFERRED_WEIGHT * preferred_coverage
+
+    def importance(match: RequirementMatch) -> float:
+        weight = REQUIRED_WEIGHT if match.requirement.required else PREFERRED_WEIGHT
+        return weight * (1.0 - match.score)
+
+    gaps = tuple(sorted((match for match in matches if not match.met), key=importance, reverse=True))
+    return MatchScore(
+        score=score,
+        required_coverage=required_coverage if required_coverage is not None else 1.0,
+        preferred_coverage=preferred_coverage if preferred_coverage is not None else 1.0,
+        matches=matches,
+        gaps=gaps,
+    )
+
+
+def score_all(resumes: Sequence[ResumeProfile], jobs: Sequence[JobProfile]) -> List[List[MatchScore]]:
+    """
+    Score every resume against every job; `result[i][j]` is resume `i` against job `j`.
+    """
+    return [[score_match(resume, job) for job in jobs] for resume in resumes]
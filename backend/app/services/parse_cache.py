@@ -0,0 +1,79 @@
+import logging
+
+from pydantic import ValidationError as PydanticValidationError
+from redis.asyncio import Redis
+
+from ..core.config import Settings, get_settings
+from ..db.redis import init_redis
+from ..schemas.parse_result import ParseResult
+from .text_extraction import PARSER_VERSION
+from .tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+def _decode(payload: bytes) -> ParseResult | None:
+    try:
+        return ParseResult.model_validate_json(payload)
+    except PydanticValidationError:
+        # Written by an incompatible schema; treat as a miss and let the next set replace it.
+        logger.warning("Discarding unreadable parse cache entry")
+        return None
+
+
+class ParseCache:
+    """
+    Two-tier cache of parse results keyed by file content hash and parser version.
+
+    A `TieredCache` of validated `ParseResult` JSON, so a hit can be used without re-parsing.
+    Bumping `PARSER_VERSION` changes every key, which invalidates all earlier results at once;
+    the stale Redis entries simply expire.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        max_entries: int = 1024,
+        ttl: int | None = 7 * 24 * 3600,
+        parser_version: int = PARSER_VERSION,
+    ):
+        self.parser_version = parser_version
+        self._cache: TieredCache[ParseResult] = TieredCache(
+            "Parse",
+            redis,
+            encode=ParseResult.model_dump_json,
+            decode=_decode,
+            max_entries=max_entries,
+            ttl=ttl,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> "ParseCache":
+        """
+        Build a cache configured from the application settings.
+        """
+        settings = settings or get_settings()
+        return cls(
+            init_redis(settings) if settings.parse_cache_redis_enabled else None,
+            max_entries=settings.parse_cache_max_entries,
+            ttl=settings.parse_cache_ttl,
+        )
+
+    def key(self, content_hash: str) -> str:
+        """
+        Return the cache key for a content hash under the current parser version.
+        """
+        return f"parse:v{self.parser_version}:{content_hash}"
+
+    async def get(self, content_hash: str) -> ParseResult | None:
+        """
+        Return the cached parse result for a content hash, or None on a miss.
+        """
+        return await self._cache.get(self.key(content_hash))
+
+    async def set(self, content_hash: str, result: ParseResult) -> None:
+        """
+        Store a parse result in both tiers.
+        """
+        await self._cache.set(self.key(content_hash), result)
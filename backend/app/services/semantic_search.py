@@ -0,0 +1,236 @@
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Annotated, Callable, Collection, Iterable, List, Sequence
+
+import numpy as np
+import pydantic
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import Settings
+from ..core.enums import PassageKind, VectorSearchMode
+from ..models import Document
+from ..schemas.document_content import AllDocumentContent, JobDescription
+from ..schemas.document_content.profile import ProfessionalProfileStructure
+from ..utils.chunking import chunk_text
+from .embedding_runner import EmbeddingRunner
+from .vector_index import APPROXIMATE_MIN_SIZE, VectorIndex
+
+KIND_TAGS = {kind: tag for tag, kind in enumerate(PassageKind)}
+
+_content_adapter = pydantic.TypeAdapter(
+    Annotated[AllDocumentContent, pydantic.Field(discriminator="document_type")]
+)
+
+
+@dataclass(frozen=True)
+class Passage:
+    """
+    A piece of a document that is embedded and searched on its own.
+
+    `context` says where the passage came from, e.g. the role an experience bullet belongs to.
+    """
+
+    document_id: uuid.UUID
+    kind: PassageKind
+    text: str
+    context: str | None = None
+
+
+@dataclass(frozen=True)
+class PassageMatch:
+    """
+    A passage and its cosine similarity to a search query.
+    """
+
+    passage: Passage
+    score: float
+
+
+def profile_passages(document_id: uuid.UUID, profile: ProfessionalProfileStructure) -> List[Passage]:
+    """
+    Split a resume or master list into its summary, skills, bullets and credentials.
+    """
+    passages = [Passage(document_id, PassageKind.SUMMARY, profile.summary)]
+    for section in profile.skills:
+        for skill in section.skills:
+            text = f"{skill.name}: {skill.context}" if skill.context else skill.name
+            passages.append(Passage(document_id, PassageKind.SKILL, text, section.title))
+    for section in profile.experience:
+        for experience in section.experiences:
+            role = f"{experience.job_title} at {experience.company_name}"
+            passages.extend(
+                Passage(document_id, PassageKind.EXPERIENCE_BULLET, bullet, role)
+                for bullet in experience.bullet_points
+            )
+    for section in profile.education:
+        for education in section.education:
+            degree = f"{education.degree}, {education.institution_name}"
+            passages.append(Passage(document_id, PassageKind.EDUCATION, degree))
+            passages.extend(
+                Passage(document_id, PassageKind.EDUCATION, bullet, degree)
+                for bullet in education.bullet_points
+            )
+    for section in profile.certifications:
+        passages.extend(
+            Passage(
+                document_id, PassageKind.CERTIFICATION, certification.name, certification.issuing_organization
+            )
+            for certification in section.certifications
+        )
+    return passages
+
+
+def job_description_passages(document_id: uuid.UUID, job: JobDescription) -> List[Passage]:
+    """
+    Split a job description into its responsibilities and qualifications.
+    """
+    passages = [
+        Passage(document_id, PassageKind.RESPONSIBILITY, responsibility)
+        for responsibility in job.responsibilities or []
+    ]
+    if job.qualifications is not None:
+        passages.extend(
+            Passage(document_id, PassageKind.REQUIRED_QUALIFICATION, text)
+            for text in job.qualifications.required
+        )
+        passages.extend(
+            Passage(document_id, PassageKind.PREFERRED_QUALIFICATION, text)
+            for text in job.qualifications.preferred
+        )
+    return passages
+
+
+def text_passages(document_id: uuid.UUID, chunks: Iterable[str]) -> List[Passage]:
+    """
+    Wrap plain-text chunks as passages.
+    """
+    return [Passage(document_id, PassageKind.TEXT, chunk) for chunk in chunks]
+
+
+def document_passages(
+    document_id: uuid.UUID, content: str | None, chunk: Callable[[str], List[str]] = chunk_text
+) -> List[Passage]:
+    """
+    Return the passages of a document's content.
+
+    Structured resumes, master lists and job descriptions are split by section; any other
+    content is split into chunks with `chunk`.
+    """
+    if not content:
+        return []
+    try:
+        structured = _content_adapter.validate_json(content)
+    except pydantic.ValidationError:
+        return text_passages(document_id, chunk(content))
+    if isinstance(structured, ProfessionalProfileStructure):
+        passages = profile_passages(document_id, structured)
+    elif isinstance(structured, JobDescription):
+        passages = job_description_passages(document_id, structured)
+    else:
+        return text_passages(document_id, chunk(content))
+    return [passage for passage in passages if passage.text.strip()]
+
+
+class SemanticIndex:
+    """
+    Embedding index over a set of document passages.
+
+    Passages and queries are embedded through the shared embedding runner, so they are batched
+    with other callers' chunks and served from the embedding cache when unchanged.
+    """
+
+    def __init__(self, runner: EmbeddingRunner, index: VectorIndex[Passage]):
+        self.runner = runner
+        self.index = index
+
+    @classmethod
+    async def build(
+        cls,
+        runner: EmbeddingRunner,
+        passages: Sequence[Passage],
+        *,
+        half_precision: bool = True,
+        probes: int = 8,
+    ) -> "SemanticIndex":
+        """
+        Embed the passages and index them.
+
+        Indexes large enough for approximate search are trained here, off the event loop, so
+        searches never have to.
+        """
+        index: VectorIndex[Passage] = VectorIndex(
+            runner.model.dimension, dtype=np.float16 if half_precision else np.float32, probes=probes
+        )
+        if passages:
+            vectors = await runner.embed([passage.text for passage in passages])
+            index.add(passages, vectors, [KIND_TAGS[passage.kind] for passage in passages])
+        if len(index) >= APPROXIMATE_MIN_SIZE:
+            await asyncio.to_thread(index.train)
+        return cls(runner, index)
+
+    async def search(
+        self,
+        text: str,
+        k: int = 10,
+        *,
+        kinds: Collection[PassageKind] | None = None,
+        mode: VectorSearchMode = VectorSearchMode.EXACT,
+    ) -> List[PassageMatch]:
+        """
+        Return the passages most similar in meaning to a text, best first.
+
+        The index is scanned in a worker thread.
+        """
+        query = (await self.runner.embed([text]))[0]
+        tags = None if kinds is None else [KIND_TAGS[kind] for kind in kinds]
+        matches = await asyncio.to_thread(self.index.search, query, k, mode=mode, tags=tags)
+        return [PassageMatch(passage, score) for passage, score in matches]
+
+    async def relevant_experience_bullets(
+        self, requirement: str, k: int = 5, *, mode: VectorSearchMode = VectorSearchMode.EXACT
+    ) -> List[PassageMatch]:
+        """
+        Return the experience bullets that best demonstrate a job requirement.
+        """
+        return await self.search(requirement, k, kinds=[PassageKind.EXPERIENCE_BULLET], mode=mode)
+
+
+async def load_user_passages(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    document_ids: Iterable[uuid.UUID] | None = None,
+    chunk: Callable[[str], List[str]] = chunk_text,
+) -> List[Passage]:
+    """
+    Return the passages of a user's parsed documents, optionally limited to some documents.
+    """
+    query = select(Document.id, Document.content).where(
+        Document.user_id == user_id,
+        Document.content.is_not(None),
+        Document.is_deleted == false(),
+    )
+    if document_ids is not None:
+        query = query.where(Document.id.in_(list(document_ids)))
+    rows = await session.execute(query.order_by(Document.id))
+    return [passage for row in rows for passage in document_passages(row.id, row.content, chunk)]
+
+
+async def build_user_index(
+    session: AsyncSession,
+    runner: EmbeddingRunner,
+    settings: Settings,
+    user_id: uuid.UUID,
+    document_ids: Iterable[uuid.UUID] | None = None,
+) -> SemanticIndex:
+    """
+    Build a semantic index over a user's parsed documents.
+    """
+    passages = await load_user_passages(session, user_id, document_ids, runner.chunk)
+    return await SemanticIndex.build(
+        runner,
+        passages,
+        half_precision=settings.embedding_index_half_precision,
+        probes=settings.embedding_index_probes,
+    )
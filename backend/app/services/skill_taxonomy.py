@@ -0,0 +1,241 @@
+import json
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List
+
+from ..core.exceptions.base import ConfigurationError
+from ..utils.terms import tokenize
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skill_taxonomy.json"
+# Prefix of the terms produced for canonical skills; the term tokenizer never produces a colon.
+SKILL_TERM_PREFIX = "skill:"
+
+
+@dataclass(frozen=True)
+class CanonicalSkill:
+    """
+    A skill in the taxonomy with the spellings it is known by.
+
+    `ambiguous_aliases` are common words as well as skill names, e.g. "Go" or "Express", so they
+    only count when they make up a whole skill name and are never extracted from free text.
+    """
+
+    id: str
+    name: str
+    category: str
+    aliases: tuple[str, ...] = ()
+    ambiguous_aliases: tuple[str, ...] = ()
+
+    @property
+    def term(self) -> str:
+        return f"{SKILL_TERM_PREFIX}{self.id}"
+
+
+@dataclass(frozen=True)
+class SkillMention:
+    """
+    A canonical skill found in a text, with the span of the original text that named it.
+    """
+
+    skill: CanonicalSkill
+    start: int
+    end: int
+    text: str
+
+
+def _normalize(text: str) -> tuple[str, List[int]]:
+    # Lowercases and collapses whitespace, keeping the original offset of every character.
+    characters: List[str] = []
+    offsets: List[int] = []
+    for offset, character in enumerate(text):
+        if character.isspace():
+            if not characters or characters[-1] == " ":
+                continue
+            character = " "
+        else:
+            lowered = character.lower()
+            character = lowered if len(lowered) == 1 else character
+        characters.append(character)
+        offsets.append(offset)
+    if characters and characters[-1] == " ":
+        characters.pop()
+        offsets.pop()
+    return "".join(characters), offsets
+
+
+def _normalize_alias(alias: str) -> str:
+    return _normalize(alias)[0]
+
+
+class SkillTaxonomy:
+    """
+    Canonical skill table with an Aho-Corasick automaton over every unambiguous alias.
+
+    `extract` finds all skill mentions in a text in a single pass over its characters, however
+    many aliases the taxonomy has. Mentions must start and end on word boundaries, and where
+    aliases overlap the leftmost, longest one wins, so "Spring Boot" is one mention and "C++"
+    is never read as "C".
+    """
+
+    def __init__(self, skills: Iterable[CanonicalSkill]):
+        self.skills: dict[str, CanonicalSkill] = {}
+        self._names: dict[str, CanonicalSkill] = {}
+        # Automaton state: transitions, failure link and the (alias length, skill) pairs ending here.
+        self._goto: List[dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[tuple[int, CanonicalSkill]]] = [[]]
+        for skill in skills:
+            if skill.id in self.skills:
+                raise ConfigurationError(f"Skill taxonomy lists '{skill.id}' more than once.")
+            self.skills[skill.id] = skill
+            ambiguous = {_normalize_alias(alias) for alias in skill.ambiguous_aliases}
+            for alias in (skill.name, skill.id, *skill.aliases, *skill.ambiguous_aliases):
+                self._names.setdefault(_normalize_alias(alias), skill)
+            for alias in {_normalize_alias(alias) for alias in (skill.name, *skill.aliases)} - ambiguous:
+                if alias:
+                    self._add(alias, skill)
+        self._link()
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_TAXONOMY_PATH) -> "SkillTaxonomy":
+        """
+        Load a taxonomy from a JSON data file.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            skills = [
+                CanonicalSkill(
+                    id=entry["id"],
+                    name=entry["name"],
+                    category=entry["category"],
+                    aliases=tuple(entry.get("aliases", ())),
+                    ambiguous_aliases=tuple(entry.get("ambiguous_aliases", ())),
+                )
+                for entry in data["skills"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ConfigurationError(f"Skill taxonomy at {path} could not be loaded: {e}") from e
+        return cls(skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def _add(self, alias: str, skill: CanonicalSkill) -> None:
+        state = 0
+        for character in alias:
+            next_state = self._goto[state].get(character)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][character] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if not any(length == len(alias) for length, _ in self._output[state]):
+            self._output[state].append((len(alias), skill))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(character, 0)
+                self._fail[next_state] = link if link != next_state else 0
+                # Aliases that are suffixes of this one end here too.
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def get(self, skill_id: str) -> CanonicalSkill | None:
+        """
+        Return a skill by its canonical id.
+        """
+        return self.skills.get(skill_id)
+
+    def extract(self, text: str) -> List[SkillMention]:
+        """
+        Return the skill mentions in a text, in order of appearance.
+        """
+        normalized, offsets = _normalize(text)
+        candidates: List[tuple[int, int, CanonicalSkill]] = []
+        state = 0
+        for end, character in enumerate(normalized, start=1):
+            while state and character not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(character, 0)
+            for length, skill in self._output[state]:
+                start = end - length
+                if _is_boundary(normalized, start - 1, start) and _is_boundary(normalized, end, end - 1):
+                    candidates.append((start, end, skill))
+
+        mentions: List[SkillMention] = []
+        covered = 0
+        for start, end, skill in sorted(candidates, key=lambda candidate: (candidate[0], -candidate[1])):
+            if start < covered:
+                continue
+            original_start, original_end = offsets[start], offsets[end - 1] + 1
+            mentions.append(
+                SkillMention(skill, original_start, original_end, text[original_start:original_end])
+            )
+            covered = end
+        return mentions
+
+    def normalize(self, name: str) -> CanonicalSkill | None:
+        """
+        Return the canonical skill a skill name refers to, if any.
+
+        A name that is itself a known alias, ambiguous ones included, resolves directly.
+        Otherwise the name resolves when it mentions exactly one skill, e.g. "JavaScript ES6".
+        """
+        skill = self._names.get(_normalize_alias(name))
+        if skill is not None:
+            return skill
+        found = {mention.skill.id: mention.skill for mention in self.extract(name)}
+        return next(iter(found.values())) if len(found) == 1 else None
+
+    def skill_ids(self, texts: Iterable[str | None]) -> set[str]:
+        """
+        Return the ids of every skill mentioned in any of the texts.
+        """
+        return {mention.skill.id for text in texts if text for mention in self.extract(text)}
+
+    def terms(self, text: str | None) -> List[str]:
+        """
+        Tokenize text with skill mentions replaced by canonical skill terms.
+
+        Drop-in replacement for the term tokenizer: "JS and k8s" and "JavaScript, Kubernetes"
+        produce the same terms, while words outside skill mentions are tokenized as usual.
+        """
+        if not text:
+            return []
+        skill = self._names.get(_normalize_alias(text))
+        if skill is not None:
+            return [skill.term]
+        terms: List[str] = []
+        position = 0
+        for mention in self.extract(text):
+            terms.extend(tokenize(text[position : mention.start]))
+            terms.append(mention.skill.term)
+            position = mention.end
+        terms.extend(tokenize(text[position:]))
+        return terms
+
+
+def _is_boundary(text: str, outside: int, inside: int) -> bool:
+    # A mention may not continue a word: it needs a non-alphanumeric neighbour unless its own
+    # edge character is punctuation, as in ".net" or "c++".
+    if outside < 0 or outside >= len(text):
+        return True
+    return not (text[outside].isalnum() and text[inside].isalnum())
+
+
+@lru_cache
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """
+    Return the packaged skill taxonomy, loading it on first use.
+    """
+    return SkillTaxonomy.load()
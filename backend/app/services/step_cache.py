@@ -0,0 +1,174 @@
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import false, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.enums import AssistantStepStatus, AssistantStepType
+from ..core.exceptions.base import NotFoundError
+from ..models import AssistantStep, Document, DocumentJobApplication, JobApplication
+
+# Hash of the parsed text when there is one, so edits to a document's content change the fingerprint.
+DOCUMENT_CONTENT_HASH = func.coalesce(
+    func.encode(func.sha256(func.convert_to(Document.content, literal_column("'UTF8'"))), "hex"),
+    Document.content_hash,
+)
+
+# Job application fields a step's result may be derived from, so they are part of its fingerprint.
+APPLICATION_FIELDS = ("title", "company_name", "location", "posting_url", "notes", "type")
+
+
+@dataclass(frozen=True)
+class ApplicationInputs:
+    """
+    The owner of a job application and the application fields its steps may depend on.
+    """
+
+    user_id: uuid.UUID
+    fields: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class CachedStep:
+    """
+    Result of an earlier completed step, with the document reads recorded when it was computed.
+    """
+
+    result: dict
+    document_reads: dict | None
+
+
+def step_fingerprint(
+    step_name: AssistantStepType,
+    input_context: dict | None,
+    document_hashes: Iterable[str],
+    upstream_results: Mapping[AssistantStepType, dict] | None = None,
+    application: Mapping[str, Any] | None = None,
+) -> str:
+    """
+    Return a canonical SHA-256 over everything an assistant step's result is derived from.
+
+    Key order and document order do not matter. The results of upstream steps are included,
+    since a step that reads a re-generated upstream result must not reuse an old answer, and so
+    are the job application's own fields, since two applications can share the same documents.
+    """
+    payload = {
+        "step": AssistantStepType(step_name).value,
+        "input": input_context or {},
+        "application": dict(application or {}),
+        "documents": sorted(set(document_hashes)),
+        "upstream": {
+            AssistantStepType(name).value: result for name, result in (upstream_results or {}).items()
+        },
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+async def load_application_inputs(session: AsyncSession, job_application_id: uuid.UUID) -> ApplicationInputs:
+    """
+    Return the owner and fingerprinted fields of a live job application.
+    """
+    row = (
+        await session.execute(
+            select(
+                JobApplication.user_id, *(getattr(JobApplication, name) for name in APPLICATION_FIELDS)
+            ).where(JobApplication.id == job_application_id, JobApplication.is_deleted == false())
+        )
+    ).first()
+    if row is None:
+        raise NotFoundError("Job application")
+    return ApplicationInputs(
+        user_id=row.user_id, fields={name: getattr(row, name) for name in APPLICATION_FIELDS}
+    )
+
+
+async def load_document_hashes(session: AsyncSession, job_application_id: uuid.UUID) -> list[str]:
+    """
+    Return the content hashes of the live documents attached to a job application.
+    """
+    rows = await session.scalars(
+        select(DOCUMENT_CONTENT_HASH)
+        .join(DocumentJobApplication, DocumentJobApplication.c.document_id == Document.id)
+        .where(
+            DocumentJobApplication.c.job_application_id == job_application_id,
+            Document.is_deleted == false(),
+        )
+    )
+    return [content_hash for content_hash in rows if content_hash is not None]
+
+
+async def find_cached_result(
+    session: AsyncSession, user_id: uuid.UUID, fingerprint: str
+) -> CachedStep | None:
+    """
+    Return the latest of the user's completed steps computed from the same inputs, if any.
+
+    Only the user's own job applications are searched, so one user's output is never served
+    to another even when their inputs happen to match.
+    """
+    row = (
+        await session.execute(
+            select(AssistantStep.result, AssistantStep.document_reads)
+            .join(JobApplication, AssistantStep.job_application_id == JobApplication.id)
+            .where(
+                JobApplication.user_id == user_id,
+                AssistantStep.input_fingerprint == fingerprint,
+                AssistantStep.step_status == AssistantStepStatus.COMPLETED,
+                AssistantStep.result.is_not(None),
+                AssistantStep.is_deleted == false(),
+            )
+            .order_by(AssistantStep.updated_at.desc())
+            .limit(1)
+        )
+    ).first()
+    if row is None:
+        return None
+    return CachedStep(result=row.result, document_reads=row.document_reads)
+
+
+async def remap_document_reads(
+    session: AsyncSession, job_application_id: uuid.UUID, document_reads: dict | None
+) -> dict | None:
+    """
+    Re-key document reads recorded by a cached step onto this job application's documents.
+
+    Reads are keyed by document id, but a cached result can come from another application whose
+    documents hold the same content. Each read document is matched to an attached document with
+    the same content hash; reads that match nothing are kept, so the step is re-checked next run.
+    """
+    if not document_reads:
+        return document_reads
+    source_ids = [uuid.UUID(document_id) for document_id in document_reads]
+    source_hashes = dict(
+        (
+            await session.execute(
+                select(Document.id, DOCUMENT_CONTENT_HASH)
+                .where(Document.id.in_(source_ids))
+                # The source document may have been deleted since; its hash still identifies the content.
+                .execution_options(include_deleted=True)
+            )
+        ).all()
+    )
+    attached = {
+        content_hash: document_id
+        for document_id, content_hash in (
+            await session.execute(
+                select(Document.id, DOCUMENT_CONTENT_HASH)
+                .join(DocumentJobApplication, DocumentJobApplication.c.document_id == Document.id)
+                .where(
+                    DocumentJobApplication.c.job_application_id == job_application_id,
+                    Document.is_deleted == false(),
+                )
+            )
+        ).all()
+        if content_hash is not None
+    }
+    remapped: dict[str, dict[str, str]] = {}
+    for document_id, fields in document_reads.items():
+        target = attached.get(source_hashes.get(uuid.UUID(document_id)))
+        remapped.setdefault(str(target) if target is not None else document_id, {}).update(fields)
+    return remapped
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import uuid
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.exceptions.base import NotFoundError, ValidationError
+from ..models import Document, DocumentJobApplication
+
+# Document fields a step handler may read; reads of these are tracked for incremental re-runs.
+READABLE_FIELDS = ("title", "description", "content", "tags", "type", "file_type", "content_hash")
+
+
+def value_hash(value: Any) -> str:
+    """
+    Return a stable SHA-256 of a field value.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _linked_documents(
+    job_application_id: uuid.UUID, document_ids: Iterable[uuid.UUID], fields: Iterable[str]
+):
+    return (
+        select(Document.id, *(getattr(Document, name) for name in fields))
+        .join(DocumentJobApplication, DocumentJobApplication.c.document_id == Document.id)
+        .where(
+            DocumentJobApplication.c.job_application_id == job_application_id,
+            Document.id.in_(list(document_ids)),
+            Document.is_deleted == false(),
+        )
+    )
+
+
+class DocumentReader:
+    """
+    Gives a step handler access to the job application's documents and records what it read.
+
+    `reads` maps each document id to the hash of every field the handler read. It is stored
+    with the step's result, so a later run can tell whether the step's inputs have changed.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], job_application_id: uuid.UUID):
+        self.session_factory = session_factory
+        self.job_application_id = job_application_id
+        self.reads: dict[str, dict[str, str]] = {}
+
+    async def read(self, document_id: uuid.UUID, fields: Iterable[str] = READABLE_FIELDS) -> dict[str, Any]:
+        """
+        Return the requested fields of a document attached to the job application.
+        """
+        fields = tuple(fields)
+        unknown = set(fields) - set(READABLE_FIELDS)
+        if unknown:
+            raise ValidationError(f"Document fields cannot be read by assistant steps: {sorted(unknown)}.")
+        async with self.session_factory() as session:
+            row = (
+                await session.execute(_linked_documents(self.job_application_id, [document_id], fields))
+            ).first()
+        if row is None:
+            raise NotFoundError("Document")
+        values = {name: getattr(row, name) for name in fields}
+        recorded = self.reads.setdefault(str(document_id), {})
+        recorded.update({name: value_hash(value) for name, value in values.items()})
+        return values
+
+
+async def find_stale_steps(
+    session: AsyncSession,
+    job_application_id: uuid.UUID,
+    document_reads: Mapping[uuid.UUID, dict[str, dict[str, str]] | None],
+) -> set[uuid.UUID]:
+    """
+    Return the steps whose recorded document reads no longer match the documents.
+
+    `document_reads` maps step ids to what each step read when it last ran. A step is stale when
+    a field it read has changed or a document it read was deleted or detached from the job
+    application. Steps without recorded reads are treated as stale, since their inputs are unknown.
+    """
+    stale = {step_id for step_id, reads in document_reads.items() if reads is None}
+    tracked = {step_id: reads for step_id, reads in document_reads.items() if reads}
+    document_ids = {uuid.UUID(document_id) for reads in tracked.values() for document_id in reads}
+    if not document_ids:
+        return stale
+
+    rows = await session.execute(_linked_documents(job_application_id, document_ids, READABLE_FIELDS))
+    current = {
+        str(row.id): {name: value_hash(getattr(row, name)) for name in READABLE_FIELDS} for row in rows
+    }
+    for step_id, reads in tracked.items():
+        for document_id, fields in reads.items():
+            document = current.get(document_id)
+            if document is None or any(document.get(name) != digest for name, digest in fields.items()):
+                stale.add(step_id)
+                break
+    return stale
@@ -0,0 +1,115 @@
+import re
+import zipfile
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable
+from xml.etree import ElementTree
+
+from pypdf import PdfReader
+from pypdf.errors import PdfReadError
+
+from ..core.enums import FileType
+from ..core.exceptions.base import ValidationError
+
+# Bump whenever extraction output changes; cached parse results of older versions are ignored.
+PARSER_VERSION = 1
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _read_text_file(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def _extract_pdf(path: Path) -> str:
+    reader = PdfReader(path)
+    return "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(path: Path) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{WORD_NAMESPACE}t" and node.text:
+                parts.append(node.text)
+            elif node.tag == f"{WORD_NAMESPACE}tab":
+                parts.append("\t")
+            elif node.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+class _HTMLTextParser(HTMLParser):
+    SKIPPED_TAGS = {"script", "style", "head", "noscript", "template"}
+    BLOCK_TAGS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _extract_html(path: Path) -> str:
+    parser = _HTMLTextParser()
+    parser.feed(_read_text_file(path))
+    parser.close()
+    return "".join(parser.parts)
+
+
+EXTRACTORS: dict[FileType, Callable[[Path], str]] = {
+    FileType.PDF: _extract_pdf,
+    FileType.DOCX: _extract_docx,
+    FileType.HTML: _extract_html,
+    FileType.TXT: _read_text_file,
+    FileType.MARKDOWN: _read_text_file,
+    FileType.CSV: _read_text_file,
+    FileType.JSON: _read_text_file,
+    FileType.YAML: _read_text_file,
+    FileType.XML: _read_text_file,
+}
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Collapse runs of spaces and blank lines left behind by extraction.
+    """
+    text = re.sub(r"[ \t\f\v\u00a0]+", " ", text.replace("\r\n", "\n").replace("\r", "\n"))
+    text = re.sub(r" *\n *", "\n", text)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def extract_text(path: Path | str, file_type: FileType | str) -> str:
+    """
+    Extract plain text from a stored document file.
+
+    Raises ValidationError for file types that have no extractor or files that cannot be read
+    as their declared type; those will not succeed on retry.
+    """
+    path, file_type = Path(path), FileType(file_type)
+    extractor = EXTRACTORS.get(file_type)
+    if extractor is None:
+        raise ValidationError(f"Text extraction is not supported for '{file_type.value}' files.")
+    try:
+        return normalize_whitespace(extractor(path))
+    except (PdfReadError, zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ValidationError(f"File is not a valid '{file_type.value}' document.") from e
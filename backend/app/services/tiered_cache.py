@@ -0,0 +1,131 @@
+import logging
+from collections import OrderedDict
+from typing import Callable, Generic, Iterable, Mapping, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class TieredCache(Generic[V]):
+    """
+    Two-tier cache: an in-process LRU of up to `max_entries` values in front of Redis.
+
+    Lookups try the local tier first and then Redis, which is shared by every API and worker
+    process; Redis hits are kept locally too. Values go to Redis as `encode(value)` and come
+    back through `decode`, which returns None for a payload it cannot use, so an entry written
+    in an incompatible format counts as a miss and is replaced by the next store.
+
+    Redis is an optimization only: its failures are logged and treated as misses, so when it is
+    unreachable the cache degrades to the local tier.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis: Redis | None,
+        *,
+        encode: Callable[[V], bytes | str],
+        decode: Callable[[bytes], V | None],
+        max_entries: int,
+        ttl: int | None,
+    ):
+        self.name = name
+        self.redis = redis
+        self.encode = encode
+        self.decode = decode
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local: OrderedDict[str, V] = OrderedDict()
+
+    async def get(self, key: str) -> V | None:
+        """
+        Return the value cached under a key, or None on a miss.
+        """
+        value = self._recall(key)
+        if value is not None or self.redis is None:
+            return value
+        try:
+            payload = await self.redis.get(key)
+        except RedisError:
+            logger.warning("%s cache lookup failed for %s", self.name, key, exc_info=True)
+            return None
+        return self._load(key, payload)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, V]:
+        """
+        Return the values cached under whichever of the keys are cached, in one Redis round trip.
+        """
+        found: dict[str, V] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            value = self._recall(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        if not missing or self.redis is None:
+            return found
+        try:
+            payloads = await self.redis.mget(missing)
+        except RedisError:
+            logger.warning("%s cache lookup failed for %d keys", self.name, len(missing), exc_info=True)
+            return found
+        for key, payload in zip(missing, payloads):
+            value = self._load(key, payload)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: V) -> None:
+        """
+        Store a value in both tiers.
+        """
+        self._remember(key, value)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, self.encode(value), ex=self.ttl)
+        except RedisError:
+            logger.warning("%s cache store failed for %s", self.name, key, exc_info=True)
+
+    async def set_many(self, values: Mapping[str, V]) -> None:
+        """
+        Store values by key in both tiers, in one Redis round trip.
+        """
+        if not values:
+            return
+        for key, value in values.items():
+            self._remember(key, value)
+        if self.redis is None:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, self.encode(value), ex=self.ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("%s cache store failed for %d keys", self.name, len(values), exc_info=True)
+
+    def _recall(self, key: str) -> V | None:
+        value = self._local.get(key)
+        if value is not None:
+            self._local.move_to_end(key)
+        return value
+
+    def _load(self, key: str, payload: bytes | None) -> V | None:
+        if payload is None:
+            return None
+        value = self.decode(payload)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: V) -> None:
+        self._local[key] = value
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
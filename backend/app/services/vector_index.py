@@ -0,0 +1,164 @@
+import threading
+from typing import Collection, Generic, List, Sequence, TypeVar
+
+import numpy as np
+
+from ..core.enums import VectorSearchMode
+from ..core.exceptions.base import ValidationError
+from .embeddings import normalize_rows
+
+K = TypeVar("K")
+
+# Below this many vectors an exact scan is as fast as probing an IVF index, so none is trained.
+APPROXIMATE_MIN_SIZE = 1024
+# Rows scored per matrix product, which bounds the float32 copy of half-precision storage.
+SCAN_BLOCK_SIZE = 16384
+
+
+class VectorIndex(Generic[K]):
+    """
+    In-memory cosine similarity index over unit vectors stored in one contiguous array.
+
+    Vectors are kept in float16 by default, halving memory at a precision loss that does not
+    change rankings in practice. Exact search scans every vector; approximate search uses an
+    inverted file (IVF): vectors are clustered with spherical k-means, and only the clusters
+    whose centroids are closest to the query are scanned. Each vector may carry a small integer
+    tag so searches can be restricted to a kind of item without a second index.
+
+    Searches may run in several threads at once. The trained clusters are replaced as a whole,
+    so a search sees either the old or the new clustering, and an approximate search that finds
+    the index untrained trains it under a lock, once.
+    """
+
+    def __init__(self, dimension: int, *, dtype: type = np.float16, probes: int = 8):
+        self.dimension = dimension
+        self.probes = probes
+        self.keys: List[K] = []
+        self._vectors = np.empty((0, dimension), dtype=dtype)
+        self._tags = np.empty(0, dtype=np.int16)
+        # (centroids, cluster of each vector), swapped in together once trained.
+        self._ivf: tuple[np.ndarray, np.ndarray] | None = None
+        self._train_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def is_trained(self) -> bool:
+        return self._ivf is not None
+
+    @property
+    def nbytes(self) -> int:
+        return self._vectors[: len(self)].nbytes
+
+    def _grow(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 64)
+        vectors = np.empty((capacity, self.dimension), dtype=self._vectors.dtype)
+        vectors[: len(self)] = self._vectors[: len(self)]
+        tags = np.zeros(capacity, dtype=np.int16)
+        tags[: len(self)] = self._tags[: len(self)]
+        self._vectors, self._tags = vectors, tags
+
+    def add(self, keys: Sequence[K], vectors: np.ndarray, tags: Sequence[int] | None = None) -> None:
+        """
+        Add vectors under the given keys; vectors are normalized on the way in.
+
+        Once an IVF index has been trained, new vectors are assigned to their closest cluster.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        if len(keys) != len(vectors) or (tags is not None and len(tags) != len(vectors)):
+            raise ValidationError("Each vector needs exactly one key and at most one tag.")
+        start, end = len(self), len(self) + len(vectors)
+        self._grow(end)
+        vectors = normalize_rows(vectors)
+        self._vectors[start:end] = vectors
+        self._tags[start:end] = 0 if tags is None else np.asarray(tags, dtype=np.int16)
+        ivf = self._ivf
+        if ivf is not None:
+            centroids, lists = ivf
+            self._ivf = (centroids, np.concatenate([lists, np.argmax(vectors @ centroids.T, axis=1)]))
+        self.keys.extend(keys)
+
+    def train(self, lists: int | None = None, *, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Cluster the indexed vectors for approximate search.
+
+        Defaults to about the square root of the index size in clusters, which balances the
+        cost of comparing the query with centroids against scanning the probed clusters. Searches
+        running meanwhile keep using the previous clustering, if any.
+        """
+        size = len(self)
+        if size == 0:
+            return
+        lists = min(size, lists or max(1, int(np.sqrt(size))))
+        vectors = self._vectors[:size].astype(np.float32)
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(size, lists, replace=False)]
+        for _ in range(iterations):
+            assignments = self._assign(centroids)
+            order = np.argsort(assignments, kind="stable")
+            members, starts = np.unique(assignments[order], return_index=True)
+            # Clusters that lost all their members keep their previous centroid.
+            sums = centroids.copy()
+            sums[members] = np.add.reduceat(vectors[order], starts, axis=0)
+            centroids = normalize_rows(sums)
+        self._ivf = (centroids, self._assign(centroids))
+
+    def _assign(self, centroids: np.ndarray) -> np.ndarray:
+        size = len(self)
+        assignments = np.empty(size, dtype=np.int32)
+        for start in range(0, size, SCAN_BLOCK_SIZE):
+            block = self._vectors[start : start + SCAN_BLOCK_SIZE].astype(np.float32)
+            assignments[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+    def _train_once(self) -> tuple[np.ndarray, np.ndarray]:
+        with self._train_lock:
+            if self._ivf is None:
+                self.train()
+            return self._ivf
+
+    def _candidates(self, query: np.ndarray, mode: VectorSearchMode, tags: Collection[int] | None):
+        size = len(self)
+        mask = None
+        if mode == VectorSearchMode.APPROXIMATE and size >= APPROXIMATE_MIN_SIZE:
+            centroids, lists = self._ivf or self._train_once()
+            probes = min(self.probes, len(centroids))
+            closest = np.argpartition(-(centroids @ query), probes - 1)[:probes]
+            mask = np.isin(lists[:size], closest)
+        if tags is not None:
+            tagged = np.isin(self._tags[:size], np.asarray(list(tags), dtype=np.int16))
+            mask = tagged if mask is None else mask & tagged
+        return None if mask is None else np.flatnonzero(mask)
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        *,
+        mode: VectorSearchMode = VectorSearchMode.EXACT,
+        tags: Collection[int] | None = None,
+    ) -> List[tuple[K, float]]:
+        """
+        Return up to `k` keys with the highest cosine similarity to the query, best first.
+
+        `tags` restricts the search to vectors added with one of the given tags.
+        """
+        query = normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, self.dimension))[0]
+        candidates = self._candidates(query, mode, tags)
+        rows = np.arange(len(self)) if candidates is None else candidates
+        if k <= 0 or len(rows) == 0:
+            return []
+        scores = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), SCAN_BLOCK_SIZE):
+            block = rows[start : start + SCAN_BLOCK_SIZE]
+            scores[start : start + len(block)] = self._vectors[block].astype(np.float32) @ query
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+        else:
+            top = np.argsort(-scores, kind="stable")
+        return [(self.keys[rows[index]], float(scores[index])) for index in top]
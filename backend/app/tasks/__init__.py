@@ -0,0 +1,5 @@
+from .document_parser import DocumentParserWorker
+
+__all__ = [
+    "DocumentParserWorker",
+]
@@ -0,0 +1,311 @@
+import asyncio
+import logging
+import signal
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import case, false, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config import Settings, get_settings
+from ..core.enums import DocumentStatus, FileType
+from ..core.exceptions.base import ValidationError
+from ..db import close_redis, dispose_engine, get_session_factory, init_engine
+from ..models import Document
+from ..schemas.parse_result import ParseResult
+from ..services.extraction_pool import ExtractionPool
+from ..services.parse_cache import ParseCache
+from ..services.text_extraction import PARSER_VERSION, extract_text
+
+logger = logging.getLogger(__name__)
+
+Extractor = Callable[[Path, FileType], Awaitable[str]]
+
+RETRY_BASE_DELAY = 1.0  # seconds
+
+
+@dataclass(frozen=True)
+class ClaimedDocument:
+    """
+    A document claimed by the worker for parsing.
+    """
+
+    id: uuid.UUID
+    file_path: Path | None
+    file_type: FileType | None
+    content_hash: str | None
+
+
+async def extract_in_thread(path: Path, file_type: FileType) -> str:
+    """
+    Run text extraction in a worker thread so it does not block the event loop.
+
+    Suitable for tests and light loads; deployments parse through an `ExtractionPool`.
+    """
+    return await asyncio.to_thread(extract_text, path, file_type)
+
+
+class DocumentParserWorker:
+    """
+    Background worker that moves uploaded documents through UPLOADED -> PROCESSING -> PARSED/ERROR.
+
+    Documents are claimed with `SELECT ... FOR UPDATE SKIP LOCKED`, so any number of workers
+    across processes can share the queue without handing out the same document twice. Documents
+    left in PROCESSING by a crashed worker are put back in the queue after `stale_after` seconds,
+    unless they have already been claimed `max_claims` times: those are marked ERROR, so a file
+    that takes its worker down every time cannot keep the queue busy forever.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        concurrency: int = 4,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3,
+        stale_after: float = 600.0,
+        max_claims: int = 3,
+        extract: Extractor = extract_in_thread,
+        parse_cache: ParseCache | None = None,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self.max_claims = max_claims
+        self.extract = extract
+        self.parse_cache = parse_cache or ParseCache()
+        self._tasks: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._last_requeue: float | None = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: Settings | None = None,
+        extraction_pool: ExtractionPool | None = None,
+        **overrides,
+    ) -> "DocumentParserWorker":
+        """
+        Build a worker configured from the application settings.
+
+        With an extraction pool, files are parsed in its processes and, unless configured
+        otherwise, the worker keeps one document in flight per process.
+        """
+        settings = settings or get_settings()
+        options = {
+            "concurrency": settings.document_parser_concurrency,
+            "poll_interval": settings.document_parser_poll_interval,
+            "max_attempts": settings.document_parser_max_attempts,
+            "stale_after": settings.document_parser_stale_after,
+            "max_claims": settings.document_parser_max_claims,
+            "parse_cache": ParseCache.from_settings(settings),
+        }
+        if extraction_pool is not None:
+            options["extract"] = extraction_pool.extract
+            options["concurrency"] = options["concurrency"] or extraction_pool.max_workers
+        options = {key: value for key, value in options.items() if value is not None}
+        return cls(session_factory, **{**options, **overrides})
+
+    def stop(self) -> None:
+        """
+        Ask the worker to stop claiming documents; in-flight documents are still finished.
+        """
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """
+        Claim and parse documents until `stop` is called.
+        """
+        logger.info("Document parser worker started with concurrency %d", self.concurrency)
+        try:
+            while not self._stopping.is_set():
+                free_slots = self.concurrency - len(self._tasks)
+                if free_slots <= 0:
+                    await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                try:
+                    claimed = await self.claim(free_slots)
+                except Exception:
+                    logger.exception("Failed to claim documents for parsing")
+                    claimed = []
+                for document in claimed:
+                    task = asyncio.create_task(self.process(document))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                if not claimed:
+                    await self._sleep(self.poll_interval)
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            logger.info("Document parser worker stopped")
+
+    async def claim(self, limit: int) -> List[ClaimedDocument]:
+        """
+        Atomically move up to `limit` of the oldest uploaded documents to PROCESSING.
+        """
+        async with self.session_factory() as session:
+            await self._requeue_stale(session)
+            rows = (
+                await session.execute(
+                    select(Document.id, Document.file_path, Document.file_type, Document.content_hash)
+                    .where(Document.status == DocumentStatus.UPLOADED, Document.is_deleted == false())
+                    .order_by(Document.created_at)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if rows:
+                await session.execute(
+                    update(Document)
+                    .where(Document.id.in_([row.id for row in rows]))
+                    .values(status=DocumentStatus.PROCESSING, parse_attempts=Document.parse_attempts + 1)
+                )
+            await session.commit()
+        return [
+            ClaimedDocument(
+                id=row.id,
+                file_path=row.file_path,
+                file_type=row.file_type,
+                content_hash=row.content_hash,
+            )
+            for row in rows
+        ]
+
+    async def process(self, document: ClaimedDocument) -> None:
+        """
+        Extract a claimed document's text and record the outcome.
+
+        Files whose content hash is in the parse cache are not extracted again.
+        """
+        try:
+            result = await self._cached_result(document)
+            if result is None:
+                result = ParseResult(
+                    parser_version=PARSER_VERSION, text=await self._extract_with_retries(document)
+                )
+                if document.content_hash:
+                    await self.parse_cache.set(document.content_hash, result)
+        except Exception:
+            logger.exception("Failed to parse document %s", document.id)
+            await self._finish(document.id, DocumentStatus.ERROR)
+            return
+        await self._finish(document.id, DocumentStatus.PARSED, result)
+
+    async def _cached_result(self, document: ClaimedDocument) -> ParseResult | None:
+        if not document.content_hash:
+            return None
+        return await self.parse_cache.get(document.content_hash)
+
+    async def _extract_with_retries(self, document: ClaimedDocument) -> str:
+        if document.file_path is None or document.file_type is None:
+            raise ValidationError(f"Document {document.id} has no stored file to parse.")
+        attempt = 1
+        while True:
+            try:
+                return await self.extract(document.file_path, document.file_type)
+            except ValidationError:
+                raise
+            except Exception:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning(
+                    "Parsing document %s failed (attempt %d/%d), retrying in %.1fs",
+                    document.id,
+                    attempt,
+                    self.max_attempts,
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _finish(
+        self, document_id: uuid.UUID, status: DocumentStatus, result: ParseResult | None = None
+    ) -> None:
+        values: dict = {"status": status}
+        if result is not None:
+            values.update(content=result.text, parser_version=result.parser_version)
+        try:
+            async with self.session_factory() as session:
+                # Only the worker holding the claim may finish it; a requeued document is left alone.
+                await session.execute(
+                    update(Document)
+                    .where(Document.id == document_id, Document.status == DocumentStatus.PROCESSING)
+                    .values(**values)
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to record parsing result for document %s", document_id)
+
+    async def _requeue_stale(self, session: AsyncSession) -> None:
+        now = time.monotonic()
+        if self._last_requeue is not None and now - self._last_requeue < self.stale_after / 2:
+            return
+        self._last_requeue = now
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.stale_after)
+        statuses = await session.scalars(
+            update(Document)
+            .where(
+                Document.status == DocumentStatus.PROCESSING,
+                Document.is_deleted == false(),
+                Document.updated_at < cutoff,
+            )
+            .values(
+                status=case(
+                    (
+                        Document.parse_attempts >= self.max_claims,
+                        literal(DocumentStatus.ERROR, Document.status.type),
+                    ),
+                    else_=literal(DocumentStatus.UPLOADED, Document.status.type),
+                )
+            )
+            .returning(Document.status)
+        )
+        counts = Counter(statuses)
+        if counts[DocumentStatus.UPLOADED]:
+            logger.warning("Requeued %d documents stuck in processing", counts[DocumentStatus.UPLOADED])
+        if counts[DocumentStatus.ERROR]:
+            logger.error(
+                "Gave up on %d documents stuck in processing after %d claims",
+                counts[DocumentStatus.ERROR],
+                self.max_claims,
+            )
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def main() -> None:
+    """
+    Run a standalone parsing worker until interrupted.
+    """
+    settings = get_settings()
+    logging.basicConfig(level=settings.log_level, format=settings.log_format)
+    init_engine(settings)
+    extraction_pool = ExtractionPool.from_settings(settings)
+    worker = DocumentParserWorker.from_settings(get_session_factory(), settings, extraction_pool)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        extraction_pool.shutdown()
+        await close_redis()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
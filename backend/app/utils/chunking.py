@@ -0,0 +1,75 @@
+import hashlib
+import re
+from typing import List
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Roughly one token per word or punctuation mark, close to what subword tokenizers produce for English.
+TOKEN_ESTIMATE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many model tokens a text takes up.
+    """
+    return len(TOKEN_ESTIMATE.findall(text))
+
+
+def chunk_hash(text: str) -> str:
+    """
+    Return the SHA-256 of a chunk's text, ignoring differences in whitespace.
+    """
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def _split_long(paragraph: str, max_tokens: int) -> List[str]:
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    for sentence in SENTENCE_END.split(paragraph):
+        tokens = estimate_tokens(sentence)
+        if current and size + tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, size = [], 0
+        if tokens > max_tokens:
+            # A single run-on sentence is cut by words.
+            words = sentence.split()
+            step = max(1, len(words) * max_tokens // tokens)
+            pieces.extend(" ".join(words[i : i + step]) for i in range(0, len(words), step))
+            continue
+        current.append(sentence)
+        size += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(text: str, *, max_tokens: int = 256, min_tokens: int = 32) -> List[str]:
+    """
+    Split text into chunks of at most about `max_tokens` tokens for embedding.
+
+    Chunks follow paragraph boundaries: paragraphs longer than `max_tokens` are split between
+    sentences, and paragraphs shorter than `min_tokens` are merged with the ones that follow.
+    Because boundaries depend only on nearby paragraphs, editing one paragraph changes the
+    chunks around it and leaves the rest of the document's chunks, and their hashes, as they were.
+    """
+    chunks: List[str] = []
+    pending: List[str] = []
+    size = 0
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        for piece in _split_long(paragraph, max_tokens):
+            tokens = estimate_tokens(piece)
+            if pending and size + tokens > max_tokens:
+                chunks.append("\n\n".join(pending))
+                pending, size = [], 0
+            pending.append(piece)
+            size += tokens
+            if size >= min_tokens:
+                chunks.append("\n\n".join(pending))
+                pending, size = [], 0
+    if pending:
+        chunks.append("\n\n".join(pending))
+    return chunks
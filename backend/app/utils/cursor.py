@@ -0,0 +1,27 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+
+from ..core.exceptions.base import ValidationError
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """
+    Encode a (created_at, id) keyset position into an opaque URL-safe cursor token.
+    """
+    payload = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor token produced by `encode_cursor` back into its (created_at, id) position.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor.") from e
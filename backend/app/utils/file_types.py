@@ -0,0 +1,92 @@
+from pathlib import PurePath
+
+from ..core.enums import FileType, MimeType
+
+SNIFF_LENGTH = 8192
+
+EXTENSION_FILE_TYPES: dict[str, FileType] = {
+    **{file_type.value: file_type for file_type in FileType if file_type is not FileType.UNKNOWN},
+    "markdown": FileType.MARKDOWN,
+    "htm": FileType.HTML,
+    "yml": FileType.YAML,
+}
+
+ZIP_FILE_TYPES = (FileType.DOCX, FileType.XLSX, FileType.PPTX, FileType.ODT, FileType.ODS, FileType.ODP)
+OLE_FILE_TYPES = (FileType.DOC, FileType.XLS, FileType.PPT)
+TEXT_FILE_TYPES = (
+    FileType.TXT,
+    FileType.MARKDOWN,
+    FileType.CSV,
+    FileType.JSON,
+    FileType.YAML,
+    FileType.XML,
+    FileType.HTML,
+)
+
+# Markers found near the start of Office Open XML and OpenDocument archives.
+ZIP_MARKERS: tuple[tuple[bytes, FileType], ...] = (
+    (b"application/vnd.oasis.opendocument.text", FileType.ODT),
+    (b"application/vnd.oasis.opendocument.spreadsheet", FileType.ODS),
+    (b"application/vnd.oasis.opendocument.presentation", FileType.ODP),
+    (b"word/", FileType.DOCX),
+    (b"xl/", FileType.XLSX),
+    (b"ppt/", FileType.PPTX),
+)
+
+
+def file_type_from_extension(filename: str | None) -> FileType:
+    """
+    Guess the file type from a file name's extension.
+    """
+    suffix = PurePath(filename or "").suffix.lower().lstrip(".")
+    return EXTENSION_FILE_TYPES.get(suffix, FileType.UNKNOWN)
+
+
+def mime_type_for(file_type: FileType) -> MimeType:
+    """
+    Return the MIME type matching a file type.
+    """
+    return MimeType[file_type.name]
+
+
+def _looks_like_text(head: bytes) -> bool:
+    if b"\x00" in head:
+        return False
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sniffed prefix is still valid text.
+        return e.start >= len(head) - 3 and e.reason == "unexpected end of data"
+    return True
+
+
+def sniff_file_type(head: bytes, filename: str | None = None) -> FileType:
+    """
+    Detect a file's type from its leading bytes, using the extension to break ties.
+
+    Binary formats are identified by their magic numbers; the extension only decides between
+    formats sharing a container (ZIP, OLE) or between plain text flavours.
+    """
+    by_extension = file_type_from_extension(filename)
+
+    if head.startswith(b"%PDF-"):
+        return FileType.PDF
+    if head.startswith(b"PK\x03\x04"):
+        if by_extension in ZIP_FILE_TYPES:
+            return by_extension
+        return next((file_type for marker, file_type in ZIP_MARKERS if marker in head), FileType.UNKNOWN)
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return by_extension if by_extension in OLE_FILE_TYPES else FileType.DOC
+    if head.startswith(b"{\\rtf"):
+        return FileType.RTF
+    if not _looks_like_text(head):
+        return FileType.UNKNOWN
+
+    if by_extension in TEXT_FILE_TYPES:
+        return by_extension
+    stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if stripped.startswith((b"<!doctype html", b"<html")):
+        return FileType.HTML
+    if stripped.startswith(b"<?xml"):
+        return FileType.XML
+    return FileType.TXT
@@ -1,4 +1,5 @@
 import re
+from typing import Iterable, List
 
 
 def camel_to_snake_case(name: str) -> str:
@@ -14,3 +15,12 @@ def snake_to_camel_case(name: str) -> str:
     """
     components = name.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
+
+
+def normalize_tags(tags: Iterable[str] | None) -> List[str]:
+    """
+    Strip whitespace from tags, drop empty ones and remove duplicates while keeping order.
+    """
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
@@ -0,0 +1,42 @@
+import re
+import unicodedata
+from typing import Callable, Iterable, List
+
+# Keeps tech spellings such as "c++", "c#", "node.js" and ".net" together as one token.
+TOKEN_PATTERN = re.compile(r"\.?[a-z0-9][a-z0-9+#.]*")
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from has have in into is it its of on or our over the their this
+    to we will with within you your
+    ability able across also any based can demonstrated etc excellent experience experienced familiar
+    familiarity good including knowledge least like more must plus preferred proficiency proficient
+    required skill skills solid strong such understanding using various well work working year years yrs
+    """.split()
+)
+
+Tokenizer = Callable[[str | None], List[str]]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase text and fold compatibility characters, e.g. full-width letters and ligatures.
+    """
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def tokenize(text: str | None) -> List[str]:
+    """
+    Split text into normalized terms, dropping stopwords, bare numbers such as "5+" and trailing periods.
+    """
+    if not text:
+        return []
+    tokens = (token.rstrip(".") for token in TOKEN_PATTERN.findall(normalize_text(text)))
+    return [token for token in tokens if token and token not in STOPWORDS and not token.rstrip("+").isdigit()]
+
+
+def term_set(texts: Iterable[str | None], tokenizer: Tokenizer = tokenize) -> frozenset[str]:
+    """
+    Return the set of normalized terms found in any of the given texts.
+    """
+    return frozenset(term for text in texts for term in tokenizer(text))
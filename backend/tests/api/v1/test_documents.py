@@ -0,0 +1,76 @@
+import logging
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.api.deps import get_current_user
+from app.api.v1 import documents
+from app.core.config import get_settings
+from app.db import get_session, install_query_counter
+from app.main import app
+from app.models import User
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_counter(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client():
+    user = User(id=uuid.uuid4(), username="ada", email="ada@example.com", password="x")
+
+    async def override_session():
+        yield None
+
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def search_running(monkeypatch, engine, queries: int) -> None:
+    # Stands in for the search service, running the given number of statements.
+    async def search_documents(session, user_id, q, *, document_type=None, limit=20):
+        with engine.connect() as connection:
+            for _ in range(queries):
+                connection.execute(text("SELECT 1"))
+        return []
+
+    monkeypatch.setattr(documents, "search_documents", search_documents)
+
+
+def test_search_within_budget_succeeds(monkeypatch, engine, client):
+    monkeypatch.setattr(get_settings(), "db_query_budget_enforced", True)
+    search_running(monkeypatch, engine, queries=2)
+
+    response = client.get("/api/v1/documents/search", params={"q": "python"})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == []
+
+
+def test_search_over_budget_fails_when_enforced(monkeypatch, engine, client):
+    monkeypatch.setattr(get_settings(), "db_query_budget_enforced", True)
+    search_running(monkeypatch, engine, queries=3)
+
+    response = client.get("/api/v1/documents/search", params={"q": "python"})
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "GET /api/v1/documents/search ran 3 queries, over its budget of 2."
+
+
+def test_search_over_budget_is_logged_when_not_enforced(monkeypatch, engine, client, caplog):
+    monkeypatch.setattr(get_settings(), "db_query_budget_enforced", False)
+    search_running(monkeypatch, engine, queries=3)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.query_counter"):
+        response = client.get("/api/v1/documents/search", params={"q": "python"})
+
+    assert response.status_code == 200
+    assert "over its budget of 2" in caplog.text
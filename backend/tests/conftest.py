@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db import SoftDeleteSession
+from app.models import User
+from app.models.base_model import BaseModel
+
+# Tests that need PostgreSQL run against this database and are skipped when it is not set,
+# e.g. TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/test. Its tables are recreated.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.drop_all)
+        await connection.run_sync(BaseModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine, expire_on_commit=False, autoflush=False, sync_session_class=SoftDeleteSession
+    )
+
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def user(session) -> User:
+    user = User(username="ada", email="ada@example.com", password="secret")
+    session.add(user)
+    await session.commit()
+    return user
@@ -0,0 +1,74 @@
+import pytest
+
+from app.core.exceptions.base import ValidationError
+from app.crud import list_document_infos, list_job_application_infos
+from app.crud.pagination import clamp_page_size
+from app.models import Document, JobApplication
+from app.schemas.document_envelope import DocumentListResponse
+from app.schemas.job_application import JobApplicationListResponse
+from app.schemas.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_applications(session, user, count: int) -> list[JobApplication]:
+    # Added in one transaction, so every row shares `created_at` and only the id breaks ties.
+    applications = [JobApplication(user_id=user.id, title=f"Role {index}") for index in range(count)]
+    session.add_all(applications)
+    await session.commit()
+    return applications
+
+
+def test_page_size_is_clamped():
+    assert clamp_page_size(None) == DEFAULT_PAGE_SIZE
+    assert clamp_page_size(0) == 1
+    assert clamp_page_size(MAX_PAGE_SIZE + 1) == MAX_PAGE_SIZE
+
+
+async def test_pages_cover_every_row_once_newest_first(session, user):
+    applications = await create_applications(session, user, 5)
+
+    pages = [await list_job_application_infos(session, user.id, limit=2)]
+    while pages[-1].has_more:
+        pages.append(
+            await list_job_application_infos(session, user.id, cursor=pages[-1].next_cursor, limit=2)
+        )
+
+    assert [len(page.items) for page in pages] == [2, 2, 1]
+    assert pages[-1].next_cursor is None
+    listed = [item.id for page in pages for item in page.items]
+    assert listed == sorted((application.id for application in applications), reverse=True)
+
+
+async def test_listing_is_scoped_to_live_rows_of_the_user(session, user):
+    [kept, deleted] = await create_applications(session, user, 2)
+    deleted.is_deleted = True
+    await session.commit()
+
+    page = await list_job_application_infos(session, user.id)
+
+    assert [item.id for item in page.items] == [kept.id]
+    assert not page.has_more
+
+
+async def test_malformed_cursor_is_rejected(session, user):
+    with pytest.raises(ValidationError):
+        await list_job_application_infos(session, user.id, cursor="not-a-cursor")
+
+
+async def test_list_responses_use_camel_case_items(session, user):
+    await create_applications(session, user, 1)
+    session.add(Document(user_id=user.id, title="Resume"))
+    await session.commit()
+
+    applications = await list_job_application_infos(session, user.id)
+    documents = await list_document_infos(session, user.id)
+
+    [application] = JobApplicationListResponse(
+        job_applications=applications.items, page_info=applications.page_info
+    ).model_dump(mode="json", by_alias=True)["jobApplications"]
+    [document] = DocumentListResponse(documents=documents.items, page_info=documents.page_info).model_dump(
+        mode="json", by_alias=True
+    )["documents"]
+    assert {"id", "userId", "jobTitle"} <= application.keys()
+    assert {"id", "userId", "createdAt", "fileType"} <= document.keys()
@@ -0,0 +1,156 @@
+import uuid
+from collections import Counter
+
+import pytest
+from sqlalchemy import insert, select, update
+
+from app.core.enums import AssistantStepStatus, AssistantStepType
+from app.models import AssistantStep, Document, DocumentJobApplication, JobApplication, User
+from app.services.assistant_runner import AssistantStepRunner, StepContext
+
+pytestmark = pytest.mark.anyio
+
+SYNTHESIS = AssistantStepType.INITIAL_SYNTHESIS
+RESUME = AssistantStepType.TAILORED_RESUME
+
+
+class Handlers:
+    """
+    Step handlers that record their calls and read the resume attached to each application.
+    """
+
+    def __init__(self):
+        self.calls: Counter[AssistantStepType] = Counter()
+        self.resumes: dict[uuid.UUID, uuid.UUID] = {}
+
+    async def synthesis(self, context: StepContext) -> dict:
+        self.calls[SYNTHESIS] += 1
+        document = await context.documents.read(self.resumes[context.job_application_id], ["content"])
+        return {"summary": document["content"].upper()}
+
+    async def resume(self, context: StepContext) -> dict:
+        self.calls[RESUME] += 1
+        return {"resume": context.upstream_results[SYNTHESIS]["summary"].lower()}
+
+    def runner(self, session_factory) -> AssistantStepRunner:
+        return AssistantStepRunner(session_factory, {SYNTHESIS: self.synthesis, RESUME: self.resume})
+
+
+async def create_application(session, handlers: Handlers, user: User, *, title="Engineer", resume="python"):
+    application = JobApplication(user_id=user.id, title=title, company_name="Acme")
+    document = Document(user_id=user.id, title="Resume", content=resume)
+    session.add_all([application, document])
+    await session.flush()
+    await session.execute(
+        insert(DocumentJobApplication).values(document_id=document.id, job_application_id=application.id)
+    )
+    session.add_all(
+        [
+            AssistantStep(job_application_id=application.id, step_name=SYNTHESIS, step_order=1),
+            AssistantStep(job_application_id=application.id, step_name=RESUME, step_order=2),
+        ]
+    )
+    await session.commit()
+    handlers.resumes[application.id] = document.id
+    return application, document
+
+
+async def load_step(session, application: JobApplication, step_name: AssistantStepType) -> AssistantStep:
+    return await session.scalar(
+        select(AssistantStep)
+        .where(AssistantStep.job_application_id == application.id, AssistantStep.step_name == step_name)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def test_runs_steps_in_order(session_factory, session, user):
+    handlers = Handlers()
+    application, _ = await create_application(session, handlers, user)
+
+    statuses = await handlers.runner(session_factory).run(application.id)
+
+    assert set(statuses.values()) == {AssistantStepStatus.COMPLETED}
+    assert (await load_step(session, application, RESUME)).result == {"resume": "python"}
+
+
+async def test_unchanged_documents_are_not_rerun(session_factory, session, user):
+    handlers = Handlers()
+    application, _ = await create_application(session, handlers, user)
+    runner = handlers.runner(session_factory)
+
+    await runner.run(application.id)
+    await runner.run(application.id)
+
+    assert handlers.calls == {SYNTHESIS: 1, RESUME: 1}
+
+
+async def test_edited_document_reruns_reading_step_and_dependents(session_factory, session, user):
+    handlers = Handlers()
+    application, document = await create_application(session, handlers, user)
+    runner = handlers.runner(session_factory)
+    await runner.run(application.id)
+
+    await session.execute(update(Document).where(Document.id == document.id).values(content="rust"))
+    await session.commit()
+    await runner.run(application.id)
+
+    assert handlers.calls == {SYNTHESIS: 2, RESUME: 2}
+    assert (await load_step(session, application, RESUME)).result == {"resume": "rust"}
+
+
+async def test_unread_field_change_does_not_rerun(session_factory, session, user):
+    handlers = Handlers()
+    application, document = await create_application(session, handlers, user)
+    runner = handlers.runner(session_factory)
+    await runner.run(application.id)
+
+    await session.execute(update(Document).where(Document.id == document.id).values(title="CV"))
+    await session.commit()
+    await runner.run(application.id)
+
+    assert handlers.calls == {SYNTHESIS: 1, RESUME: 1}
+
+
+async def test_identical_inputs_reuse_the_users_cached_result(session_factory, session, user):
+    handlers = Handlers()
+    first, _ = await create_application(session, handlers, user)
+    second, second_resume = await create_application(session, handlers, user)
+    runner = handlers.runner(session_factory)
+    await runner.run(first.id)
+
+    await runner.run(second.id)
+
+    assert handlers.calls == {SYNTHESIS: 1, RESUME: 1}
+    step = await load_step(session, second, SYNTHESIS)
+    assert step.result == {"summary": "PYTHON"}
+    # The copied reads point at this application's own resume, so later runs stay incremental.
+    assert set(step.document_reads) == {str(second_resume.id)}
+    await runner.run(second.id)
+    assert handlers.calls == {SYNTHESIS: 1, RESUME: 1}
+
+
+async def test_cached_results_are_not_shared_between_users(session_factory, session, user):
+    handlers = Handlers()
+    other = User(username="grace", email="grace@example.com", password="secret")
+    session.add(other)
+    await session.commit()
+    first, _ = await create_application(session, handlers, user)
+    second, _ = await create_application(session, handlers, other)
+    runner = handlers.runner(session_factory)
+
+    await runner.run(first.id)
+    await runner.run(second.id)
+
+    assert handlers.calls == {SYNTHESIS: 2, RESUME: 2}
+
+
+async def test_application_fields_are_part_of_the_fingerprint(session_factory, session, user):
+    handlers = Handlers()
+    first, _ = await create_application(session, handlers, user, title="Engineer")
+    second, _ = await create_application(session, handlers, user, title="Designer")
+    runner = handlers.runner(session_factory)
+
+    await runner.run(first.id)
+    await runner.run(second.id)
+
+    assert handlers.calls == {SYNTHESIS: 2, RESUME: 2}
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import select
+
+from app.models import DocumentBlob
+from app.services.blob_store import BlobStore
+
+pytestmark = pytest.mark.anyio
+
+CONTENT_HASH = "cd" * 32
+
+
+@pytest.fixture
+def blob_store(tmp_path) -> BlobStore:
+    return BlobStore(tmp_path / "blobs")
+
+
+def stage(blob_store: BlobStore, content=b"resume") -> dict:
+    blob_store.staging_dir.mkdir(parents=True, exist_ok=True)
+    staged = blob_store.staging_dir / f"{len(list(blob_store.staging_dir.iterdir()))}.upload"
+    staged.write_bytes(content)
+    return {staged: (CONTENT_HASH, len(content))}
+
+
+def stored_files(blob_store: BlobStore) -> list:
+    return [path for path in blob_store.root.rglob("*") if path.is_file()]
+
+
+async def test_acquired_blob_is_kept_on_commit(session, blob_store):
+    staged = stage(blob_store)
+
+    paths = await blob_store.acquire(session, staged)
+    await session.commit()
+
+    assert paths[CONTENT_HASH].read_bytes() == b"resume"
+    assert stored_files(blob_store) == [paths[CONTENT_HASH]]
+
+
+async def test_acquired_blob_file_is_removed_on_rollback(session, blob_store):
+    await blob_store.acquire(session, stage(blob_store))
+    await session.rollback()
+
+    assert stored_files(blob_store) == []
+
+
+async def test_second_upload_of_stored_content_reuses_the_blob(session, blob_store):
+    first = await blob_store.acquire(session, stage(blob_store))
+    await session.commit()
+
+    second = await blob_store.acquire(session, stage(blob_store))
+    await session.rollback()
+
+    assert second == first
+    assert stored_files(blob_store) == [first[CONTENT_HASH]]
+
+
+async def test_released_blob_file_is_deleted_only_on_commit(session, blob_store):
+    paths = await blob_store.acquire(session, stage(blob_store))
+    await session.commit()
+
+    await blob_store.release(session, [CONTENT_HASH])
+    await session.rollback()
+    assert paths[CONTENT_HASH].exists()
+    assert await session.scalar(select(DocumentBlob.ref_count)) == 1
+
+    await blob_store.release(session, [CONTENT_HASH])
+    assert paths[CONTENT_HASH].exists()
+    await session.commit()
+    assert stored_files(blob_store) == []
+    assert await session.scalar(select(DocumentBlob.ref_count)) is None
+
+
+async def test_reacquired_content_survives_the_release_of_its_old_blob(session_factory, blob_store):
+    async with session_factory() as session:
+        old = await blob_store.acquire(session, stage(blob_store))
+        await session.commit()
+        await blob_store.release(session, [CONTENT_HASH])
+        await session.commit()
+        new = await blob_store.acquire(session, stage(blob_store))
+        await session.commit()
+
+    assert new[CONTENT_HASH] != old[CONTENT_HASH]
+    assert stored_files(blob_store) == [new[CONTENT_HASH]]
+
+
+async def test_acquired_blob_file_is_removed_when_the_session_closes_uncommitted(session_factory, blob_store):
+    async with session_factory() as session:
+        await blob_store.acquire(session, stage(blob_store))
+
+    assert stored_files(blob_store) == []
@@ -0,0 +1,24 @@
+import pytest
+
+from app.models import Document
+from app.services.document_search import search_documents
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_snippet_escapes_document_markup(session, user):
+    session.add(
+        Document(
+            user_id=user.id,
+            title="Resume",
+            content="Built Kubernetes tooling <script>alert('x')</script> & more",
+        )
+    )
+    await session.commit()
+
+    [result] = await search_documents(session, user.id, "kubernetes")
+
+    assert "<script>" not in result.snippet
+    assert "&lt;script&gt;" in result.snippet
+    assert "&amp; more" in result.snippet
+    assert "<mark>Kubernetes</mark>" in result.snippet
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app.services.embedding_cache import EmbeddingCache
+
+from .test_parse_cache import InMemoryRedis, UnreachableRedis
+
+pytestmark = pytest.mark.anyio
+
+
+class PipelinedRedis(InMemoryRedis):
+    """
+    In-memory Redis that also supports the batched calls the embedding cache makes.
+    """
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return Pipeline(self)
+
+
+class Pipeline:
+    def __init__(self, redis: PipelinedRedis):
+        self.redis = redis
+        self.commands: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+
+    async def execute(self):
+        for key, value, ex in self.commands:
+            await self.redis.set(key, value, ex=ex)
+
+
+def cache(redis=None, dimension=4, **options) -> EmbeddingCache:
+    return EmbeddingCache(redis, model_name="hashing", dimension=dimension, **options)
+
+
+async def test_shares_vectors_between_processes_through_redis():
+    redis = PipelinedRedis()
+    vectors = {"a": np.array([1, 0, 0, 0]), "b": np.array([0, 0.5, 0.5, 0])}
+    await cache(redis).set_many(vectors)
+
+    found = await cache(redis).get_many(["a", "b", "c"])
+
+    assert found.keys() == {"a", "b"}
+    assert found["b"].dtype == np.float32
+    np.testing.assert_allclose(found["b"], vectors["b"])
+
+
+async def test_vectors_of_another_dimension_are_misses():
+    redis = PipelinedRedis()
+    await cache(redis, dimension=4).set_many({"a": np.ones(4)})
+    redis.data[cache(redis, dimension=8).key("a")] = redis.data.pop(cache(redis, dimension=4).key("a"))
+
+    assert await cache(redis, dimension=8).get_many(["a"]) == {}
+
+
+async def test_unreachable_redis_degrades_to_the_local_tier():
+    local = cache(UnreachableRedis())
+
+    await local.set_many({"a": np.ones(4)})
+
+    assert (await local.get_many(["a"])).keys() == {"a"}
+    assert await cache(UnreachableRedis()).get_many(["a"]) == {}
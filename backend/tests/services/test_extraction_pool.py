@@ -0,0 +1,40 @@
+import os
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from app.services.extraction_pool import ExtractionPool
+
+
+def is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_shutdown_kills_a_hung_extraction():
+    pool = ExtractionPool(max_workers=1)
+    executor = pool._get_executor()
+    pid = executor.submit(os.getpid).result(timeout=30)
+    hung = executor.submit(time.sleep, 60)
+    while not hung.running():
+        time.sleep(0.01)
+
+    pool.shutdown()
+
+    assert wait([hung], timeout=10).done == {hung}
+    deadline = time.monotonic() + 10
+    while is_running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not is_running(pid)
+
+
+def test_shut_down_pool_rejects_new_work():
+    pool = ExtractionPool(max_workers=1)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool._get_executor()
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from app.core.exceptions.base import ExternalServiceError, RateLimitExceededError
+from app.services.llm_gateway import CompletionRequest, LLMGateway
+
+pytestmark = pytest.mark.anyio
+
+
+class StubProvider:
+    """
+    An OpenAI-compatible `/completions` endpoint that upper-cases prompts and records each call.
+    """
+
+    def __init__(self, failures: int = 0):
+        self.calls: list[list[str]] = []
+        self.failures = failures
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        prompts = json.loads(request.content)["prompt"]
+        self.calls.append(prompts)
+        await self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        choices = [{"index": index, "text": prompt.upper()} for index, prompt in enumerate(prompts)]
+        return httpx.Response(200, json={"choices": choices})
+
+    def gateway(self, **options) -> LLMGateway:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle), base_url="http://llm")
+        return LLMGateway(client, model="stub", batch_window=0.01, **options)
+
+
+async def test_identical_requests_share_one_provider_call():
+    provider = StubProvider()
+    gateway = provider.gateway()
+
+    results = await asyncio.gather(*(gateway.complete(CompletionRequest("hello")) for _ in range(5)))
+
+    assert results == ["HELLO"] * 5
+    assert provider.calls == [["hello"]]
+    await gateway.aclose()
+
+
+async def test_requests_with_the_same_parameters_are_batched():
+    provider = StubProvider()
+    gateway = provider.gateway()
+
+    results = await asyncio.gather(
+        gateway.complete(CompletionRequest("a")),
+        gateway.complete(CompletionRequest("b")),
+        gateway.complete(CompletionRequest("c", temperature=0.7)),
+    )
+
+    assert results == ["A", "B", "C"]
+    assert sorted(provider.calls) == [["a", "b"], ["c"]]
+    await gateway.aclose()
+
+
+async def test_waiters_take_over_when_the_first_caller_is_cancelled_before_sending():
+    provider = StubProvider()
+    gateway = provider.gateway(user_concurrency=1)
+    user_id = uuid.uuid4()
+    provider.release.clear()
+    # Holds the user's only slot, so the next request of that user waits before being sent.
+    busy = asyncio.create_task(gateway.complete(CompletionRequest("busy"), user_id=user_id))
+    await asyncio.sleep(0.05)
+    first = asyncio.create_task(gateway.complete(CompletionRequest("shared"), user_id=user_id))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(gateway.complete(CompletionRequest("shared"))) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    first.cancel()
+    provider.release.set()
+
+    assert await asyncio.gather(*waiters) == ["SHARED", "SHARED"]
+    assert await busy == "BUSY"
+    assert first.cancelled()
+    assert provider.calls == [["busy"], ["shared"]]
+    await gateway.aclose()
+
+
+async def test_transient_failures_are_retried():
+    provider = StubProvider(failures=1)
+    gateway = provider.gateway(max_retries=1)
+
+    assert await gateway.complete(CompletionRequest("retry")) == "RETRY"
+    assert len(provider.calls) == 2
+    await gateway.aclose()
+
+
+async def test_persistent_failures_raise_external_service_error():
+    provider = StubProvider(failures=3)
+    gateway = provider.gateway(max_retries=1)
+
+    with pytest.raises(ExternalServiceError):
+        await gateway.complete(CompletionRequest("down"))
+    assert len(provider.calls) == 2
+    await gateway.aclose()
+
+
+async def test_bursts_over_the_user_limit_are_rejected():
+    provider = StubProvider()
+    gateway = provider.gateway(user_burst=1)
+    user_id = uuid.uuid4()
+
+    await gateway.complete(CompletionRequest("first"), user_id=user_id)
+    with pytest.raises(RateLimitExceededError):
+        await gateway.complete(CompletionRequest("second"), user_id=user_id)
+    await gateway.aclose()
+
+
+async def test_requests_cancelled_before_sending_give_their_tokens_back():
+    provider = StubProvider()
+    gateway = provider.gateway(user_concurrency=1, user_rate=0, user_burst=2, global_rate=0, global_burst=3)
+    user_id = uuid.uuid4()
+    provider.release.clear()
+    busy = asyncio.create_task(gateway.complete(CompletionRequest("busy"), user_id=user_id))
+    await asyncio.sleep(0.05)
+    first = asyncio.create_task(gateway.complete(CompletionRequest("shared"), user_id=user_id))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(gateway.complete(CompletionRequest("shared")))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    provider.release.set()
+    assert await waiter == "SHARED"
+    assert await busy == "BUSY"
+
+    # One user token and one global token are left: the cancelled request was never charged.
+    assert await gateway.complete(CompletionRequest("again"), user_id=user_id) == "AGAIN"
+    with pytest.raises(RateLimitExceededError):
+        await gateway.complete(CompletionRequest("over"))
+    await gateway.aclose()
@@ -0,0 +1,102 @@
+import pytest
+
+from app.core.enums import DocumentType, SkillProficiency
+from app.schemas.document_content import JobDescription
+from app.schemas.document_content.profile import ProfessionalProfileStructure
+from app.services.match_scoring import (
+    MENTION_WEIGHT,
+    build_job_profile,
+    build_resume_profile,
+    score_match,
+)
+
+
+def resume(skills=(), summary="Backend engineer", bullets=()) -> ProfessionalProfileStructure:
+    return ProfessionalProfileStructure.model_validate(
+        {
+            "contact_info": {"name": "Ada Lovelace", "email": "ada@example.com"},
+            "summary": summary,
+            "skills": [{"title": "Skills", "skills": list(skills)}],
+            "experience": [
+                {
+                    "title": "Experience",
+                    "experiences": [
+                        {
+                            "company_name": "Acme",
+                            "job_title": "Engineer",
+                            "start_date": "2020-01-01",
+                            "end_date": "2024-01-01",
+                            "bullet_points": list(bullets),
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def job(required=(), preferred=()) -> JobDescription:
+    return JobDescription(
+        document_type=DocumentType.JOB_DESCRIPTION,
+        qualifications={"required": list(required), "preferred": list(preferred)},
+    )
+
+
+def test_listed_skill_never_counts_less_than_a_mention():
+    profile = build_resume_profile(
+        resume(
+            skills=[
+                {"name": "Kafka", "proficiency": SkillProficiency.FAMILIAR_WITH, "years_of_experience": 0}
+            ]
+        )
+    )
+
+    assert profile.term_weight("kafka") == MENTION_WEIGHT
+
+
+def test_listed_skill_with_experience_outweighs_a_mention():
+    profile = build_resume_profile(
+        resume(
+            skills=[
+                {"name": "Python", "proficiency": SkillProficiency.EXPERIENCED, "years_of_experience": 6}
+            ],
+            bullets=["Ran Terraform"],
+        )
+    )
+
+    assert profile.term_weight("python") == 1.0
+    assert profile.term_weight("terraform") == MENTION_WEIGHT
+    assert profile.term_weight("rust") == 0.0
+
+
+def test_job_without_requirements_is_fully_covered():
+    score = score_match(build_resume_profile(resume()), build_job_profile(job()))
+
+    assert (score.score, score.required_coverage, score.preferred_coverage) == (1.0, 1.0, 1.0)
+    assert score.gaps == ()
+
+
+def test_required_coverage_outweighs_preferred():
+    profile = build_resume_profile(
+        resume(
+            skills=[{"name": "Python", "proficiency": SkillProficiency.EXPERIENCED, "years_of_experience": 6}]
+        )
+    )
+    meets_required = score_match(profile, build_job_profile(job(required=["Python"], preferred=["Go"])))
+    meets_preferred = score_match(profile, build_job_profile(job(required=["Go"], preferred=["Python"])))
+
+    assert meets_required.score == pytest.approx(0.75)
+    assert meets_preferred.score == pytest.approx(0.25)
+    assert [gap.requirement.text for gap in meets_preferred.gaps] == ["Go"]
+
+
+def test_years_requirement_scales_with_claimed_experience():
+    profile = build_resume_profile(
+        resume(
+            skills=[{"name": "Python", "proficiency": SkillProficiency.EXPERIENCED, "years_of_experience": 2}]
+        )
+    )
+
+    score = score_match(profile, build_job_profile(job(required=["4+ years of Python"])))
+
+    assert score.required_coverage == pytest.approx(0.7 * 2 / 4)
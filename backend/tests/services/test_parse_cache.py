@@ -0,0 +1,115 @@
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.enums import DocumentStatus
+from app.models import Document
+from app.schemas.parse_result import ParseResult
+from app.services.blob_store import find_parsed_content
+from app.services.parse_cache import ParseCache
+from app.services.text_extraction import PARSER_VERSION
+
+pytestmark = pytest.mark.anyio
+
+CONTENT_HASH = "ab" * 32
+
+
+class InMemoryRedis:
+    """
+    The subset of the Redis client the caches use, backed by a dict.
+    """
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+
+class UnreachableRedis:
+    async def get(self, key):
+        raise RedisConnectionError("unreachable")
+
+    async def mget(self, keys):
+        raise RedisConnectionError("unreachable")
+
+    async def set(self, key, value, ex=None):
+        raise RedisConnectionError("unreachable")
+
+    def pipeline(self, transaction=True):
+        raise RedisConnectionError("unreachable")
+
+
+def parse_result(text="Jane Doe", version=PARSER_VERSION) -> ParseResult:
+    return ParseResult(parser_version=version, text=text)
+
+
+async def test_returns_stored_result():
+    cache = ParseCache()
+    assert await cache.get(CONTENT_HASH) is None
+
+    await cache.set(CONTENT_HASH, parse_result())
+
+    assert await cache.get(CONTENT_HASH) == parse_result()
+
+
+async def test_shares_results_between_processes_through_redis():
+    redis = InMemoryRedis()
+    await ParseCache(redis).set(CONTENT_HASH, parse_result())
+
+    assert await ParseCache(redis).get(CONTENT_HASH) == parse_result()
+
+
+async def test_results_of_another_parser_version_are_misses():
+    redis = InMemoryRedis()
+    await ParseCache(redis, parser_version=1).set(CONTENT_HASH, parse_result(version=1))
+
+    assert await ParseCache(redis, parser_version=2).get(CONTENT_HASH) is None
+
+
+async def test_evicts_least_recently_used_entries():
+    cache = ParseCache(max_entries=2)
+    for content_hash in ("a", "b", "c"):
+        await cache.set(content_hash, parse_result(content_hash))
+
+    assert await cache.get("a") is None
+    assert await cache.get("c") == parse_result("c")
+
+
+async def test_unreachable_redis_degrades_to_the_local_tier():
+    cache = ParseCache(UnreachableRedis())
+
+    await cache.set(CONTENT_HASH, parse_result())
+
+    assert await cache.get(CONTENT_HASH) == parse_result()
+    assert await ParseCache(UnreachableRedis()).get(CONTENT_HASH) is None
+
+
+async def test_parsed_content_is_reused_only_from_the_current_parser(session, user):
+    session.add_all(
+        [
+            Document(
+                user_id=user.id,
+                title="Current",
+                content="current text",
+                content_hash="current",
+                status=DocumentStatus.PARSED,
+                parser_version=PARSER_VERSION,
+            ),
+            Document(
+                user_id=user.id,
+                title="Outdated",
+                content="outdated text",
+                content_hash="outdated",
+                status=DocumentStatus.PARSED,
+                parser_version=PARSER_VERSION - 1,
+            ),
+        ]
+    )
+    await session.commit()
+
+    found = await find_parsed_content(session, ["current", "outdated"])
+
+    assert found == {"current": "current text"}
@@ -0,0 +1,86 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.core.enums import PassageKind, VectorSearchMode
+from app.services.embedding_runner import EmbeddingRunner
+from app.services.embeddings import HashingEmbeddingModel
+from app.services.semantic_search import Passage, SemanticIndex
+from app.services.vector_index import APPROXIMATE_MIN_SIZE, VectorIndex
+
+DIMENSION = 16
+APPROXIMATE = VectorSearchMode.APPROXIMATE
+
+
+def random_vectors(count: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((count, DIMENSION)).astype(np.float32)
+
+
+def filled_index(count: int, **options) -> tuple[VectorIndex[int], np.ndarray]:
+    index: VectorIndex[int] = VectorIndex(DIMENSION, **options)
+    vectors = random_vectors(count)
+    index.add(list(range(count)), vectors, [key % 2 for key in range(count)])
+    return index, vectors
+
+
+def test_exact_search_ranks_by_cosine_similarity():
+    index: VectorIndex[str] = VectorIndex(2, dtype=np.float32)
+    index.add(["east", "north", "northeast"], np.array([[1, 0], [0, 1], [1, 1]]))
+
+    matches = index.search(np.array([1.0, 0.2]), k=2)
+
+    assert [key for key, _ in matches] == ["east", "northeast"]
+    assert matches[0][1] == pytest.approx(1 / np.sqrt(1.04))
+
+
+def test_tags_restrict_the_search():
+    index, vectors = filled_index(100)
+
+    matches = index.search(vectors[3], k=5, tags=[0])
+
+    assert matches and all(key % 2 == 0 for key, _ in matches)
+
+
+def test_approximate_search_finds_stored_vectors():
+    index, vectors = filled_index(APPROXIMATE_MIN_SIZE * 2, probes=4)
+
+    found = [index.search(vectors[key], k=1, mode=APPROXIMATE)[0][0] for key in range(0, len(vectors), 97)]
+
+    assert found == list(range(0, len(vectors), 97))
+
+
+def test_vectors_added_after_training_are_searchable():
+    index, _ = filled_index(APPROXIMATE_MIN_SIZE)
+    index.train()
+    [vector] = random_vectors(1, seed=1)
+
+    index.add([-1], vector[None])
+
+    assert index.search(vector, k=1, mode=APPROXIMATE)[0][0] == -1
+
+
+def test_concurrent_searches_train_an_untrained_index_once(monkeypatch):
+    index, vectors = filled_index(APPROXIMATE_MIN_SIZE)
+    trainings = []
+    train = index.train
+    monkeypatch.setattr(index, "train", lambda: trainings.append(train()))
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda key: index.search(vectors[key], k=1, mode=APPROXIMATE), range(32)))
+
+    assert len(trainings) == 1
+    assert [matches[0][0] for matches in results] == list(range(32))
+
+
+@pytest.mark.anyio
+async def test_semantic_index_is_trained_when_built():
+    runner = EmbeddingRunner(HashingEmbeddingModel(DIMENSION))
+    document_id = uuid.uuid4()
+    passages = [Passage(document_id, PassageKind.TEXT, f"passage {n}") for n in range(APPROXIMATE_MIN_SIZE)]
+
+    semantic_index = await SemanticIndex.build(runner, passages)
+    await runner.aclose()
+
+    assert semantic_index.index.is_trained
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.enums import DocumentStatus
+from app.models import Document
+from app.services.parse_cache import ParseCache
+from app.tasks.document_parser import DocumentParserWorker
+
+pytestmark = pytest.mark.anyio
+
+
+def worker(session_factory, **options) -> DocumentParserWorker:
+    return DocumentParserWorker(session_factory, parse_cache=ParseCache(), **options)
+
+
+async def create_documents(session, user, count: int) -> list[Document]:
+    documents = [
+        Document(user_id=user.id, title=f"Document {index}", status=DocumentStatus.UPLOADED)
+        for index in range(count)
+    ]
+    session.add_all(documents)
+    await session.commit()
+    return documents
+
+
+async def load(session, document: Document) -> Document:
+    return await session.scalar(
+        select(Document).where(Document.id == document.id).execution_options(populate_existing=True)
+    )
+
+
+async def age(session, documents: list[Document], seconds: float) -> None:
+    # `updated_at` is refreshed by every write, so age the rows after the fact.
+    await session.execute(
+        update(Document)
+        .where(Document.id.in_([document.id for document in documents]))
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(seconds=seconds))
+    )
+    await session.commit()
+
+
+async def test_concurrent_claims_hand_out_each_document_once(session_factory, session, user):
+    documents = await create_documents(session, user, 10)
+    workers = [worker(session_factory) for _ in range(4)]
+
+    claims = await asyncio.gather(*(each.claim(3) for each in workers))
+
+    claimed = [document.id for claim in claims for document in claim]
+    assert len(claimed) == len(set(claimed)) == 10
+    assert {document.id for document in documents} == set(claimed)
+    for document in documents:
+        loaded = await load(session, document)
+        assert (loaded.status, loaded.parse_attempts) == (DocumentStatus.PROCESSING, 1)
+
+
+async def test_documents_stuck_in_processing_are_requeued(session_factory, session, user):
+    [document] = await create_documents(session, user, 1)
+    await worker(session_factory).claim(1)
+    await age(session, [document], 60)
+
+    reclaimed = await worker(session_factory, stale_after=30).claim(1)
+
+    assert [claim.id for claim in reclaimed] == [document.id]
+    assert (await load(session, document)).parse_attempts == 2
+
+
+async def test_documents_are_marked_error_after_max_claims(session_factory, session, user):
+    [document] = await create_documents(session, user, 1)
+    for _ in range(2):
+        assert await worker(session_factory, stale_after=30, max_claims=2).claim(1)
+        await age(session, [document], 60)
+
+    assert await worker(session_factory, stale_after=30, max_claims=2).claim(1) == []
+
+    assert (await load(session, document)).status == DocumentStatus.ERROR